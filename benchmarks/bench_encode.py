@@ -0,0 +1,68 @@
+# benchmarks/bench_encode.py
+"""
+Card image encoders (size vs. encode time) and the background writer pool.
+
+Usage:
+    python benchmarks/bench_encode.py --tracks 50 --design vaporwave --writer-threads 0 1 2 4
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from common import make_tracks
+
+from src.cards.encoders import EncodeStats, encode_and_write, get_encoder
+from src.cards.generator import generate_and_save_cards_for_playlist, generate_card_back, generate_card_front, track_seed
+from src.config import get_design
+
+
+ENCODERS = [
+    {"format": "png", "compress_level": 1},
+    {"format": "png", "compress_level": 6},
+    {"format": "png", "compress_level": 9},
+    {"format": "png", "optimize": True},
+    {"format": "webp", "quality": 0},
+    {"format": "webp", "quality": 80},
+    {"format": "jpeg", "quality": 95},
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=50, help="Number of synthetic tracks")
+    parser.add_argument("--design", type=str, default="simple", help="Card design")
+    parser.add_argument("--writer-threads", type=int, nargs="+", default=[0, 1, 2, 4], help="Writer thread counts to compare")
+    args = parser.parse_args()
+
+    tracks = make_tracks(args.tracks)
+    design = get_design(args.design)
+
+    # render once, then encode the same images with every encoder
+    images = []
+    for track in tracks:
+        images.append(generate_card_front(track, design, rng=random.Random(track_seed(track, "front"))))
+        images.append(generate_card_back(track, design, rng=random.Random(track_seed(track, "back"))))
+
+    print(f"{'encoder':<42} {'KB/file':>8} {'ms/file':>8}")
+    for settings in ENCODERS:
+        encoder = get_encoder(**settings)
+        stats = EncodeStats()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i, img in enumerate(images):
+                stats.add(encode_and_write(img, Path(tmp_dir) / f"{i}.{encoder.extension}", encoder))
+        print(f"{encoder.label:<42} {stats.bytes / stats.files / 1024:>8.0f} {stats.encode_seconds / stats.files * 1000:>8.1f}")
+
+    print()
+    print(f"{'writer threads':>14} {'seconds':>9} {'cards/s':>9}")
+    for threads in args.writer_threads:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            generate_and_save_cards_for_playlist(tracks, Path(tmp_dir), design, writer_threads=threads)
+            elapsed = time.perf_counter() - start
+        print(f"{threads:>14} {elapsed:>9.2f} {len(tracks) / elapsed:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_pdf.py
+"""
+Printable PDF export: peak memory and seconds per sheet, single file vs. chunked volumes.
+Each configuration runs in a fresh process so peak memory is measured separately.
+
+Usage:
+    python benchmarks/bench_pdf.py --tracks 1000 --modes vector raster --volume-sheets 10 --jobs 1 4
+"""
+import argparse
+import json
+import math
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import make_tracks
+
+from src.cards.generator import calculate_a4_layout, generate_and_save_cards_for_playlist
+from src.cards.pdf_export import export_printable_pdf
+from src.config import get_design
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process and its (finished) children, in MB."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024  # Linux reports KB
+
+
+def run_child(args):
+    """Export one configuration and print its measurements as JSON."""
+    tracks = make_tracks(args.tracks)
+    output_path = Path(args.output_dir) / "printable_cards.pdf"
+    start = time.perf_counter()
+    paths = export_printable_pdf(
+        tracks, output_path, mode=args.mode, cards_dir=Path(args.cards_dir), design=get_design(args.design),
+        sheets_per_volume=args.volume_sheets or None, jobs=args.jobs[0],
+    )
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "seconds": elapsed,
+        "files": len(paths),
+        "bytes": sum(path.stat().st_size for path in paths),
+        "peak_mb": peak_rss_mb(),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=200, help="Number of synthetic tracks")
+    parser.add_argument("--design", type=str, default="simple", help="Card design")
+    parser.add_argument("--modes", nargs="+", default=["vector", "raster"], help="PDF modes to compare")
+    parser.add_argument("--volume-sheets", type=int, default=5, help="Sheets per volume for the chunked runs")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2], help="Process counts for the chunked runs")
+    # internal: run a single configuration
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--cards-dir", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--output-dir", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    layout = calculate_a4_layout()
+    num_sheets = math.ceil(args.tracks / (layout["grid"]["rows"] * layout["grid"]["cols"]))
+
+    with tempfile.TemporaryDirectory() as cards_dir:
+        if "raster" in args.modes:
+            print(f"Rendering {args.tracks} cards for the raster export...")
+            generate_and_save_cards_for_playlist(make_tracks(args.tracks), Path(cards_dir), get_design(args.design))
+
+        print(f"\n{'mode':<7} {'volumes':>8} {'jobs':>5} {'seconds':>9} {'s/sheet':>8} {'peak MB':>8} {'MB out':>7}")
+        for mode in args.modes:
+            configs = [(0, 1)] + [(args.volume_sheets, jobs) for jobs in args.jobs]
+            for volume_sheets, jobs in configs:
+                with tempfile.TemporaryDirectory() as output_dir:
+                    result = subprocess.run(
+                        [
+                            sys.executable, __file__, "--child", "--mode", mode, "--tracks", str(args.tracks),
+                            "--design", args.design, "--cards-dir", cards_dir, "--output-dir", output_dir,
+                            "--volume-sheets", str(volume_sheets), "--jobs", str(jobs),
+                        ],
+                        capture_output=True, text=True, check=True,
+                    )
+                stats = json.loads(result.stdout.strip().splitlines()[-1])
+                print(
+                    f"{mode:<7} {stats['files']:>8} {jobs:>5} {stats['seconds']:>9.2f} "
+                    f"{stats['seconds'] / num_sheets:>8.3f} {stats['peak_mb']:>8.0f} {stats['bytes'] / 1024 / 1024:>7.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_qr.py
+"""
+QR code rasterization: module-matrix fast path vs. the previous PIL image factory path.
+
+Usage:
+    python benchmarks/bench_qr.py --count 500 --size 400
+"""
+import argparse
+import time
+
+import numpy as np
+import qrcode
+from PIL import Image
+from qrcode.constants import ERROR_CORRECT_H
+
+from common import make_tracks
+
+from src.cards.generator import _scale_qr_matrix, generate_qr_code, paste_qr_code, qr_code_matrix
+
+
+def generate_qr_code_reference(data: str, size: int = 300, border: int = 4,
+                               error_correction=ERROR_CORRECT_H) -> Image.Image:
+    """Previous implementation: draw at box_size=10, convert to RGBA, resize with NEAREST."""
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=error_correction,
+        box_size=10,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white").convert("RGBA")
+    return img.resize((size, size), Image.NEAREST)
+
+
+def _time(label: str, func, uris: list[str], baseline: float | None = None) -> float:
+    start = time.perf_counter()
+    for uri in uris:
+        func(uri)
+    elapsed = time.perf_counter() - start
+    per_code_ms = 1000 * elapsed / len(uris)
+    speedup = f"{baseline / elapsed:.2f}x" if baseline else "1.00x"
+    print(f"{label:<28} {per_code_ms:>8.3f} ms/code {speedup:>8}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=300, help="Number of QR codes")
+    parser.add_argument("--size", type=int, default=400, help="QR code size (pixels)")
+    args = parser.parse_args()
+
+    uris = [track["spotify_uri"] for track in make_tracks(args.count)]
+    size = args.size
+
+    # correctness: the fast path must be pixel-identical
+    for uri in uris[:50]:
+        reference = np.asarray(generate_qr_code_reference(uri, size=size, border=0))
+        fast = np.asarray(generate_qr_code(uri, size=size, border=0))
+        assert np.array_equal(reference, fast), f"QR mismatch for {uri}"
+    print(f"Pixel-identical for {min(50, len(uris))} codes at {size}px\n")
+
+    canvas = Image.new("RGBA", (size * 2, size * 2), "black")
+    print("End to end (QR encoding + rasterization):")
+    baseline = _time("reference (PIL factory)", lambda uri: generate_qr_code_reference(uri, size, 0), uris)
+    _time("generate_qr_code", lambda uri: generate_qr_code(uri, size, 0), uris, baseline)
+    _time("paste_qr_code (in place)", lambda uri: paste_qr_code(canvas, uri, (10, 10), size, 0), uris, baseline)
+
+    # rasterization only: encode every code once up front
+    codes = {}
+    for uri in uris:
+        qr = qrcode.QRCode(version=None, error_correction=ERROR_CORRECT_H, box_size=10, border=0)
+        qr.add_data(uri)
+        qr.make(fit=True)
+        codes[uri] = (qr, qr_code_matrix(uri, border=0))
+
+    def reference_raster(uri):
+        qr = codes[uri][0]
+        img = qr.make_image(fill_color="black", back_color="white").convert("RGBA")
+        return img.resize((size, size), Image.NEAREST)
+
+    def fast_raster(uri):
+        modules = _scale_qr_matrix(codes[uri][1], size)
+        return Image.fromarray((1 - modules) * 255, "L").convert("RGBA")
+
+    print("\nRasterization only:")
+    baseline = _time("reference (PIL factory)", reference_raster, uris)
+    _time("module matrix", fast_raster, uris, baseline)
+
+if __name__ == "__main__":
+    main()
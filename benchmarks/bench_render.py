@@ -0,0 +1,45 @@
+# benchmarks/bench_render.py
+"""
+Card rendering throughput for 1..N render processes.
+
+Usage:
+    python benchmarks/bench_render.py --tracks 200 --design vaporwave --jobs 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from common import make_tracks
+
+from src.cards.generator import generate_and_save_cards_for_playlist
+from src.config import get_design
+
+
+def main():
+    default_jobs = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=100, help="Number of synthetic tracks")
+    parser.add_argument("--design", type=str, default="simple", help="Card design")
+    parser.add_argument("--jobs", type=int, nargs="+", default=default_jobs, help="Process counts to compare")
+    args = parser.parse_args()
+
+    tracks = make_tracks(args.tracks)
+    design = get_design(args.design)
+
+    print(f"{'jobs':>5} {'seconds':>9} {'cards/s':>9} {'speedup':>8}")
+    baseline = None
+    for jobs in args.jobs:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            start = time.perf_counter()
+            generate_and_save_cards_for_playlist(tracks, Path(tmp_dir), design, jobs=jobs)
+            elapsed = time.perf_counter() - start
+
+        cards_per_second = len(tracks) / elapsed
+        baseline = baseline or cards_per_second
+        print(f"{jobs:>5} {elapsed:>9.2f} {cards_per_second:>9.1f} {cards_per_second / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# benchmarks/common.py
+import random
+import string
+import sys
+from pathlib import Path
+
+# Add project root to path to import the src package
+_project_root = Path(__file__).parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+
+WORDS = [
+    "Love", "Night", "Dancing", "In", "The", "Moonlight", "Forever", "Young",
+    "Blue", "Sky", "Heart", "Of", "Gold", "Summer", "Rain", "Dreams",
+]
+ARTISTS = ["ABBA", "Queen", "The Rolling Stones", "Earth, Wind & Fire", "Daft Punk", "Fleetwood Mac"]
+
+
+def make_tracks(num_tracks: int, seed: int = 0) -> list[dict]:
+    """
+    Create synthetic cleaned track metadata for benchmarks.
+    Args:
+        num_tracks (int): Number of tracks
+        seed (int): Random seed
+    Returns:
+        list[dict]: Track metadata dictionaries as produced by clean_track_metadata
+    """
+    rng = random.Random(seed)
+    tracks = []
+    for i in range(num_tracks):
+        track_id = "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(22))
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+        artists = ", ".join(rng.sample(ARTISTS, rng.randint(1, 3)))
+        tracks.append({
+            "name_original": name,
+            "name_cleaned": f"{name} {i}",
+            "artists": artists,
+            "album": "Benchmark",
+            "release_year": rng.randint(1960, 2024),
+            "spotify_uri": f"spotify:track:{track_id}",
+        })
+    return tracks
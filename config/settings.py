@@ -14,4 +14,25 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 ASSETS_DIR = BASE_DIR / "assets"
 
 # Config directory
-CONFIG_DIR = BASE_DIR / "config"
\ No newline at end of file
+CONFIG_DIR = BASE_DIR / "config"
+
+# Printed card size and default render size (800 px ~ 388 DPI at 52.4 mm)
+CARD_SIZE_MM = 52.4
+CARD_SIZE_PX = 800
+
+# Playlist metadata storage: "json" (metadata.json only) or "sqlite"
+# (metadata.json plus an indexed metadata.sqlite3 that is read instead)
+METADATA_BACKEND = "sqlite"
+
+# Library catalog of all playlists (tracks deduplicated by Spotify URI)
+LIBRARY_CATALOG_PATH = DATA_DIR / "library.sqlite3"
+
+# Content-addressed store of rendered card images, shared by all playlist folders
+CARD_STORE_DIR = DATA_DIR / "card_store"
+
+# Cache directory (persistent lookup caches)
+CACHE_DIR = DATA_DIR / "cache"
+
+# Earliest-release lookup cache
+RELEASE_CACHE_PATH = CACHE_DIR / "releases.sqlite3"
+RELEASE_CACHE_TTL_DAYS = 90
@@ -0,0 +1,150 @@
+# src/cards/assets.py
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+from PIL import Image
+
+
+# memory budget for decoded images (bytes)
+ASSET_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _image_nbytes(img: Image.Image) -> int:
+    """Approximate memory used by a decoded image."""
+    return img.width * img.height * len(img.getbands())
+
+
+class AssetCache:
+    """
+    LRU cache of decoded design assets.
+
+    Images are stored decoded, converted and resized, keyed by
+    (path, target size, mode), together with images derived from them such
+    as pre-rendered card layers, and evicted least recently used first once the
+    memory budget is exceeded. Directory listings are cached as well.
+    Cached images are shared between cards and must be treated as read-only.
+    """
+    def __init__(self, max_bytes: int = ASSET_CACHE_MAX_BYTES):
+        """
+        Initialize an empty cache.
+        Args:
+            max_bytes (int): Memory budget for decoded images
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._images: OrderedDict[tuple, Image.Image] = OrderedDict()
+        self._nbytes = 0
+        self._listings: dict[str, list[Path] | None] = {}
+        self._lock = threading.Lock()
+
+    def get_image(self, path: Path, size: tuple[int, int], mode: str = "RGBA") -> Image.Image:
+        """
+        Get a decoded image, converted to `mode` and resized to `size`.
+        Args:
+            path (Path): Image file path
+            size (tuple[int, int]): Target (width, height)
+            mode (str): Target Pillow image mode
+        Returns:
+            Image.Image: Cached image (read-only)
+        Raises:
+            OSError: If the image cannot be opened or decoded
+        """
+        def load() -> Image.Image:
+            with Image.open(path) as src:
+                img = src.convert(mode)
+            if img.size != tuple(size):
+                img = img.resize(size)
+            return img
+
+        return self.get_or_create((str(path), tuple(size), mode), load)
+
+    def get_or_create(self, key: tuple, factory: Callable[[], Image.Image]) -> Image.Image:
+        """
+        Get a cached image by key, creating it with `factory` on a miss.
+        Used for decoded assets as well as images derived from them (e.g. pre-rendered layers).
+        Args:
+            key (tuple): Hashable cache key
+            factory (Callable[[], Image.Image]): Creates the image on a miss
+        Returns:
+            Image.Image: Cached image (read-only)
+        """
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return img
+            self.misses += 1
+
+        img = factory()
+
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = img
+                self._nbytes += _image_nbytes(img)
+                self._evict()
+        return img
+
+    def _evict(self) -> None:
+        # keep at least the most recent image, even if it exceeds the budget on its own
+        while self._nbytes > self.max_bytes and len(self._images) > 1:
+            _, old = self._images.popitem(last=False)
+            self._nbytes -= _image_nbytes(old)
+
+    def list_dir(self, path: Path) -> list[Path] | None:
+        """
+        Get the sorted files of an asset directory.
+        Args:
+            path (Path): Asset path
+        Returns:
+            list[Path] | None: Sorted directory entries, or None if `path` is not a directory
+        """
+        key = str(path)
+        with self._lock:
+            if key in self._listings:
+                return self._listings[key]
+
+        files = sorted(path.glob("*")) if path.is_dir() else None
+
+        with self._lock:
+            self._listings[key] = files
+        return files
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+        Returns:
+            dict: {hits, misses, images, bytes, max_bytes}
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "images": len(self._images),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        """
+        Drop all cached images and directory listings.
+        """
+        with self._lock:
+            self._images.clear()
+            self._listings.clear()
+            self._nbytes = 0
+
+
+_asset_cache = AssetCache()
+
+
+def get_asset_cache() -> AssetCache:
+    """
+    Return the process-wide asset cache.
+    Returns:
+        AssetCache: Shared cache instance
+    """
+    return _asset_cache
@@ -0,0 +1,173 @@
+# src/cards/atlas.py
+import json
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from .card_index import CardIndex
+from .encoders import CardEncoder, encode_and_write, get_encoder
+from .manifest import CARD_SIDES
+
+
+ATLAS_DIRNAME = "atlas"
+ATLAS_INDEX_FILENAME = "atlas.json"
+ATLAS_VERSION = 1
+
+# the game's card display size, so loading from the atlas does not lower the resolution
+DEFAULT_TILE_SIZE = 400
+# 4096 px pages hold 100 tiles of 400 px (48 MB decoded)
+ATLAS_MAX_PAGE_SIZE = 4096
+
+
+def atlas_dir(cards_dir: Path) -> Path:
+    """Directory of a playlist's card atlas."""
+    return cards_dir / ATLAS_DIRNAME
+
+
+def _load_tile(card_index: CardIndex, uri: str, side: str, tile_size: int) -> Image.Image | None:
+    """Load one card side at tile size, preferring a saved thumbnail of that size."""
+    path = card_index.path(uri, side, size=tile_size) or card_index.path(uri, side)
+    if path is None:
+        return None
+    try:
+        img = Image.open(path)
+    except FileNotFoundError:
+        # thumbnail missing: fall back to the full-size card
+        img = Image.open(card_index.path(uri, side))
+    with img:
+        # JPEG files decode directly at a reduced scale
+        img.draft("RGB", (tile_size, tile_size))
+        tile = img.convert("RGB")
+    if tile.size != (tile_size, tile_size):
+        tile = tile.resize((tile_size, tile_size), Image.LANCZOS)
+    return tile
+
+
+def build_card_atlas(
+        tracks: list[dict], cards_dir: Path, tile_size: int = DEFAULT_TILE_SIZE,
+        max_page_size: int = ATLAS_MAX_PAGE_SIZE, encoder: CardEncoder | None = None
+        ) -> Path:
+    """
+    Pack the card images of a playlist into a few atlas pages plus an index.
+
+    Tiles are placed in a grid, front and back of a track next to each other.
+    The index (atlas.json) maps track URI and side to (page, x, y, size), so the
+    game reads the index and the pages it needs instead of one file per card side.
+
+    Args:
+        tracks (list[dict]): Track metadata dictionaries
+        cards_dir (Path): Directory of the card images
+        tile_size (int): Size of one card side in the atlas (pixels)
+        max_page_size (int): Maximum width/height of an atlas page (pixels)
+        encoder (CardEncoder | None): Page image encoder (None = JPEG, quality 90)
+    Returns:
+        Path: Path of the atlas index
+    """
+    encoder = encoder or get_encoder("jpeg", quality=90)
+    output_dir = atlas_dir(cards_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    columns = max(1, max_page_size // tile_size)
+    tiles_per_page = columns * columns
+    tiles = [(track, side) for track in tracks for side in CARD_SIDES]
+    card_index = CardIndex.load(cards_dir, tracks)
+
+    pages = []
+    cards: dict[str, dict] = {}
+    missing = 0
+    for page_start in range(0, len(tiles), tiles_per_page):
+        page_tiles = tiles[page_start:page_start + tiles_per_page]
+        rows = -(-len(page_tiles) // columns)
+        page_index = len(pages)
+        page = Image.new("RGB", (min(len(page_tiles), columns) * tile_size, rows * tile_size))
+
+        for i, (track, side) in enumerate(page_tiles):
+            tile = _load_tile(card_index, track["spotify_uri"], side, tile_size)
+            if tile is None:
+                missing += 1
+                continue
+            x, y = (i % columns) * tile_size, (i // columns) * tile_size
+            page.paste(tile, (x, y))
+            cards.setdefault(track["spotify_uri"], {})[side] = [page_index, x, y]
+
+        filename = f"atlas_{page_index:03d}.{encoder.extension}"
+        encode_and_write(page, output_dir / filename, encoder)
+        pages.append({"file": filename, "width": page.width, "height": page.height})
+
+    # remove pages of a previous, larger build
+    page_files = {page["file"] for page in pages}
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("atlas_") and entry.name not in page_files:
+                os.unlink(entry.path)
+
+    index_path = output_dir / ATLAS_INDEX_FILENAME
+    tmp_path = index_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": ATLAS_VERSION, "tile_size": tile_size, "image_format": dict(encoder.settings),
+            "pages": pages, "cards": cards,
+        }, f)
+    os.replace(tmp_path, index_path)
+
+    if missing:
+        print(f"Warning: {missing} card images not found, left out of the atlas.")
+    print(f"Packed {len(tiles) - missing} card sides into {len(pages)} atlas pages ({tile_size}px tiles).")
+    return index_path
+
+
+class CardAtlas:
+    """
+    Read access to a playlist's card atlas index.
+    Decoding pages is left to the reader (the game keeps a bounded number of them).
+    """
+    def __init__(self, directory: Path, index: dict):
+        """
+        Args:
+            directory (Path): Atlas directory
+            index (dict): Parsed atlas index
+        """
+        self.directory = directory
+        self.tile_size: int = index["tile_size"]
+        self.image_format: dict | None = index.get("image_format")
+        self.pages: list[dict] = index["pages"]
+        self.cards: dict[str, dict] = index["cards"]
+
+    @classmethod
+    def load(cls, cards_dir: Path) -> "CardAtlas | None":
+        """
+        Load the atlas index of a cards directory.
+        Args:
+            cards_dir (Path): Directory of the card images
+        Returns:
+            CardAtlas | None: The atlas, or None if none was built (or it is outdated)
+        """
+        directory = atlas_dir(cards_dir)
+        try:
+            with open(directory / ATLAS_INDEX_FILENAME, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if index.get("version") != ATLAS_VERSION:
+            return None
+        return cls(directory, index)
+
+    def rect(self, uri: str, side: str) -> tuple[int, int, int, int] | None:
+        """
+        Location of a card side.
+        Args:
+            uri (str): Spotify track URI
+            side (str): "front" or "back"
+        Returns:
+            tuple[int, int, int, int] | None: (page, x, y, size), or None if not in the atlas
+        """
+        location = self.cards.get(uri, {}).get(side)
+        if location is None:
+            return None
+        page, x, y = location
+        return page, x, y, self.tile_size
+
+    def page_path(self, page: int) -> Path:
+        """File path of an atlas page."""
+        return self.directory / self.pages[page]["file"]
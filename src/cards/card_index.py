@@ -0,0 +1,194 @@
+# src/cards/card_index.py
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from ..core.utils import sanitize_name
+from .encoders import CARD_IMAGE_EXTENSIONS
+from .manifest import MANIFEST_FILENAME
+
+
+CARD_INDEX_FILENAME = ".card_index.json"
+CARD_INDEX_VERSION = 2
+
+_CARD_FILE_PATTERN = re.compile(
+    r"^(?P<base>.+)_(?P<side>front|back)\.(?P<extension>" + "|".join(CARD_IMAGE_EXTENSIONS) + r")$"
+)
+# filename base of a Spotify track: "<year>_<title>_<track id>"
+_TRACK_ID_PATTERN = re.compile(r"_(?P<id>[0-9A-Za-z]{22})$")
+_THUMBNAIL_DIR_PATTERN = re.compile(r"^(?P<size>\d+)px$")
+
+
+def track_id(uri: str) -> str:
+    """
+    ID part of a card filename: the Spotify ID of a track URI ("spotify:track:<id>"),
+    or a hash of any other URI (local files, episodes), which may contain characters unsafe for paths.
+    """
+    prefix, _, spotify_id = uri.rpartition(":")
+    if prefix == "spotify:track" and spotify_id.isascii() and spotify_id.isalnum():
+        return spotify_id
+    return hashlib.sha1(uri.encode("utf-8")).hexdigest()[:16]
+
+
+def get_card_filename(track: dict) -> str:
+    """
+    Generate standardized filename base card image.
+    Readable year and title, made unique by the track's Spotify ID.
+
+    Args:
+        track (dict): Track metadata dictionary
+    Returns:
+        str: Filename base for card image
+    """
+    title = sanitize_name(f"{track['release_year']}_{track['name_cleaned']}").replace(" ", "_")
+    return f"{title}_{track_id(track['spotify_uri'])}"
+
+
+def _known_filenames(cards_dir: Path, tracks: list[dict] | None) -> dict[str, str]:
+    """Filename base -> track URI, from the playlist's card manifest and the given tracks."""
+    known = {}
+    try:
+        with open(cards_dir.parent / MANIFEST_FILENAME, "r", encoding="utf-8") as f:
+            entries = json.load(f).get("cards", {})
+        known.update((entry["filename"], uri) for uri, entry in entries.items() if "filename" in entry)
+    except (OSError, ValueError, AttributeError):
+        pass
+    for track in tracks or ():
+        known[get_card_filename(track)] = track["spotify_uri"]
+    return known
+
+
+class CardIndex:
+    """
+    In-memory map of a cards folder: track URI and side -> image file.
+
+    Built with a single directory scan and persisted as `.card_index.json` in the
+    cards folder, together with the folder's modification time; the file is only
+    trusted while the folder is unchanged, otherwise it is rebuilt.
+    Files are matched to tracks by the filenames recorded in the playlist's card manifest
+    and those of the given tracks; other files fall back to the Spotify ID in their name.
+    Thumbnails share the filename of their card in `<size>px/` folders.
+    """
+    def __init__(self, cards_dir: Path, cards: dict[str, dict[str, str]], thumbnail_sizes: list[int]):
+        """
+        Args:
+            cards_dir (Path): Directory of the card images
+            cards (dict[str, dict[str, str]]): Track URI -> side -> filename
+            thumbnail_sizes (list[int]): Sizes of the thumbnail folders
+        """
+        self.cards_dir = cards_dir
+        self.cards = cards
+        self.thumbnail_sizes = thumbnail_sizes
+
+    @classmethod
+    def scan(cls, cards_dir: Path, tracks: list[dict] | None = None) -> "CardIndex":
+        """
+        Index a cards folder with one directory scan.
+        Args:
+            cards_dir (Path): Directory of the card images
+            tracks (list[dict] | None): Tracks whose card filenames are known besides the manifest's
+        Returns:
+            CardIndex: The index (empty if the folder does not exist)
+        """
+        cards: dict[str, dict[str, str]] = {}
+        thumbnail_sizes = []
+        known = _known_filenames(cards_dir, tracks)
+        try:
+            with os.scandir(cards_dir) as entries:
+                for entry in entries:
+                    match = _CARD_FILE_PATTERN.match(entry.name)
+                    if match:
+                        uri = known.get(match["base"])
+                        if uri is None:
+                            id_match = _TRACK_ID_PATTERN.search(match["base"])
+                            if id_match is None:
+                                continue
+                            uri = f"spotify:track:{id_match['id']}"
+                        cards.setdefault(uri, {})[match["side"]] = entry.name
+                    elif entry.is_dir() and _THUMBNAIL_DIR_PATTERN.match(entry.name):
+                        thumbnail_sizes.append(int(entry.name[:-2]))
+        except FileNotFoundError:
+            pass
+        return cls(cards_dir, cards, sorted(thumbnail_sizes))
+
+    @classmethod
+    def load(cls, cards_dir: Path, tracks: list[dict] | None = None) -> "CardIndex":
+        """
+        Load the persisted index of a cards folder, or rebuild and save it if the folder changed
+        (or if it misses one of the given tracks, whose filenames may not have been known).
+        Args:
+            cards_dir (Path): Directory of the card images
+            tracks (list[dict] | None): Tracks that are looked up in the index
+        Returns:
+            CardIndex: The index
+        """
+        try:
+            dir_mtime = cards_dir.stat().st_mtime_ns
+            with open(cards_dir / CARD_INDEX_FILENAME, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CARD_INDEX_VERSION and data.get("dir_mtime_ns") == dir_mtime:
+                index = cls(cards_dir, data["cards"], data["thumbnail_sizes"])
+                if not index.missing(tracks or []):
+                    return index
+        except (OSError, ValueError, KeyError):
+            pass
+
+        index = cls.scan(cards_dir, tracks)
+        if cards_dir.is_dir():
+            try:
+                index.save()
+            except OSError:
+                # read-only folder: keep using the scan
+                pass
+        return index
+
+    def save(self) -> None:
+        """
+        Persist the index with the current modification time of the cards folder.
+        """
+        path = self.cards_dir / CARD_INDEX_FILENAME
+        # create the file first, rewriting it in place leaves the folder's modification time as is
+        path.touch()
+        data = {
+            "version": CARD_INDEX_VERSION,
+            "dir_mtime_ns": self.cards_dir.stat().st_mtime_ns,
+            "thumbnail_sizes": self.thumbnail_sizes,
+            "cards": self.cards,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def path(self, uri: str, side: str, size: int | None = None) -> Path | None:
+        """
+        Image file of a card side.
+        Args:
+            uri (str): Spotify track URI
+            side (str): "front" or "back"
+            size (int | None): Thumbnail size (None = full-size card)
+        Returns:
+            Path | None: Path of the image, or None if the card (or thumbnail folder) does not exist
+        """
+        filename = self.cards.get(uri, {}).get(side)
+        if filename is None:
+            return None
+        if size is None:
+            return self.cards_dir / filename
+        if size not in self.thumbnail_sizes:
+            return None
+        return self.cards_dir / f"{size}px" / filename
+
+    def has_card(self, uri: str) -> bool:
+        """True if both sides of a track's card exist."""
+        return len(self.cards.get(uri, ())) == 2
+
+    def missing(self, tracks: list[dict]) -> list[dict]:
+        """
+        Tracks with a missing card side.
+        Args:
+            tracks (list[dict]): Track metadata dictionaries
+        Returns:
+            list[dict]: Tracks without a complete card
+        """
+        return [track for track in tracks if not self.has_card(track["spotify_uri"])]
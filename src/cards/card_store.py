@@ -0,0 +1,191 @@
+# src/cards/card_store.py
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+from ..config import CARD_STORE_DIR
+from .manifest import CARD_SIDES, MANIFEST_FILENAME
+
+
+class CardStore:
+    """
+    Content-addressed store of rendered card images, shared by all playlist folders.
+
+    Each card side is stored once under its content hash (CardManifest.side_hash: track fields,
+    design, asset modification times, seed and image format), with its thumbnails next to it:
+    `<root>/<key[:2]>/<key>.<extension>` and `<key>_<size>px.<extension>`.
+    Playlist folders hard-link the files, so the link count of a blob tells whether a
+    playlist still uses it; on file systems without hard links, files are copied, and
+    only the card manifests of the playlist folders tell which blobs are still used
+    (see referenced_keys).
+    """
+    def __init__(self, root: Path = CARD_STORE_DIR):
+        """
+        Args:
+            root (Path): Directory of the store
+        """
+        self.root = Path(root)
+
+    def blob_path(self, key: str, extension: str, size: int | None = None) -> Path:
+        """
+        Path of a stored image.
+        Args:
+            key (str): Content hash of the card side
+            extension (str): Image file extension
+            size (int | None): Thumbnail size (None = full-size card)
+        Returns:
+            Path: Path inside the store (may not exist)
+        """
+        name = f"{key}_{size}px" if size else key
+        return self.root / key[:2] / f"{name}.{extension}"
+
+    def has(self, key: str, extension: str, thumbnail_sizes: tuple[int, ...] = ()) -> bool:
+        """True if the card side and all requested thumbnails are stored."""
+        return all(self.blob_path(key, extension, size).exists() for size in (None, *thumbnail_sizes))
+
+    def link(
+            self, key: str, extension: str, cards_dir: Path, filename: str, thumbnail_sizes: tuple[int, ...] = ()
+            ) -> Path | None:
+        """
+        Place a stored card side (and its thumbnails) into a cards folder.
+        Args:
+            key (str): Content hash of the card side
+            extension (str): Image file extension
+            cards_dir (Path): Cards folder of the playlist
+            filename (str): Filename without extension
+            thumbnail_sizes (tuple[int, ...]): Thumbnail sizes to place in `<size>px/` folders
+        Returns:
+            Path | None: Path of the full-size image in the cards folder, or None if the side is not stored
+        """
+        if not self.has(key, extension, thumbnail_sizes):
+            return None
+        for size in (None, *thumbnail_sizes):
+            directory = cards_dir / f"{size}px" if size else cards_dir
+            directory.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(self.blob_path(key, extension, size), directory / f"{filename}.{extension}")
+        return cards_dir / f"{filename}.{extension}"
+
+    def add(
+            self, key: str, extension: str, cards_dir: Path, filename: str, thumbnail_sizes: tuple[int, ...] = ()
+            ) -> None:
+        """
+        Store a card side that was saved to a cards folder (sizes already stored are skipped).
+        Args:
+            key (str): Content hash of the card side
+            extension (str): Image file extension
+            cards_dir (Path): Cards folder of the playlist
+            filename (str): Filename without extension
+            thumbnail_sizes (tuple[int, ...]): Thumbnail sizes saved in `<size>px/` folders
+        """
+        for size in (None, *thumbnail_sizes):
+            blob = self.blob_path(key, extension, size)
+            if blob.exists():
+                continue
+            source = (cards_dir / f"{size}px" if size else cards_dir) / f"{filename}.{extension}"
+            if not source.exists():
+                continue
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(source, blob)
+
+    def _iter_blobs(self):
+        if not self.root.is_dir():
+            return
+        with os.scandir(self.root) as prefixes:
+            for prefix in prefixes:
+                if not prefix.is_dir():
+                    continue
+                with os.scandir(prefix.path) as entries:
+                    for entry in entries:
+                        if entry.is_file() and not entry.name.endswith(".tmp"):
+                            yield entry
+
+    def _is_referenced(self, entry: os.DirEntry, referenced_keys: set[str]) -> bool:
+        # blob names start with the key: "<key>.<extension>" or "<key>_<size>px.<extension>"
+        return entry.stat().st_nlink > 1 or entry.name.split(".", 1)[0].split("_", 1)[0] in referenced_keys
+
+    def stats(self, referenced_keys: set[str] = frozenset()) -> dict:
+        """
+        Get store statistics.
+        Args:
+            referenced_keys (set[str]): Keys recorded by playlist folders, see referenced_keys
+        Returns:
+            dict: Number and size of the stored images, and of those no playlist uses
+        """
+        stats = {"path": str(self.root), "blobs": 0, "size_bytes": 0, "unreferenced": 0, "unreferenced_bytes": 0}
+        for entry in self._iter_blobs():
+            stat = entry.stat()
+            stats["blobs"] += 1
+            stats["size_bytes"] += stat.st_size
+            if not self._is_referenced(entry, referenced_keys):
+                stats["unreferenced"] += 1
+                stats["unreferenced_bytes"] += stat.st_size
+        return stats
+
+    def gc(self, dry_run: bool = False, referenced_keys: set[str] = frozenset()) -> tuple[int, int]:
+        """
+        Delete stored images that no playlist folder links to or records in its card manifest.
+        Where hard links are not supported, playlist folders hold copies and the link count
+        says nothing; pass the keys of all playlist folders (referenced_keys) to keep those blobs.
+        Args:
+            dry_run (bool): Only count what would be deleted
+            referenced_keys (set[str]): Keys recorded by playlist folders, see referenced_keys
+        Returns:
+            tuple[int, int]: Number of deleted images and freed bytes
+        """
+        removed = freed = 0
+        for entry in list(self._iter_blobs()):
+            if self._is_referenced(entry, referenced_keys):
+                continue
+            size = entry.stat().st_size
+            if not dry_run:
+                os.unlink(entry.path)
+            removed += 1
+            freed += size
+        if not dry_run and self.root.is_dir():
+            for prefix in self.root.iterdir():
+                if prefix.is_dir() and not any(prefix.iterdir()):
+                    prefix.rmdir()
+        return removed, freed
+
+
+def referenced_keys(playlist_dirs: Iterable[Path]) -> set[str]:
+    """
+    Store keys of the card sides recorded in the card manifests of playlist folders.
+    Args:
+        playlist_dirs (Iterable[Path]): Playlist folders
+    Returns:
+        set[str]: Content hashes of the recorded card sides
+    """
+    keys = set()
+    for playlist_dir in playlist_dirs:
+        try:
+            with open(Path(playlist_dir) / MANIFEST_FILENAME, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("cards", {})
+        except (OSError, ValueError):
+            continue
+        keys.update(entry[side] for entry in entries.values() for side in CARD_SIDES if side in entry)
+    return keys
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link source to target (replacing it atomically), or copy if linking is not possible."""
+    if target.exists() and os.path.samefile(source, target):
+        return
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
+def get_card_store() -> CardStore:
+    """
+    Return the card store at CARD_STORE_DIR.
+    Returns:
+        CardStore: The shared card store
+    """
+    return CardStore()
@@ -0,0 +1,145 @@
+# src/cards/encoders.py
+import io
+import os
+import time
+from dataclasses import dataclass
+
+from PIL import Image, features
+
+
+IMAGE_FORMATS = ("png", "webp", "jpeg")
+
+# file extensions of card images, in lookup order
+CARD_IMAGE_EXTENSIONS = ("png", "webp", "jpg")
+
+DEFAULT_PNG_COMPRESS_LEVEL = 6  # Pillow's default
+DEFAULT_JPEG_QUALITY = 95
+
+
+@dataclass(frozen=True)
+class CardEncoder:
+    """
+    Image encoder for card files.
+    Created with get_encoder; `settings` round-trips through get_encoder(**settings).
+    """
+    format: str
+    extension: str
+    mode: str
+    save_options: tuple[tuple[str, object], ...]
+    settings: tuple[tuple[str, object], ...]
+
+    @property
+    def label(self) -> str:
+        """Short description of the encoder, e.g. 'png (compress_level=6)'."""
+        options = ", ".join(f"{key}={value}" for key, value in self.settings if key != "format")
+        return f"{self.format} ({options})" if options else self.format
+
+    def encode(self, img: Image.Image) -> bytes:
+        """
+        Encode an image to bytes.
+        Args:
+            img (Image.Image): Card image
+        Returns:
+            bytes: Encoded image file
+        """
+        if img.mode != self.mode:
+            img = img.convert(self.mode)
+        buffer = io.BytesIO()
+        img.save(buffer, format=self.format.upper(), **dict(self.save_options))
+        return buffer.getvalue()
+
+
+def get_encoder(
+        format: str = "png", compress_level: int | None = None, optimize: bool = False,
+        quality: int | None = None
+        ) -> CardEncoder:
+    """
+    Create a card image encoder.
+
+    Args:
+        format (str): "png", "webp" (lossless) or "jpeg"
+        compress_level (int | None): PNG zlib level 0-9 (default 6)
+        optimize (bool): PNG/JPEG: extra pass for smaller files (PNG: implies level 9)
+        quality (int | None): JPEG quality 1-100 (default 95) or WebP compression effort 0-100
+    Returns:
+        CardEncoder: Encoder for the given settings
+    Raises:
+        ValueError: If the format is unknown or not supported by this Pillow build
+    """
+    format = format.lower()
+    if format == "jpg":
+        format = "jpeg"
+
+    if format == "png":
+        level = DEFAULT_PNG_COMPRESS_LEVEL if compress_level is None else compress_level
+        if not 0 <= level <= 9:
+            raise ValueError(f"PNG compress level must be 0-9, got {level}")
+        settings = (("format", format), ("compress_level", level), ("optimize", optimize))
+        return CardEncoder(format, "png", "RGBA", (("compress_level", level), ("optimize", optimize)), settings)
+
+    if format == "webp":
+        if not features.check("webp"):
+            raise ValueError("WebP is not supported by the installed Pillow")
+        effort = 80 if quality is None else quality
+        settings = (("format", format), ("quality", effort))
+        return CardEncoder(format, "webp", "RGBA", (("lossless", True), ("quality", effort)), settings)
+
+    if format == "jpeg":
+        quality = DEFAULT_JPEG_QUALITY if quality is None else quality
+        if not 1 <= quality <= 100:
+            raise ValueError(f"JPEG quality must be 1-100, got {quality}")
+        settings = (("format", format), ("quality", quality), ("optimize", optimize))
+        # no chroma subsampling: keeps thin text and QR module edges sharp
+        options = (("quality", quality), ("subsampling", 0), ("optimize", optimize))
+        return CardEncoder(format, "jpg", "RGB", options, settings)
+
+    raise ValueError(f"Unknown image format '{format}', expected one of {', '.join(IMAGE_FORMATS)}")
+
+
+def encoder_from_settings(settings: dict | None) -> CardEncoder:
+    """
+    Recreate an encoder from saved settings (e.g. playlist.json); None means default PNG.
+    """
+    return get_encoder(**(settings or {}))
+
+
+@dataclass
+class EncodeStats:
+    """Files, bytes and time spent encoding and writing, per encoder."""
+    files: int = 0
+    bytes: int = 0
+    encode_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    def add(self, other: "EncodeStats") -> None:
+        self.files += other.files
+        self.bytes += other.bytes
+        self.encode_seconds += other.encode_seconds
+        self.write_seconds += other.write_seconds
+
+    def summary(self, label: str) -> str:
+        if not self.files:
+            return f"{label}: no files written"
+        return (
+            f"{label}: {self.files} files, {self.bytes / 1024 / 1024:.1f} MB "
+            f"({self.bytes / self.files / 1024:.0f} KB/file), "
+            f"encode {self.encode_seconds:.2f}s ({self.encode_seconds / self.files * 1000:.1f} ms/file), "
+            f"write {self.write_seconds:.2f}s"
+        )
+
+
+def encode_and_write(img: Image.Image, path, encoder: CardEncoder) -> EncodeStats:
+    """
+    Encode an image and write it to `path`.
+    The file is replaced rather than rewritten, so hard links to the old file (card store) keep their content.
+    Returns:
+        EncodeStats: Stats of this single file
+    """
+    start = time.perf_counter()
+    data = encoder.encode(img)
+    encoded = time.perf_counter()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return EncodeStats(1, len(data), encoded - start, time.perf_counter() - encoded)
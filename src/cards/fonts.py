@@ -0,0 +1,66 @@
+# src/cards/fonts.py
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import ImageFont
+
+
+# maximum number of loaded (font, size) combinations kept in memory
+FONT_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=None)
+def _is_font_loadable(font_path: str | None) -> bool:
+    """
+    Check once per font path whether it can be loaded as TrueType font.
+    Prints a single warning for fonts that fall back to the default font.
+    """
+    if not font_path:
+        return False
+    try:
+        ImageFont.truetype(font_path, size=10)
+        return True
+    except OSError as e:
+        print(f"Warning: could not load font '{font_path}', using default font: {e}")
+        return False
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def _load_font(font_path: str | None, size: int) -> ImageFont.FreeTypeFont:
+    if _is_font_loadable(font_path):
+        return ImageFont.truetype(font_path, size=size)
+    return ImageFont.load_default(size=size)
+
+
+def get_font(font_path: Path | str | None, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Get a loaded font from the shared LRU cache.
+    Fonts are keyed by (absolute path, size) and shared across cards and designs.
+
+    Args:
+        font_path (Path | str | None): Path to a TrueType font file (None = default font)
+        size (int): Font size in pixels
+    Returns:
+        ImageFont.FreeTypeFont: Loaded font, or Pillow's default font if the file cannot be loaded
+    """
+    resolved = os.path.abspath(font_path) if font_path else None
+    return _load_font(resolved, size)
+
+
+def font_cache_info() -> dict:
+    """
+    Get hit/miss counters of the font cache.
+    Returns:
+        dict: {hits, misses, size, max_size}
+    """
+    info = _load_font.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+
+def clear_font_cache() -> None:
+    """
+    Drop all cached fonts and font path checks.
+    """
+    _load_font.cache_clear()
+    _is_font_loadable.cache_clear()
@@ -1,93 +1,154 @@
 # src/cards/generator.py
 from pathlib import Path
-import math
-from PIL import Image, ImageDraw, ImageFont
+import hashlib
+import multiprocessing
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageColor, ImageDraw
 import qrcode
 from qrcode.constants import ERROR_CORRECT_H
-from random import choice
+import random
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
-from typing import Tuple
+from reportlab.lib.utils import ImageReader
+from typing import Iterable, Tuple
 
-from ..config import resolve_asset_path
+from ..config import CARD_SIZE_MM, CARD_SIZE_PX, resolve_asset_path
 from ..core.data_loader import load_playlist_metadata
-from .storage import save_card_image
+from ..core.pipeline import ordered_map
+from .assets import get_asset_cache
+from .fonts import get_font
+from .manifest import CARD_SIDES, CardManifest
+from .card_index import CardIndex, get_card_filename
+from .card_store import CardStore
+from .text_layout import draw_text_layout, fit_text, wrap_text
+from .encoders import CardEncoder, EncodeStats, get_encoder
+from .storage import CardWriter, save_card_image, thumbnail_dir
 
 
-def generate_qr_code(data: str, size: int = 300, border: int = 4,
-                      error_correction=ERROR_CORRECT_H) -> Image.Image:
+# box size of the reference qrcode image that generate_qr_code scales from
+_QR_BOX_SIZE = 10
+
+
+def qr_code_matrix(data: str, border: int = 4, error_correction=ERROR_CORRECT_H) -> np.ndarray:
     """
-    Generate a QR code for the given Spotify URI/URL.
+    Build the module matrix of a QR code.
     Args:
-        data (str): Spotify URI or URL to encode in the QR code
-        size (int): Size of the QR code image (pixels)
-        border (int): Border size around the QR code
+        data (str): Data to encode
+        border (int): Quiet zone around the code (modules)
         error_correction: Error correction level for the QR code
     Returns:
-        Image.Image: Generated QR code image
+        np.ndarray: Square boolean matrix, True for dark modules
     """
     qr = qrcode.QRCode(
         version=None,
         error_correction=error_correction,
-        box_size=10,
         border=border,
     )
     qr.add_data(data)
     qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white").convert("RGBA")
-    img = img.resize((size, size), Image.NEAREST)
+    return np.array(qr.get_matrix(), dtype=bool)
+
+
+def _scale_qr_matrix(matrix: np.ndarray, size: int) -> np.ndarray:
+    """
+    Scale a module matrix to size x size pixels with nearest-neighbour sampling.
+    Samples the same pixels as drawing with box_size=10 and resizing with
+    Image.NEAREST, so the result is pixel-identical to that approach.
+    Returns a uint8 array with 1 for dark and 0 for light pixels.
+    """
+    modules = matrix.astype(np.uint8)
+    num_modules = modules.shape[0]
+    if size % num_modules == 0:
+        # integer scale factor: plain repeat
+        factor = size // num_modules
+        return modules.repeat(factor, axis=0).repeat(factor, axis=1)
+
+    src_size = num_modules * _QR_BOX_SIZE
+    index = ((np.arange(size) + 0.5) * src_size / size).astype(np.intp) // _QR_BOX_SIZE
+    return modules.take(index, axis=0).take(index, axis=1)
+
+
+def generate_qr_code(data: str, size: int = 300, border: int = 4,
+                      error_correction=ERROR_CORRECT_H) -> Image.Image:
+    """
+    Generate a QR code for the given Spotify URI/URL.
+    Args:
+        data (str): Spotify URI or URL to encode in the QR code
+        size (int): Size of the QR code image (pixels)
+        border (int): Border size around the QR code
+        error_correction: Error correction level for the QR code
+    Returns:
+        Image.Image: Generated QR code image
+    """
+    modules = _scale_qr_matrix(qr_code_matrix(data, border, error_correction), size)
+    img = Image.fromarray((1 - modules) * 255, "L").convert("RGBA")
 
     return img
 
 
-def draw_wrapped_text(draw, text, font, max_width, center_x, center_y, fill):
+def paste_qr_code(img: Image.Image, data: str, position: Tuple[int, int], size: int, border: int = 4,
+                  error_correction=ERROR_CORRECT_H, fill_color="black", back_color="white") -> None:
+    """
+    Draw a QR code directly into an image, without the full-resolution qrcode image.
+    Args:
+        img (Image.Image): Target image (modified in place)
+        data (str): Spotify URI or URL to encode in the QR code
+        position (Tuple[int, int]): Top-left corner of the QR code in the target image
+        size (int): Size of the QR code (pixels)
+        border (int): Border size around the QR code
+        error_correction: Error correction level for the QR code
+        fill_color: Color of dark modules
+        back_color: Color of light modules
+    """
+    modules = _scale_qr_matrix(qr_code_matrix(data, border, error_correction), size)
+
+    # two-color palette image: index 0 = light, 1 = dark
+    qr_img = Image.fromarray(modules, "P")
+    qr_img.putpalette(ImageColor.getrgb(back_color)[:3] + ImageColor.getrgb(fill_color)[:3])
+    img.paste(qr_img.convert(img.mode), position)
+
+
+def draw_wrapped_text(draw, text, font, max_width, center_x, center_y, fill, line_height_multiplier=1.2):
     """
     Draw wrapped, centered text on an image.
     The entire text block (all lines) is centered around (center_x, center_y).
     """
-    words = text.split()
-    lines = []
-    line = ""
-
-    for word in words:
-        test_line = f"{line} {word}".strip()
-        bbox = draw.textbbox((0, 0), test_line, font=font)
-        line_width = bbox[2] - bbox[0]
-        if line_width <= max_width:
-            line = test_line
-        else:
-            lines.append(line)
-            line = word
-    if line:
-        lines.append(line)
+    layout = wrap_text(text, font, max_width, line_height_multiplier)
+    draw_text_layout(draw, layout, font, center_x, center_y, fill)
 
-    line_height = font.size * 1.2
-    total_height = line_height * len(lines)
 
-    y = center_y - total_height / 2
+def _select_random_from_list(items: list, rng: random.Random | None = None) -> any:
+    """Select random item from list, or None if empty."""
+    return (rng or random).choice(items) if items else None
 
-    for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=font)
-        line_width = bbox[2] - bbox[0]
-        x = center_x - line_width / 2  # center each line horizontally
-        draw.text((x, y), line, fill=fill, font=font)
-        y += line_height
 
+def track_seed(track: dict, side: str, seed: int = 0) -> int:
+    """
+    Derive a reproducible random seed for one card side of a track.
+    Independent of render order and worker count.
 
-def _select_random_from_list(items: list) -> any:
-    """Select random item from list, or None if empty."""
-    return choice(items) if items else None
+    Args:
+        track (dict): Track metadata dictionary
+        side (str): "front" or "back"
+        seed (int): Base seed of the run
+    Returns:
+        int: Seed for the random design choices of this card side
+    """
+    key = f"{seed}:{track.get('spotify_uri', '')}:{side}".encode("utf-8")
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "big")
 
 
-def _load_background_image(bg_paths: list, card_size: int) -> Image.Image | None:
+def _select_background_path(bg_paths: list, rng: random.Random | None = None) -> Path | None:
     """
-    Load a random background image from the provided paths.
-    Supports both files and directories.
+    Select a random background image path from the provided paths.
+    Supports both files and directories (a random file of the directory is chosen).
     """
     if not bg_paths:
         return None
     
-    bg_path_str = _select_random_from_list(bg_paths)
+    bg_path_str = _select_random_from_list(bg_paths, rng)
     if not bg_path_str:
         return None
     
@@ -95,35 +156,68 @@ def _load_background_image(bg_paths: list, card_size: int) -> Image.Image | None
     if not bg_path:
         return None
     
+    # If it's a directory, select random file from it
+    bg_images = get_asset_cache().list_dir(bg_path)
+    if bg_images is not None:
+        if not bg_images:
+            return None
+        bg_path = _select_random_from_list(bg_images, rng)
+    return bg_path
+
+
+def _load_background_image(bg_path: Path | None, card_size: int) -> Image.Image | None:
+    """
+    Load a background image, decoded and resized, from the asset cache.
+    The returned image is shared and must not be modified.
+    """
+    if not bg_path:
+        return None
     try:
-        # If it's a directory, select random file from it
-        if bg_path.is_dir():
-            bg_images = list(bg_path.glob("*"))
-            if not bg_images:
-                return None
-            bg_path = choice(bg_images)
-        
-        # Load and resize image
-        bg_img = Image.open(bg_path).convert("RGBA")
-        bg_img = bg_img.resize((card_size, card_size))
-        return bg_img
+        return get_asset_cache().get_image(bg_path, (card_size, card_size))
     except Exception as e:
         print(f"Warning: could not load background image '{bg_path}': {e}")
         return None
 
 
-def generate_card_front(
-        track: dict, design: dict, card_size: int = 800
+def _get_base_layer(
+        card_size: int, background_color: str, bg_path: Path | None,
+        frame: Tuple[Tuple[int, int, int, int], str] | None = None
         ) -> Image.Image:
     """
-    Generate the front side of a song card.
-    
+    Get the pre-rendered static layer of a design variant: background color,
+    background image and (on the back) the QR border frame.
+    Layers are rendered once per variant and shared through the asset cache;
+    callers must draw on a copy.
+    """
+    def render() -> Image.Image:
+        img = Image.new("RGBA", (card_size, card_size), background_color)
+        bg_img = _load_background_image(bg_path, card_size)
+        if bg_img:
+            img.alpha_composite(bg_img)
+        if frame:
+            box, frame_color = frame
+            img.paste(frame_color, box)
+        return img
+
+    key = ("layer", card_size, background_color, str(bg_path) if bg_path else None, frame)
+    return get_asset_cache().get_or_create(key, render)
+
+
+def plan_card_front(
+        track: dict, design: dict, card_size: int = CARD_SIZE_PX, rng: random.Random | None = None
+        ) -> dict:
+    """
+    Make the design choices and text layout of a card front, without drawing anything.
+    Shared by the raster renderer and the vector PDF export.
+
     Args:
         track (dict): Track metadata dictionary
         design (dict): Design configuration for the card front
-        card_size (int): Size of the card image (pixels)
+        card_size (int): Size of the card (pixels)
+        rng (random.Random | None): Random generator for design choices (default: global)
     Returns:
-        Image.Image: Generated card front image
+        dict: {card_size, background_color, text_color, bg_path, font_path,
+            title, artists: (TextLayout, center_x, center_y), year: (text, font_size, center_x, center_y)}
     """
     # Extract design values from new structure
     design_front = design.get("front", {})
@@ -133,8 +227,8 @@ def generate_card_front(
     images = design_front.get("images", {})
     
     # Get colors
-    background_color = _select_random_from_list(colors.get("background", ["#FFFFFF"]))
-    text_color = _select_random_from_list(colors.get("text", ["#000000"]))
+    background_color = _select_random_from_list(colors.get("background", ["#FFFFFF"]), rng)
+    text_color = _select_random_from_list(colors.get("text", ["#000000"]), rng)
     
     # Get typography settings
     font_path_str = typography.get("font_family")
@@ -146,79 +240,129 @@ def generate_card_front(
     title_y_ratio = layout.get("title_y_ratio", 0.15)
     year_y_ratio = layout.get("year_y_ratio", 0.5)
     artist_y_ratio = layout.get("artist_y_ratio", 0.85)
+    title_max_height_ratio = layout.get("title_max_height_ratio", 0.25)
+    artist_max_height_ratio = layout.get("artist_max_height_ratio", 0.25)
     
     # Get size ratios
     title_size_ratio = typography.get("title_size_ratio", 0.08)
+    title_min_size_ratio = typography.get("title_min_size_ratio", title_size_ratio)
     year_size_ratio = typography.get("year_size_ratio", 0.3)
+    year_min_size_ratio = typography.get("year_min_size_ratio", year_size_ratio)
     artist_size_ratio = typography.get("artist_size_ratio", 0.08)
+    artist_min_size_ratio = typography.get("artist_min_size_ratio", artist_size_ratio)
     
-    # Create base image
-    img = Image.new("RGBA", (card_size, card_size), background_color)
-    draw = ImageDraw.Draw(img)
+    # Background image of this variant
+    bg_path = _select_background_path(images.get("backgrounds", []), rng)
 
-    # Add background image (optional)
-    bg_img = _load_background_image(images.get("backgrounds", []), card_size)
-    if bg_img:
-        img.alpha_composite(bg_img)
-
-    # Load fonts
-    title_size = int(card_size * title_size_ratio)
-    year_size = int(card_size * year_size_ratio)
-    
-    # Determine artist font size based on length (keep existing logic for now)
+    # Lay out title and artists: largest font size that fits their text box
+    name = track.get("name_cleaned", track.get("name_original", "Unknown Title"))
     artists = track.get("artists", "Unknown Artist")
-    if len(artists) < 30:
-        artists_size = int(card_size * artist_size_ratio)
-    else:
-        artist_size_ratio_long = typography.get("artist_size_ratio_long", 0.06)
-        artists_size = int(card_size * artist_size_ratio_long)
+    max_text_width = card_size * text_max_width_ratio
+
+    title_layout = fit_text(
+        name, font_path,
+        max_size=int(card_size * title_size_ratio),
+        min_size=int(card_size * title_min_size_ratio),
+        max_width=max_text_width,
+        max_height=card_size * title_max_height_ratio,
+        line_height_multiplier=line_height_multiplier,
+    )
+    artists_layout = fit_text(
+        artists, font_path,
+        max_size=int(card_size * artist_size_ratio),
+        min_size=int(card_size * artist_min_size_ratio),
+        max_width=max_text_width,
+        max_height=card_size * artist_max_height_ratio,
+        line_height_multiplier=line_height_multiplier,
+    )
+    year = str(track.get("release_year", ""))
+    year_layout = fit_text(
+        year, font_path,
+        max_size=int(card_size * year_size_ratio),
+        min_size=int(card_size * year_min_size_ratio),
+        max_width=max_text_width,
+        max_height=card_size,
+        line_height_multiplier=1.0,
+    )
+
+    center_x = card_size / 2
+    return {
+        "card_size": card_size,
+        "background_color": background_color,
+        "text_color": text_color,
+        "bg_path": bg_path,
+        "font_path": font_path,
+        "title": (title_layout, center_x, card_size * title_y_ratio),
+        "artists": (artists_layout, center_x, card_size * artist_y_ratio),
+        "year": (year, year_layout.font_size, center_x, card_size * year_y_ratio),
+    }
+
+
+def generate_card_front(
+        track: dict, design: dict, card_size: int = CARD_SIZE_PX, rng: random.Random | None = None
+        ) -> Image.Image:
+    """
+    Generate the front side of a song card.
     
-    try:
-        title_font = ImageFont.truetype(str(font_path), size=title_size)
-        year_font = ImageFont.truetype(str(font_path), size=year_size)
-        artists_font = ImageFont.truetype(str(font_path), size=artists_size)
-    except:
-        title_font = ImageFont.load_default(size=title_size)
-        year_font = ImageFont.load_default(size=year_size)
-        artists_font = ImageFont.load_default(size=artists_size)
-        print("Warning: could not load specified font, using default font.")
+    Args:
+        track (dict): Track metadata dictionary
+        design (dict): Design configuration for the card front
+        card_size (int): Size of the card image (pixels)
+        rng (random.Random | None): Random generator for design choices (default: global)
+    Returns:
+        Image.Image: Generated card front image
+    """
+    plan = plan_card_front(track, design, card_size=card_size, rng=rng)
+    font_path = plan["font_path"]
+    text_color = plan["text_color"]
+
+    # Start from the pre-rendered background layer of this variant
+    img = _get_base_layer(card_size, plan["background_color"], plan["bg_path"]).copy()
+    draw = ImageDraw.Draw(img)
 
     # Draw text elements
-    name = track.get("name_cleaned", track.get("name_original", "Unknown Title"))
-    max_text_width = card_size * text_max_width_ratio
-    center_x = card_size / 2
-    center_y = card_size * title_y_ratio
-    draw_wrapped_text(draw, name, title_font, max_text_width, center_x, center_y, fill=text_color)
+    title_layout, title_x, title_y = plan["title"]
+    draw_text_layout(
+        draw, title_layout, get_font(font_path, title_layout.font_size),
+        title_x, title_y, fill=text_color
+    )
     
-    year = str(track.get("release_year", ""))
+    year, year_size, year_x, year_y = plan["year"]
     draw.text(
-        (card_size / 2, card_size * year_y_ratio),
+        (year_x, year_y),
         year,
         fill=text_color,
-        font=year_font,
+        font=get_font(font_path, year_size),
         anchor="mm"  
     )
 
-    center_y = card_size * artist_y_ratio
-    draw_wrapped_text(draw, artists, artists_font, max_text_width, center_x, center_y, fill=text_color)
+    artists_layout, artists_x, artists_y = plan["artists"]
+    draw_text_layout(
+        draw, artists_layout, get_font(font_path, artists_layout.font_size),
+        artists_x, artists_y, fill=text_color
+    )
 
     return img
 
 
-def generate_card_back(
-        track: dict, design: dict, card_size: int = 800, qr_ratio: float = 0.5, qr_border_ratio: float = 0.01,
-        ) -> Image.Image:
+def plan_card_back(
+        track: dict, design: dict, card_size: int = CARD_SIZE_PX, qr_ratio: float = 0.5, qr_border_ratio: float = 0.01,
+        rng: random.Random | None = None,
+        ) -> dict:
     """
-    Generate the back side of a song card.
-    
+    Make the design choices and QR code geometry of a card back, without drawing anything.
+    Shared by the raster renderer and the vector PDF export.
+
     Args:
         track (dict): Track metadata dictionary
         design (dict): Design configuration for the card back
-        card_size (int): Size of the card image (pixels)
+        card_size (int): Size of the card (pixels)
         qr_ratio (float): Ratio of QR code size to card size (DEPRECATED - use design config)
         qr_border_ratio (float): Ratio of QR code border size to card size (DEPRECATED - use design config)
+        rng (random.Random | None): Random generator for design choices (default: global)
     Returns:
-        Image.Image: Generated card back image
+        dict: {card_size, background_color, border_color, bg_path, frame_box, qr_position, qr_size,
+            spotify_uri, logo_path, logo_box}; boxes are (left, top, right, bottom) in pixels
     """
     # Extract design values from new structure
     design_back = design.get("back", {})
@@ -227,48 +371,80 @@ def generate_card_back(
     images = design_back.get("images", {})
     
     # Get colors
-    background_color = _select_random_from_list(colors.get("background", ["#000000"]))
-    border_color = _select_random_from_list(colors.get("qr_border", ["#FFFFFF"]))
+    background_color = _select_random_from_list(colors.get("background", ["#000000"]), rng)
+    border_color = _select_random_from_list(colors.get("qr_border", ["#FFFFFF"]), rng)
     
     # Get layout settings (with fallback to function params for backward compatibility)
     qr_size_ratio = layout.get("qr_size_ratio", qr_ratio)
     qr_border_size_ratio = layout.get("qr_border_ratio", qr_border_ratio)
 
-    # Create base image
-    img = Image.new("RGBA", (card_size, card_size), background_color)
+    # QR code geometry
+    qr_size = int(card_size * qr_size_ratio)
+    border_size = int(card_size * qr_border_size_ratio)
+    qr_with_border_size = qr_size + 2 * border_size
+    qr_x = (card_size - qr_with_border_size) // 2
+    qr_y = (card_size - qr_with_border_size) // 2
+    frame_box = (qr_x, qr_y, qr_x + qr_with_border_size, qr_y + qr_with_border_size)
+
+    # QR background image of this variant
+    bg_path = _select_background_path(images.get("qr_backgrounds", []), rng)
+
+    # Center icon of the QR code (optional)
+    qr_logo_path_str = _select_random_from_list(images.get("qr_center_logos", []), rng)
+    logo_path = resolve_asset_path(qr_logo_path_str) if qr_logo_path_str else None
+    icon_size = _qr_logo_size(qr_size)
+    icon_x = qr_x + (qr_with_border_size - icon_size) // 2
+    icon_y = qr_y + (qr_with_border_size - icon_size) // 2
+
+    return {
+        "card_size": card_size,
+        "background_color": background_color,
+        "border_color": border_color,
+        "bg_path": bg_path,
+        "frame_box": frame_box,
+        "qr_position": (qr_x + border_size, qr_y + border_size),
+        "qr_size": qr_size,
+        "spotify_uri": track.get("spotify_uri", ""),
+        "logo_path": logo_path,
+        "logo_box": (icon_x, icon_y, icon_x + icon_size, icon_y + icon_size),
+    }
 
-    # Add QR background image (optional)
-    bg_img = _load_background_image(images.get("qr_backgrounds", []), card_size)
-    if bg_img:
-        img.alpha_composite(bg_img)
 
-    # Generate QR code
-    spotify_uri = track.get("spotify_uri", "")
-    qr_size = int(card_size * qr_size_ratio)
-    qr_img = generate_qr_code(spotify_uri, size=qr_size, border=0)
+def generate_card_back(
+        track: dict, design: dict, card_size: int = CARD_SIZE_PX, qr_ratio: float = 0.5, qr_border_ratio: float = 0.01,
+        rng: random.Random | None = None,
+        ) -> Image.Image:
+    """
+    Generate the back side of a song card.
+    
+    Args:
+        track (dict): Track metadata dictionary
+        design (dict): Design configuration for the card back
+        card_size (int): Size of the card image (pixels)
+        qr_ratio (float): Ratio of QR code size to card size (DEPRECATED - use design config)
+        qr_border_ratio (float): Ratio of QR code border size to card size (DEPRECATED - use design config)
+        rng (random.Random | None): Random generator for design choices (default: global)
+    Returns:
+        Image.Image: Generated card back image
+    """
+    plan = plan_card_back(
+        track, design, card_size=card_size, qr_ratio=qr_ratio, qr_border_ratio=qr_border_ratio, rng=rng
+    )
 
-    # Add white border around QR code
-    border_size = int(card_size * qr_border_size_ratio)
-    qr_with_border = Image.new("RGBA", (qr_size + 2 * border_size, qr_size + 2 * border_size), border_color)
-    qr_with_border.paste(qr_img, (border_size, border_size))
+    # Start from the pre-rendered layer of this variant (background, QR background image, border frame)
+    frame = (plan["frame_box"], plan["border_color"])
+    img = _get_base_layer(card_size, plan["background_color"], plan["bg_path"], frame=frame).copy()
 
-    # Paste QR code onto card back
-    qr_x = (card_size - qr_with_border.width) // 2
-    qr_y = (card_size - qr_with_border.height) // 2
-    img.paste(qr_with_border, (qr_x, qr_y))
+    # Draw QR code straight onto the card back
+    paste_qr_code(img, plan["spotify_uri"], plan["qr_position"], plan["qr_size"], border=0)
 
     # Add center icon to QR code (optional)
-    qr_logo_paths = images.get("qr_center_logos", [])
-    qr_logo_path_str = _select_random_from_list(qr_logo_paths)
-    
-    if qr_logo_path_str:
-        qr_logo_path = resolve_asset_path(qr_logo_path_str)
+    qr_logo_path = plan["logo_path"]
+    if qr_logo_path:
+        icon_x, icon_y, icon_right, _ = plan["logo_box"]
+        icon_size = icon_right - icon_x
         try:
-            icon_img = Image.open(qr_logo_path).convert("RGBA")
-            icon_size = int(qr_size * 0.25)
-            icon_img = icon_img.resize((icon_size, icon_size))
-            icon_x = qr_x + (qr_with_border.width - icon_size) // 2
-            icon_y = qr_y + (qr_with_border.height - icon_size) // 2
+            icon_img = get_asset_cache().get_image(qr_logo_path, (icon_size, icon_size))
             img.paste(icon_img, (icon_x, icon_y), icon_img)
         except Exception as e:
             print(f"Warning: could not load QR center icon '{qr_logo_path}': {e}")
@@ -276,56 +452,306 @@ def generate_card_back(
     return img
 
 
-def get_card_filename(track: dict) -> str:
+def _qr_logo_size(qr_size: int) -> int:
+    """Size of the QR center logo for a given QR code size."""
+    return int(qr_size * 0.25)
+
+
+def warm_design_assets(design: dict, card_size: int = CARD_SIZE_PX) -> None:
     """
-    Generate standardized filename base card image.
-    
+    Preload all images referenced by a design into the asset cache, decoded and
+    resized to the sizes used for rendering, before the first card is drawn.
+
     Args:
-        track (dict): Track metadata dictionary
+        design (dict): Design configuration
+        card_size (int): Size of the card images (pixels)
+    """
+    asset_cache = get_asset_cache()
+    front_images = design.get("front", {}).get("images", {})
+    back = design.get("back", {})
+    back_images = back.get("images", {})
+    qr_size = int(card_size * back.get("layout", {}).get("qr_size_ratio", 0.5))
+    logo_size = _qr_logo_size(qr_size)
+
+    to_load = [
+        (path_str, card_size)
+        for path_str in front_images.get("backgrounds", []) + back_images.get("qr_backgrounds", [])
+    ] + [(path_str, logo_size) for path_str in back_images.get("qr_center_logos", [])]
+
+    for path_str, size in to_load:
+        path = resolve_asset_path(path_str)
+        if not path:
+            continue
+        paths = asset_cache.list_dir(path)
+        for file_path in (paths if paths is not None else [path]):
+            try:
+                asset_cache.get_image(file_path, (size, size))
+            except Exception as e:
+                print(f"Warning: could not preload asset '{file_path}': {e}")
+
+
+def render_size_for_dpi(dpi: float, card_size_mm: float = CARD_SIZE_MM) -> int:
+    """
+    Card image size (pixels) for printing at a target resolution.
+    Args:
+        dpi (float): Target print resolution (dots per inch)
+        card_size_mm (float): Printed card size (mm)
     Returns:
-        str: Filename base for card image
+        int: Card size (pixels)
     """
-    year = track["release_year"]
-    cleaned_name = track["name_cleaned"]
-    return f"{year}_{cleaned_name}".replace(" ", "_").replace("/", "_")
+    return max(1, round(card_size_mm / 25.4 * dpi))
 
 
 def generate_and_save_cards_for_track(
-        track: dict, output_dir: Path, design: dict,
-        ) -> Tuple[Image.Image, Image.Image]:
+        track: dict, output_dir: Path, design: dict, seed: int = 0, sides: Tuple[str, ...] = CARD_SIDES,
+        writer: CardWriter | None = None, card_size: int = CARD_SIZE_PX, thumbnail_sizes: Tuple[int, ...] = (),
+        store: CardStore | None = None, store_keys: dict[str, str] | None = None,
+        ) -> Tuple[Image.Image | Path | None, Image.Image | Path | None]:
     """
     Generate and save both front and back card images for a given track.
+    Sides found in the card store are linked into output_dir instead of rendered.
     
     Args:
         track (dict): Track metadata dictionary
         output_dir (Path): Directory to save the generated card images
         design (dict): Design configuration for the card
+        seed (int): Base seed for the random design choices
+        sides (Tuple[str, ...]): Card sides to render ("front", "back")
+        writer (CardWriter | None): Background writer for the images (None = save synchronously as PNG)
+        card_size (int): Size of the card images (pixels)
+        thumbnail_sizes (Tuple[int, ...]): Additional smaller sizes, downscaled from the rendered card
+            and saved to thumbnail_dir(output_dir, size)
+        store (CardStore | None): Content-addressed card store to link stored sides from
+        store_keys (dict[str, str] | None): Store key (content hash) per side, see CardManifest.side_hash
     Returns:
-        Tuple[Image.Image, Image.Image]: Generated card front and back images
+        Tuple[Image.Image | Path | None, Image.Image | Path | None]: Generated card front and back images,
+            the saved path for sides linked from the store (None for sides that were not rendered)
     """
     filename_base = get_card_filename(track)
-
-    front_img = generate_card_front(track, design=design)
-    back_img = generate_card_back(track, design=design)
-
-    save_card_image(front_img, output_dir, f"{filename_base}_front")
-    save_card_image(back_img, output_dir, f"{filename_base}_back")
+    save = writer.submit if writer else save_card_image
+    extension = (writer.encoder if writer else get_encoder()).extension
+    front_img = back_img = None
+
+    def linked_side(side: str) -> Path | None:
+        if store is None or not store_keys or side not in store_keys:
+            return None
+        return store.link(store_keys[side], extension, output_dir, f"{filename_base}_{side}", thumbnail_sizes)
+
+    def save_side(img: Image.Image, side: str):
+        save(img, output_dir, f"{filename_base}_{side}")
+        # one downscale per size from the rendered card instead of rendering again
+        for size in thumbnail_sizes:
+            save(img.resize((size, size), Image.LANCZOS), thumbnail_dir(output_dir, size), f"{filename_base}_{side}")
+
+    if "front" in sides:
+        front_img = linked_side("front")
+        if front_img is None:
+            front_img = generate_card_front(
+                track, design=design, card_size=card_size, rng=random.Random(track_seed(track, "front", seed))
+            )
+            save_side(front_img, "front")
+    if "back" in sides:
+        back_img = linked_side("back")
+        if back_img is None:
+            back_img = generate_card_back(
+                track, design=design, card_size=card_size, rng=random.Random(track_seed(track, "back", seed))
+            )
+            save_side(back_img, "back")
     
     return front_img, back_img
 
 
-def generate_and_save_cards_for_playlist(
-        tracks: list[dict], output_dir: Path, design: dict,
+# Render worker state (set once per worker process)
+_worker_args: dict = {}
+
+
+def _init_render_worker(
+        output_dir: Path, design: dict, seed: int, encoder: CardEncoder | None,
+        card_size: int = CARD_SIZE_PX, thumbnail_sizes: Tuple[int, ...] = (), store: CardStore | None = None,
         ) -> None:
-    for track in tracks:
-        generate_and_save_cards_for_track(track, output_dir, design)
+    """Store the per-run render arguments in a worker process and preload design assets."""
+    # one writer thread: the back is rendered while the front is encoded
+    writer = CardWriter(encoder, threads=1)
+    _worker_args.update(
+        output_dir=output_dir, design=design, seed=seed, writer=writer,
+        card_size=card_size, thumbnail_sizes=thumbnail_sizes, store=store,
+    )
+    warm_design_assets(design, card_size)
+
+
+def _render_track_in_worker(
+        job: Tuple[dict, Tuple[str, ...], dict[str, str] | None]
+        ) -> Tuple[tuple, EncodeStats, Tuple[Path | None, Path | None], Tuple[str, ...]]:
+    """
+    Render and save the cards of one track inside a worker process.
+    Images are written directly by the worker; the job, its encode stats, the paths
+    of the saved sides (read by printable sheets instead of sending the images back)
+    and the sides linked from the card store are sent back.
+    """
+    track, sides, store_keys = job
+    writer = _worker_args["writer"]
+    images = generate_and_save_cards_for_track(track, sides=sides, store_keys=store_keys, **_worker_args)
+    # the job is only done once its files exist
+    writer.flush()
+    filename_base = get_card_filename(track)
+    paths = tuple(
+        _worker_args["output_dir"] / f"{filename_base}_{side}.{writer.encoder.extension}" if img is not None else None
+        for side, img in zip(CARD_SIDES, images)
+    )
+    linked = tuple(side for side, img in zip(CARD_SIDES, images) if isinstance(img, Path))
+    return job, writer.take_stats(), paths, linked
+
+
+def resolve_jobs(jobs: int | str) -> int:
+    """
+    Resolve the number of render processes.
 
-    print(f"Generated cards saved to {output_dir}.")
+    Args:
+        jobs (int | str): Number of processes or "auto" for one per CPU core
+    Returns:
+        int: Number of render processes (at least 1)
+    """
+    if jobs == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(jobs))
+
+
+def generate_and_save_cards_for_playlist(
+        tracks: Iterable[dict], output_dir: Path, design: dict, jobs: int | str = 1, seed: int = 0,
+        manifest: CardManifest | None = None, encoder: CardEncoder | None = None, writer_threads: int = 2,
+        sheets: "A4SheetWriter | None" = None, card_size: int = CARD_SIZE_PX, thumbnail_sizes: Tuple[int, ...] = (),
+        store: CardStore | None = None,
+        ) -> list[dict]:
+    """
+    Generate and save card images for all tracks of a playlist.
+    Tracks may be a lazy iterable; each card is rendered as soon as its track arrives.
+    With more than one job, tracks are rendered by a pool of worker processes;
+    design choices are seeded per track, so the output does not depend on the number of jobs.
+    With a manifest, only card sides whose content hash changed are rendered,
+    and cards of tracks that are no longer part of the playlist are deleted.
+    Images are encoded and written by a background writer pool, so rendering does not wait on I/O.
+    With a sheet writer, printable sheets are built from the rendered images in the same pass.
+    With a card store (and a manifest for the content hashes), sides already stored by any playlist
+    are linked instead of rendered, and newly rendered sides are added to the store.
+
+    Args:
+        tracks (Iterable[dict]): Track metadata dictionaries
+        output_dir (Path): Directory to save the generated card images
+        design (dict): Design configuration for the cards
+        jobs (int | str): Number of render processes, or "auto" for one per CPU core
+        seed (int): Base seed for the random design choices
+        manifest (CardManifest | None): Card manifest of the playlist folder (None = render everything)
+        encoder (CardEncoder | None): Output image encoder (None = default PNG)
+        writer_threads (int): Number of writer threads (0 = write synchronously)
+        sheets (A4SheetWriter | None): Printable sheet writer that receives every card in order
+        card_size (int): Size of the card images (pixels), see render_size_for_dpi
+        thumbnail_sizes (Tuple[int, ...]): Additional smaller image sizes, downscaled from each rendered card
+        store (CardStore | None): Content-addressed card store shared by the playlist folders
+    Returns:
+        list[dict]: The rendered tracks, in order
+    """
+    jobs = resolve_jobs(jobs)
+    encoder = encoder or get_encoder()
+    rendered = []
+    num_rendered_sides = 0
+    num_linked_sides = 0
+    # (key, filename) of rendered sides, added to the store once their files are written
+    to_store = []
+    use_store = store is not None and manifest is not None
+
+    def render_jobs():
+        # pass through all tracks, but only hand out the ones with changed card sides
+        for track in tracks:
+            rendered.append(track)
+            if manifest is None:
+                yield track, CARD_SIDES, None
+                continue
+            filename_base = get_card_filename(track)
+            sides = manifest.sides_to_render(track, filename_base)
+            store_keys = {side: manifest.side_hash(track, side) for side in sides} if use_store else None
+            if sides or sheets is not None:
+                # unchanged cards still pass through in order when building sheets
+                yield track, sides, store_keys
+            else:
+                manifest.record(track, filename_base)
+
+    def on_rendered(
+            track: dict, sides: Tuple[str, ...], store_keys: dict[str, str] | None,
+            images: Tuple[Image.Image | Path | None, Image.Image | Path | None], linked: Tuple[str, ...]
+            ):
+        nonlocal num_rendered_sides, num_linked_sides
+        filename_base = get_card_filename(track)
+        for side in sides:
+            if side in linked:
+                num_linked_sides += 1
+            else:
+                num_rendered_sides += 1
+                if store_keys:
+                    to_store.append((store_keys[side], f"{filename_base}_{side}"))
+        if manifest is not None:
+            manifest.record(track, filename_base)
+        if sheets is not None:
+            if manifest is not None:
+                # unchanged sides: the file the manifest just resolved (and possibly renamed)
+                images = tuple(
+                    manifest.card_path(track["spotify_uri"], side) if img is None else img
+                    for side, img in zip(CARD_SIDES, images)
+                )
+            sheets.add(track, *images)
+
+    if jobs > 1:
+        # spawn: the parent runs pipeline threads, which must not be forked
+        encode_stats = EncodeStats()
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker,
+            initargs=(
+                output_dir, design, seed, encoder, card_size, tuple(thumbnail_sizes), store if use_store else None,
+            ),
+        ) as executor:
+            results = ordered_map(_render_track_in_worker, render_jobs(), executor, max_pending=4 * jobs)
+            for (track, sides, store_keys), stats, paths, linked in results:
+                encode_stats.add(stats)
+                on_rendered(track, sides, store_keys, paths, linked)
+    else:
+        assets_warm = False
+        with CardWriter(encoder, threads=writer_threads, max_pending=4 * max(1, writer_threads)) as writer:
+            for track, sides, store_keys in render_jobs():
+                if sides and not assets_warm:
+                    warm_design_assets(design, card_size)
+                    assets_warm = True
+                images = generate_and_save_cards_for_track(
+                    track, output_dir, design, seed=seed, sides=sides, writer=writer,
+                    card_size=card_size, thumbnail_sizes=thumbnail_sizes,
+                    store=store if use_store else None, store_keys=store_keys,
+                )
+                linked = tuple(side for side, img in zip(CARD_SIDES, images) if isinstance(img, Path))
+                on_rendered(track, sides, store_keys, images, linked)
+        encode_stats = writer.stats
+
+    # all files are written now
+    for key, filename in to_store:
+        store.add(key, encoder.extension, output_dir, filename, tuple(thumbnail_sizes))
+
+    if manifest is not None:
+        removed = manifest.remove_orphans()
+        manifest.save()
+        if removed:
+            print(f"Removed {removed} outdated card images.")
+    CardIndex.scan(output_dir, rendered).save()
+
+    print(f"Rendered {num_rendered_sides} card sides for {len(rendered)} tracks, saved to {output_dir}.")
+    if num_linked_sides:
+        print(f"Linked {num_linked_sides} card sides from the card store.")
+    if encode_stats.files:
+        print(encode_stats.summary(encoder.label))
+    return rendered
 
 
 # Printable A4 sheets
 def calculate_a4_layout(
-        card_size_mm: float = 52.4, margin_mm: float = 0.0
+        card_size_mm: float = CARD_SIZE_MM, margin_mm: float = 0.0
         ) -> dict:
     """
     Calculate card layout on A4 sheet.
@@ -407,66 +833,153 @@ def draw_cut_marks(c: canvas.Canvas, x: float, y: float, card_size: float, mark_
     c.line(x + card_size, y + card_size, x + card_size, y + card_size - mark_length)  # vertical
 
 
+def pdf_volume_path(output_path: Path, volume: int) -> Path:
+    """
+    Path of one volume of a chunked PDF export, e.g. printable_cards_003.pdf.
+    Args:
+        output_path (Path): Path of the (unchunked) PDF
+        volume (int): Volume number (from 1)
+    Returns:
+        Path: Volume file path
+    """
+    return output_path.with_name(f"{output_path.stem}_{volume:03d}{output_path.suffix}")
+
+
+class A4SheetWriter:
+    """
+    Streaming writer for printable A4 sheets.
+
+    Cards are added in order, as in-memory images when they were just rendered (or the paths
+    of the files render workers saved);
+    as soon as a sheet is full its front and back pages are drawn and the images released.
+    Sides given without an image are read from the cards directory.
+    With sheets_per_volume, the output is split into PDF volumes of that many sheets;
+    ReportLab keeps a document in memory until it is saved, so this bounds memory for large decks.
+    Subclasses can draw cards differently by overriding _side_source and _draw_side.
+    """
+    def __init__(
+            self, output_path: Path, cards_dir: Path | None = None, layout: dict | None = None,
+            sheets_per_volume: int | None = None
+            ):
+        """
+        Args:
+            output_path (Path): Output PDF file path (volumes: numbered files next to it)
+            cards_dir (Path | None): Directory of saved card images (for cards added without images)
+            layout (dict | None): Sheet layout (default: calculate_a4_layout())
+            sheets_per_volume (int | None): Sheets per PDF volume (None = a single file)
+        """
+        self.output_path = output_path
+        self.cards_dir = cards_dir
+        self.layout = layout or calculate_a4_layout()
+        self.cards_per_page = self.layout["grid"]["rows"] * self.layout["grid"]["cols"]
+        self.sheets_per_volume = sheets_per_volume
+        self.num_sheets = 0
+        self.volumes: list[Path] = []
+        self._canvas: canvas.Canvas | None = None
+        self._sheet: list[tuple[dict, object, object]] = []
+        self._card_index: CardIndex | None = None
+
+    def _new_canvas(self, path: Path) -> canvas.Canvas:
+        """Start the document of the next output file."""
+        return canvas.Canvas(str(path), pagesize=A4)
+
+    def _current_canvas(self) -> canvas.Canvas:
+        if self._canvas is None:
+            path = pdf_volume_path(self.output_path, len(self.volumes) + 1) if self.sheets_per_volume else self.output_path
+            self._canvas = self._new_canvas(path)
+            self.volumes.append(path)
+        return self._canvas
+
+    def _save_volume(self) -> None:
+        self._current_canvas().save()
+        self._canvas = None
+
+    def _side_source(self, track: dict, side: str, img: Image.Image | Path | None) -> ImageReader | str | None:
+        """What _draw_side needs to draw one card side (None = skip the side)."""
+        if isinstance(img, Path):
+            return str(img)
+        if img is not None:
+            # cards are opaque: RGB halves what the sheet holds in memory
+            return ImageReader(img.convert("RGB") if img.mode != "RGB" else img)
+        if not self.cards_dir:
+            card_path = None
+        else:
+            if self._card_index is None:
+                self._card_index = CardIndex.load(self.cards_dir)
+            card_path = self._card_index.path(track["spotify_uri"], side)
+            if card_path is None or not card_path.exists():
+                # the folder may have changed since the index was loaded (renamed or new cards)
+                self._card_index = CardIndex.load(self.cards_dir, [track])
+                card_path = self._card_index.path(track["spotify_uri"], side)
+        if card_path is None:
+            print(f"Warning: Card image not found: {get_card_filename(track)}_{side}")
+            return None
+        return str(card_path)
+
+    def add(
+            self, track: dict, front_img: Image.Image | Path | None = None, back_img: Image.Image | Path | None = None
+            ) -> None:
+        """
+        Add the next card.
+        Args:
+            track (dict): Track metadata dictionary
+            front_img (Image.Image | Path | None): Rendered front or its saved file (None = read from cards_dir)
+            back_img (Image.Image | Path | None): Rendered back or its saved file (None = read from cards_dir)
+        """
+        self._sheet.append((
+            track,
+            self._side_source(track, "front", front_img),
+            self._side_source(track, "back", back_img),
+        ))
+        if len(self._sheet) == self.cards_per_page:
+            self._emit_sheet()
+
+    def _draw_side(self, source: ImageReader | str, x: float, y: float, size: float) -> None:
+        """Draw one card side with its bottom-left corner at (x, y)."""
+        self._canvas.drawImage(source, x, y, width=size, height=size)
+
+    def _emit_sheet(self) -> None:
+        c = self._current_canvas()
+        card_size_pt = self.layout["card_size_pt"]
+        for side_index, positions in ((1, self.layout["front_positions"]), (2, self.layout["back_positions"])):
+            for card, (x, y) in zip(self._sheet, positions):
+                source = card[side_index]
+                if source is None:
+                    continue
+                self._draw_side(source, x, y, card_size_pt)
+                draw_cut_marks(c, x, y, card_size_pt)
+            c.showPage()
+        self._sheet = []
+        self.num_sheets += 1
+        if self.sheets_per_volume and self.num_sheets % self.sheets_per_volume == 0:
+            self._save_volume()
+
+    def close(self) -> None:
+        """
+        Draw the last (partial) sheet and write the PDF file.
+        """
+        if self._sheet:
+            self._emit_sheet()
+        if self._canvas is not None or not self.volumes:
+            self._save_volume()
+
+    def __enter__(self) -> "A4SheetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
 def generate_a4_pdf(playlist_dir: Path, output_path: Path) -> None:
     """
-    Generate printable A4 PDF sheets with card images.
+    Generate printable A4 PDF sheets from the saved card images of a playlist.
+    (To build the PDF while rendering, pass an A4SheetWriter to generate_and_save_cards_for_playlist.)
 
     Args:
         playlist_dir (Path): Directory containing playlist data
         output_path (Path): Output PDF file path
-    """    
-    # Load data and layout
+    """
     tracks = load_playlist_metadata(playlist_dir)
-    cards_dir = playlist_dir / "cards"
-    layout = calculate_a4_layout()
-
-    # create sheets
-    cards_per_page = layout["grid"]["rows"] * layout["grid"]["cols"]
-    num_sheets = math.ceil(len(tracks) / cards_per_page)
-    c = canvas.Canvas(str(output_path), pagesize=A4)
-    for page in range(num_sheets):
-        # front
-        for i in range(cards_per_page):
-            track_index = page * cards_per_page + i
-            if track_index >= len(tracks):
-                break
-            track = tracks[track_index]
-            filename_base = get_card_filename(track)
-            card_path = cards_dir / f"{filename_base}_front.png"
-            if not card_path.exists():
-                print(f"Warning: Card image not found: {card_path}")
-                continue
-            x, y = layout["front_positions"][i]
-            c.drawImage(
-                str(card_path),
-                x,
-                y,
-                width=layout["card_size_pt"],
-                height=layout["card_size_pt"]
-            )
-            draw_cut_marks(c, x, y, layout["card_size_pt"])
-        c.showPage()
-
-        # back
-        for i in range(cards_per_page):
-            track_index = page * cards_per_page + i
-            if track_index >= len(tracks):
-                break
-            track = tracks[track_index]
-            filename_base = get_card_filename(track)
-            card_path = cards_dir / f"{filename_base}_back.png"
-            if not card_path.exists():
-                print(f"Warning: Card image not found: {card_path}")
-                continue
-            x, y = layout["back_positions"][i]
-            c.drawImage(
-                str(card_path),
-                x,
-                y,
-                width=layout["card_size_pt"],
-                height=layout["card_size_pt"]
-            )
-            draw_cut_marks(c, x, y, layout["card_size_pt"])
-        c.showPage()
-
-    c.save()
\ No newline at end of file
+    with A4SheetWriter(output_path, cards_dir=playlist_dir / "cards") as sheets:
+        for track in tracks:
+            sheets.add(track)
@@ -0,0 +1,251 @@
+# src/cards/manifest.py
+import hashlib
+import json
+import os
+from collections import Counter
+from pathlib import Path
+
+from ..config import CARD_SIZE_PX, resolve_asset_path
+from .assets import get_asset_cache
+from .encoders import CardEncoder, get_encoder
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+# bump when rendering changes in a way that should invalidate existing cards
+RENDER_VERSION = 1
+
+CARD_SIDES = ("front", "back")
+
+# track fields each card side depends on
+_SIDE_FIELDS = {
+    "front": ("name_cleaned", "name_original", "artists", "release_year", "spotify_uri"),
+    "back": ("spotify_uri",),
+}
+
+
+def _hash_json(value) -> str:
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _side_asset_paths(design_side: dict) -> list[str]:
+    """Collect all asset path strings referenced by one side of a design."""
+    paths = []
+    font = design_side.get("typography", {}).get("font_family")
+    if font:
+        paths.append(font)
+    for asset_paths in design_side.get("images", {}).values():
+        paths.extend(asset_paths)
+    return paths
+
+
+def _asset_mtimes(path_strs: list[str]) -> dict[str, float]:
+    """Modification times of the given assets (directories are expanded)."""
+    asset_cache = get_asset_cache()
+    mtimes = {}
+    for path_str in path_strs:
+        path = resolve_asset_path(path_str)
+        if not path:
+            continue
+        files = asset_cache.list_dir(path)
+        for file_path in (files if files is not None else [path]):
+            try:
+                mtimes[str(file_path)] = file_path.stat().st_mtime
+            except OSError:
+                mtimes[str(file_path)] = None
+    return mtimes
+
+
+def _card_files(entry: dict, side: str) -> list[str]:
+    """Card image files of a manifest entry (relative to the cards folder), including thumbnails."""
+    filename = f"{entry['filename']}_{side}.{entry.get('extension', 'png')}"
+    return [filename] + [f"{size}px/{filename}" for size in entry.get("thumbnails", [])]
+
+
+def design_side_digest(design: dict, side: str, card_size: int = CARD_SIZE_PX) -> str:
+    """
+    Hash everything a card side's rendering depends on besides the track:
+    the resolved design subtree, the asset modification times and the card size.
+
+    Args:
+        design (dict): Design configuration
+        side (str): "front" or "back"
+        card_size (int): Size of the card images (pixels)
+    Returns:
+        str: Hex digest
+    """
+    design_side = design.get(side, {})
+    return _hash_json({
+        "render_version": RENDER_VERSION,
+        "card_size": card_size,
+        "design": design_side,
+        "assets": _asset_mtimes(_side_asset_paths(design_side)),
+    })
+
+
+class CardManifest:
+    """
+    Per-card content hashes of a playlist's rendered cards.
+
+    Stored as `manifest.json` in the playlist folder, it records for every
+    track the card filename and one hash per side. A side only needs to be
+    re-rendered when its hash changes.
+    """
+    def __init__(
+            self, playlist_dir: Path, design: dict, seed: int = 0, card_size: int = CARD_SIZE_PX,
+            encoder: CardEncoder | None = None, thumbnail_sizes: tuple[int, ...] = ()
+            ):
+        """
+        Load the existing manifest (if any) and hash the design once per side.
+        Args:
+            playlist_dir (Path): Playlist folder
+            design (dict): Design configuration of this run
+            seed (int): Base seed for the random design choices
+            card_size (int): Size of the card images (pixels)
+            encoder (CardEncoder | None): Output image encoder of this run (None = default PNG)
+            thumbnail_sizes (tuple[int, ...]): Downscaled image sizes saved next to each card
+        """
+        self.path = playlist_dir / MANIFEST_FILENAME
+        self.cards_dir = playlist_dir / "cards"
+        self.seed = seed
+        self.encoder = encoder or get_encoder()
+        self.thumbnail_sizes = sorted(set(thumbnail_sizes))
+        self.previous: dict[str, dict] = self._load()
+        self.cards: dict[str, dict] = {}
+        self._design_digests = {side: design_side_digest(design, side, card_size) for side in CARD_SIDES}
+        self._existing_files = self._scan_cards_dir()
+        self._previous_filenames = Counter(entry.get("filename") for entry in self.previous.values())
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: could not read card manifest '{self.path}', rendering all cards: {e}")
+            return {}
+        if data.get("version") != RENDER_VERSION:
+            return {}
+        return data.get("cards", {})
+
+    def _scan_cards_dir(self) -> set[str]:
+        previous_sizes = {size for entry in self.previous.values() for size in entry.get("thumbnails", [])}
+        files = set()
+        for size in [None, *previous_sizes.union(self.thumbnail_sizes)]:
+            directory = self.cards_dir / f"{size}px" if size else self.cards_dir
+            prefix = f"{size}px/" if size else ""
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory) as entries:
+                files.update(prefix + entry.name for entry in entries if entry.is_file())
+        return files
+
+    def side_hash(self, track: dict, side: str) -> str:
+        """
+        Hash of the inputs of one card side.
+        Args:
+            track (dict): Track metadata dictionary
+            side (str): "front" or "back"
+        Returns:
+            str: Hex digest
+        """
+        fields = {field: track.get(field) for field in _SIDE_FIELDS[side]}
+        return _hash_json([self._design_digests[side], self.seed, self.encoder.settings, fields])
+
+    def sides_to_render(self, track: dict, filename_base: str) -> tuple[str, ...]:
+        """
+        Determine which sides of a track's card changed since the last run.
+        Args:
+            track (dict): Track metadata dictionary
+            filename_base (str): Card filename base of the track
+        Returns:
+            tuple[str, ...]: Sides that need rendering (empty if the card is up to date)
+        """
+        entry = self.previous.get(track["spotify_uri"])
+        if entry and entry.get("filename") != filename_base:
+            entry = self._rename_card(entry, filename_base)
+        if not entry:
+            return CARD_SIDES
+        expected = self._entry(filename_base)
+        return tuple(
+            side for side in CARD_SIDES
+            if entry.get(side) != self.side_hash(track, side)
+            or not self._existing_files.issuperset(_card_files(expected, side))
+        )
+
+    def _rename_card(self, entry: dict, filename_base: str) -> dict | None:
+        """
+        Move the files of a card saved under an older filename to its current name.
+        Returns:
+            dict | None: The entry under the new name, or None if the old files were shared by several tracks
+        """
+        if self._previous_filenames[entry.get("filename")] > 1:
+            return None
+        renamed = {**entry, "filename": filename_base}
+        for side in CARD_SIDES:
+            for old, new in zip(_card_files(entry, side), _card_files(renamed, side)):
+                if old in self._existing_files and new not in self._existing_files:
+                    os.replace(self.cards_dir / old, self.cards_dir / new)
+                    self._existing_files.discard(old)
+                    self._existing_files.add(new)
+        return renamed
+
+    def _entry(self, filename_base: str) -> dict:
+        entry = {"filename": filename_base, "extension": self.encoder.extension}
+        if self.thumbnail_sizes:
+            entry["thumbnails"] = self.thumbnail_sizes
+        return entry
+
+    def record(self, track: dict, filename_base: str) -> None:
+        """
+        Record a track's card as up to date.
+        Args:
+            track (dict): Track metadata dictionary
+            filename_base (str): Card filename base of the track
+        """
+        self.cards[track["spotify_uri"]] = {
+            **self._entry(filename_base),
+            **{side: self.side_hash(track, side) for side in CARD_SIDES},
+        }
+
+    def card_path(self, uri: str, side: str) -> Path | None:
+        """
+        Image file of a card side recorded in this run (under its current, possibly renamed, filename).
+        Args:
+            uri (str): Spotify track URI
+            side (str): "front" or "back"
+        Returns:
+            Path | None: Path of the full-size image, or None if the track is not recorded
+        """
+        entry = self.cards.get(uri)
+        return self.cards_dir / _card_files(entry, side)[0] if entry else None
+
+    def remove_orphans(self) -> int:
+        """
+        Delete card images of the previous run that no longer belong to a recorded track.
+        Returns:
+            int: Number of deleted files
+        """
+        current_files = {
+            filename for entry in self.cards.values() for side in CARD_SIDES for filename in _card_files(entry, side)
+        }
+        removed = 0
+        for entry in self.previous.values():
+            for side in CARD_SIDES:
+                for filename in _card_files(entry, side):
+                    if filename in current_files or filename not in self._existing_files:
+                        continue
+                    (self.cards_dir / filename).unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def save(self) -> None:
+        """
+        Write the manifest of this run (atomically).
+        """
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": RENDER_VERSION, "cards": self.cards}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
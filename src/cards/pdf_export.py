@@ -0,0 +1,129 @@
+# src/cards/pdf_export.py
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ..config import CARD_SIZE_PX
+from .generator import A4SheetWriter, calculate_a4_layout, pdf_volume_path, resolve_jobs
+from .vector_pdf import VectorSheetWriter
+
+
+PDF_MODES = ("raster", "vector")
+
+
+def make_sheet_writer(
+        output_path: Path, mode: str = "raster", cards_dir: Path | None = None, design: dict | None = None,
+        seed: int = 0, card_size: int = CARD_SIZE_PX, sheets_per_volume: int | None = None
+        ) -> A4SheetWriter:
+    """
+    Create the sheet writer for a PDF mode.
+
+    Args:
+        output_path (Path): Output PDF file path
+        mode (str): "raster" (card images) or "vector"
+        cards_dir (Path | None): Directory of saved card images (raster mode)
+        design (dict | None): Design configuration (vector mode)
+        seed (int): Base seed for the random design choices (vector mode)
+        card_size (int): Size of the rendered card images (vector mode: same layout as the images)
+        sheets_per_volume (int | None): Sheets per PDF volume (None = a single file)
+    Returns:
+        A4SheetWriter: Sheet writer
+    """
+    if mode == "vector":
+        return VectorSheetWriter(
+            output_path, design or {}, seed=seed, card_size=card_size, sheets_per_volume=sheets_per_volume
+        )
+    return A4SheetWriter(output_path, cards_dir=cards_dir, sheets_per_volume=sheets_per_volume)
+
+
+def _write_volume(job: tuple) -> Path:
+    """Write one PDF volume (runs in a worker process)."""
+    output_path, tracks, writer_args = job
+    with make_sheet_writer(output_path, **writer_args) as sheets:
+        for track in tracks:
+            sheets.add(track)
+    return output_path
+
+
+def export_printable_pdf(
+        tracks: list[dict], output_path: Path, mode: str = "raster", cards_dir: Path | None = None,
+        design: dict | None = None, seed: int = 0, card_size: int = CARD_SIZE_PX,
+        sheets_per_volume: int | None = None, jobs: int | str = 1, merge: bool = False
+        ) -> list[Path]:
+    """
+    Export printable A4 sheets of saved cards, optionally split into volumes written in parallel.
+
+    Each volume is an independent document of `sheets_per_volume` sheets, so memory
+    stays flat regardless of the deck size; with more than one job, volumes are
+    written by a pool of worker processes.
+
+    Args:
+        tracks (list[dict]): Track metadata dictionaries, in sheet order
+        output_path (Path): Output PDF file path (volumes: numbered files next to it)
+        mode (str): "raster" (card images from cards_dir) or "vector"
+        cards_dir (Path | None): Directory of saved card images (raster mode)
+        design (dict | None): Design configuration (vector mode)
+        seed (int): Base seed for the random design choices (vector mode)
+        card_size (int): Size of the rendered card images (vector mode)
+        sheets_per_volume (int | None): Sheets per PDF volume (None = a single file)
+        jobs (int | str): Number of processes for volumes, or "auto" for one per CPU core
+        merge (bool): Merge the volumes into output_path afterwards (requires pypdf)
+    Returns:
+        list[Path]: Written PDF files
+    """
+    writer_args = {"mode": mode, "cards_dir": cards_dir, "design": design, "seed": seed, "card_size": card_size}
+    if not sheets_per_volume:
+        return [_write_volume((output_path, tracks, writer_args))]
+
+    layout = calculate_a4_layout()
+    cards_per_volume = layout["grid"]["rows"] * layout["grid"]["cols"] * sheets_per_volume
+    num_volumes = max(1, math.ceil(len(tracks) / cards_per_volume))
+    volume_jobs = [
+        (pdf_volume_path(output_path, i + 1), tracks[i * cards_per_volume:(i + 1) * cards_per_volume], writer_args)
+        for i in range(num_volumes)
+    ]
+
+    jobs = min(resolve_jobs(jobs), num_volumes)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+            volumes = list(executor.map(_write_volume, volume_jobs))
+    else:
+        volumes = [_write_volume(job) for job in volume_jobs]
+
+    if merge:
+        merged = merge_pdf_volumes(volumes, output_path)
+        if merged:
+            return [merged]
+    return volumes
+
+
+def merge_pdf_volumes(volumes: list[Path], output_path: Path, remove_volumes: bool = True) -> Path | None:
+    """
+    Merge PDF volumes into one file.
+    Requires the optional 'pypdf' package; without it the volumes are kept as they are.
+
+    Args:
+        volumes (list[Path]): Volume files, in order
+        output_path (Path): Merged PDF file path
+        remove_volumes (bool): Delete the volume files after merging
+    Returns:
+        Path | None: The merged file, or None if pypdf is not installed
+    """
+    try:
+        from pypdf import PdfWriter
+    except ImportError:
+        print("Warning: merging PDF volumes requires 'pypdf' (pip install pypdf), keeping the volumes.")
+        return None
+
+    writer = PdfWriter()
+    for volume in volumes:
+        writer.append(str(volume))
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    writer.close()
+
+    if remove_volumes:
+        for volume in volumes:
+            volume.unlink(missing_ok=True)
+    return output_path
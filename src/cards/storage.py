@@ -1,15 +1,21 @@
 # src/cards/storage.py
 import json
+import os
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from PIL import Image
 
-from ..config import DATA_DIR
+from ..config import DATA_DIR, METADATA_BACKEND
+from ..core.metadata_store import METADATA_STORE_FILENAME, MetadataStore
 from ..core.utils import sanitize_name
+from .encoders import CardEncoder, EncodeStats, encode_and_write, get_encoder
 
 
 def get_playlist_data_dirs(
-        custom_name: str, playlist_name: str, playlist_id: str, overwrite: bool = True
+        custom_name: str, playlist_name: str, playlist_id: str, overwrite: bool = True,
+        keep_existing: bool = False
         ) -> tuple[Path, Path]:
     """
     Determine output directories and check for existing data.
@@ -20,6 +26,7 @@ def get_playlist_data_dirs(
         playlist_name (str): Name of the playlist
         playlist_id (str): Spotify ID of the playlist
         overwrite (bool): Whether to overwrite existing data without prompts
+        keep_existing (bool): Reuse an existing folder as is (for incremental updates)
         
     Returns:
         tuple[Path, Path]: (playlist directory, cards directory)
@@ -32,7 +39,9 @@ def get_playlist_data_dirs(
     cards_folder = playlist_folder / "cards"
 
     # Check for existing data and handle conflicts
-    if playlist_folder.exists() and any(playlist_folder.iterdir()):
+    if keep_existing and playlist_folder.exists():
+        print(f"Updating existing data for '{folder_name}'.")
+    elif playlist_folder.exists() and any(playlist_folder.iterdir()):
         print(f"Data for '{folder_name}' already exists.")
         while True:
             choice = 'O' if overwrite else \
@@ -64,39 +73,204 @@ def get_playlist_data_dirs(
     return playlist_folder, cards_folder
 
 
+def save_playlist_info(info: dict, dir: Path, filename: str = "playlist.json") -> None:
+    """
+    Save playlist information (Spotify ID, snapshot, design settings) next to the metadata.
+
+    Args:
+        info (dict): Playlist information
+        dir (Path): Playlist directory
+        filename (str): Name of the JSON file
+    """
+    info_path = dir / filename
+    with open(info_path, "w", encoding="utf-8") as f:
+        json.dump(info, f, ensure_ascii=False, indent=4)
+
+
+def load_playlist_info(dir: Path, filename: str = "playlist.json") -> dict | None:
+    """
+    Load playlist information saved by save_playlist_info.
+
+    Args:
+        dir (Path): Playlist directory
+        filename (str): Name of the JSON file
+    Returns:
+        dict | None: Playlist information or None if not found
+    """
+    info_path = dir / filename
+    if not info_path.exists():
+        return None
+    with open(info_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def save_metadata(
         tracks: list[dict],
         dir: Path,
-        filename: str = "metadata.json"
+        filename: str = "metadata.json",
+        backend: str = METADATA_BACKEND
         ) -> None:
     """
     Save track metadata to a JSON file in the specified directory.
+    With the sqlite backend, the indexed metadata store is written next to it.
     
     Args:
         tracks (list[dict]): List of track metadata dictionaries
         dir (Path): Directory to save the metadata file
         filename (str): Name of the JSON file to save the metadata
+        backend (str): "json" or "sqlite"
     """
     metadata_path = dir / filename
-    with open(metadata_path, "w", encoding="utf-8") as f:
+    # write to a temporary file first so readers never see a partial file
+    tmp_path = metadata_path.with_suffix(metadata_path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(tracks, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_path, metadata_path)
+    if backend == "sqlite":
+        with MetadataStore(dir / METADATA_STORE_FILENAME) as store:
+            store.write(tracks, source=metadata_path)
     print(f"Saved metadata for {len(tracks)} tracks to {metadata_path}")
 
 
-def save_card_image(img: Image.Image, output_dir: Path, filename: str) -> Path:
+def save_card_image(
+        img: Image.Image, output_dir: Path, filename: str, encoder: CardEncoder | None = None
+        ) -> Path:
     """
-    Save a Pillow Image object as a PNG file.
+    Save a Pillow Image object as an image file (PNG unless another encoder is given).
 
     Args:
         img (Image.Image): Pillow Image object to save
         output_dir (Path): Directory to save the image
         filename (str): Filename without extension
+        encoder (CardEncoder | None): Output encoder (None = default PNG)
 
     Returns:
         Path object of the saved image
     """
+    encoder = encoder or get_encoder()
     output_dir.mkdir(parents=True, exist_ok=True)
-    save_path = output_dir / f"{filename}.png"
-    img.save(save_path, format="PNG")
+    save_path = output_dir / f"{filename}.{encoder.extension}"
+    encode_and_write(img, save_path, encoder)
+
+    return save_path
+
+
+def thumbnail_dir(cards_dir: Path, size: int) -> Path:
+    """
+    Directory of the downscaled card images of one size, e.g. cards/256px.
+    Files are named like the full-size cards.
+    """
+    return cards_dir / f"{size}px"
+
+
+class CardWriter:
+    """
+    Background writer pool for card images.
+
+    Encoding and writing run on worker threads (Pillow releases the GIL while
+    compressing), so rendering continues while earlier cards are saved.
+    At most `max_pending` images are queued; submit blocks beyond that to bound memory.
+    """
+    def __init__(self, encoder: CardEncoder | None = None, threads: int = 2, max_pending: int = 16):
+        """
+        Args:
+            encoder (CardEncoder | None): Output encoder (None = default PNG)
+            threads (int): Number of writer threads (0 = write synchronously on submit)
+            max_pending (int): Maximum number of queued images
+        """
+        self.encoder = encoder or get_encoder()
+        self.stats = EncodeStats()
+        self._executor = ThreadPoolExecutor(threads, thread_name_prefix="card-writer") if threads > 0 else None
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self._error: BaseException | None = None
+
+    def submit(self, img: Image.Image, output_dir: Path, filename: str) -> Path:
+        """
+        Queue an image for saving. The image must not be modified afterwards.
+        Args:
+            img (Image.Image): Card image
+            output_dir (Path): Directory to save the image
+            filename (str): Filename without extension
+        Returns:
+            Path: Path the image will be written to
+        Raises:
+            Exception: The error of a previously failed write
+        """
+        self._raise_error()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        save_path = output_dir / f"{filename}.{self.encoder.extension}"
+
+        if self._executor is None:
+            self._record(encode_and_write(img, save_path, self.encoder))
+            return save_path
+
+        self._slots.acquire()
+        future = self._executor.submit(self._write, img, save_path)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return save_path
+
+    def _write(self, img: Image.Image, save_path: Path) -> None:
+        # runs on a writer thread; stats and errors are recorded before the future completes,
+        # so flush() never returns before they are visible
+        try:
+            stats = encode_and_write(img, save_path, self.encoder)
+        except BaseException as e:
+            with self._lock:
+                self._error = self._error or e
+            return
+        self._record(stats)
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _record(self, stats: EncodeStats) -> None:
+        with self._lock:
+            self.stats.add(stats)
+
+    def _raise_error(self) -> None:
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def flush(self) -> None:
+        """
+        Wait until all queued images are written.
+        Raises:
+            Exception: The error of a failed write
+        """
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+        self._raise_error()
+
+    def take_stats(self) -> EncodeStats:
+        """
+        Return the stats collected so far and reset them.
+        """
+        with self._lock:
+            stats, self.stats = self.stats, EncodeStats()
+        return stats
+
+    def close(self) -> None:
+        """
+        Write all queued images and stop the writer threads.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+        self._raise_error()
+
+    def __enter__(self) -> "CardWriter":
+        return self
 
-    return save_path
\ No newline at end of file
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
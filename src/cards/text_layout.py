@@ -0,0 +1,159 @@
+# src/cards/text_layout.py
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import ImageDraw, ImageFont
+
+from .fonts import get_font
+
+
+@dataclass(frozen=True)
+class TextLayout:
+    """Wrapped lines of a text block, measured once."""
+    lines: tuple[str, ...]
+    line_widths: tuple[float, ...]
+    font_size: int
+    line_height: float
+
+    @property
+    def width(self) -> float:
+        return max(self.line_widths, default=0.0)
+
+    @property
+    def height(self) -> float:
+        return self.line_height * len(self.lines)
+
+
+@lru_cache(maxsize=16384)
+def _word_length(font: ImageFont.FreeTypeFont, word: str) -> float:
+    """Cached advance width of a single word."""
+    return font.getlength(word)
+
+
+def wrap_text(
+        text: str, font: ImageFont.FreeTypeFont, max_width: float, line_height_multiplier: float = 1.2
+        ) -> TextLayout:
+    """
+    Greedily wrap text into lines no wider than max_width, in linear time.
+    Words are measured once (cached per font); words wider than max_width get their own line.
+
+    Args:
+        text (str): Text to wrap
+        font (ImageFont.FreeTypeFont): Font used for measuring
+        max_width (float): Maximum line width (pixels)
+        line_height_multiplier (float): Line height as multiple of the font size
+    Returns:
+        TextLayout: Wrapped and measured lines
+    """
+    space_width = _word_length(font, " ")
+    lines = []
+    line_words = []
+    line_width = 0.0
+
+    for word in text.split():
+        word_width = _word_length(font, word)
+        if not line_words:
+            line_words, line_width = [word], word_width
+        elif line_width + space_width + word_width <= max_width:
+            line_words.append(word)
+            line_width += space_width + word_width
+        else:
+            lines.append(" ".join(line_words))
+            line_words, line_width = [word], word_width
+    if line_words:
+        lines.append(" ".join(line_words))
+
+    # measure each final line once (includes kerning between words)
+    line_widths = tuple(font.getlength(line) for line in lines)
+    return TextLayout(tuple(lines), line_widths, int(font.size), font.size * line_height_multiplier)
+
+
+@lru_cache(maxsize=8192)
+def layout_text(
+        text: str, font_path: str | None, size: int, max_width: float, line_height_multiplier: float = 1.2
+        ) -> TextLayout:
+    """
+    Memoized text layout for (text, font, size, width).
+    Args:
+        text (str): Text to wrap
+        font_path (str | None): Path to the TrueType font (None = default font)
+        size (int): Font size (pixels)
+        max_width (float): Maximum line width (pixels)
+        line_height_multiplier (float): Line height as multiple of the font size
+    Returns:
+        TextLayout: Wrapped and measured lines
+    """
+    return wrap_text(text, get_font(font_path, size), max_width, line_height_multiplier)
+
+
+def fit_text(
+        text: str, font_path: Path | str | None, max_size: int, min_size: int,
+        max_width: float, max_height: float, line_height_multiplier: float = 1.2
+        ) -> TextLayout:
+    """
+    Find the largest font size in [min_size, max_size] whose layout fits the box.
+    Uses binary search over the font size; falls back to min_size if nothing fits.
+
+    Args:
+        text (str): Text to lay out
+        font_path (Path | str | None): Path to the TrueType font (None = default font)
+        max_size (int): Preferred (largest) font size
+        min_size (int): Smallest allowed font size
+        max_width (float): Width of the text box (pixels)
+        max_height (float): Height of the text box (pixels)
+        line_height_multiplier (float): Line height as multiple of the font size
+    Returns:
+        TextLayout: Layout at the chosen font size
+    """
+    font_path = str(font_path) if font_path else None
+    min_size = max(1, min(min_size, max_size))
+
+    def fits(layout: TextLayout) -> bool:
+        return layout.height <= max_height and layout.width <= max_width
+
+    best = layout_text(text, font_path, max_size, max_width, line_height_multiplier)
+    if fits(best):
+        return best
+
+    low, high = min_size, max_size - 1
+    best = layout_text(text, font_path, min_size, max_width, line_height_multiplier)
+    while low <= high:
+        size = (low + high) // 2
+        layout = layout_text(text, font_path, size, max_width, line_height_multiplier)
+        if fits(layout):
+            best = layout
+            low = size + 1
+        else:
+            high = size - 1
+    return best
+
+
+def draw_text_layout(
+        draw: ImageDraw.ImageDraw, layout: TextLayout, font: ImageFont.FreeTypeFont,
+        center_x: float, center_y: float, fill
+        ) -> None:
+    """
+    Draw a laid-out text block, centered around (center_x, center_y).
+    Args:
+        draw (ImageDraw.ImageDraw): Draw context of the target image
+        layout (TextLayout): Text layout (from wrap_text / fit_text)
+        font (ImageFont.FreeTypeFont): Font matching layout.font_size
+        center_x (float): Horizontal center of the block
+        center_y (float): Vertical center of the block
+        fill: Text color
+    """
+    y = center_y - layout.height / 2
+    for line, line_width in zip(layout.lines, layout.line_widths):
+        draw.text((center_x - line_width / 2, y), line, fill=fill, font=font)
+        y += layout.line_height
+
+
+def layout_cache_info() -> dict:
+    """
+    Get hit/miss counters of the layout memo.
+    Returns:
+        dict: {hits, misses, size, max_size}
+    """
+    info = layout_text.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
@@ -0,0 +1,237 @@
+# src/cards/vector_pdf.py
+import hashlib
+import random
+from pathlib import Path
+
+import numpy as np
+from PIL import ImageColor
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from ..config import CARD_SIZE_PX
+from .assets import get_asset_cache
+from .fonts import get_font
+from .generator import A4SheetWriter, plan_card_back, plan_card_front, qr_code_matrix, track_seed
+from .text_layout import TextLayout
+
+
+# built-in PDF font used when a design has no font file
+DEFAULT_PDF_FONT = "Helvetica"
+
+# registered TrueType fonts: font path -> PDF font name
+_pdf_fonts: dict[str, str] = {}
+
+
+def register_pdf_font(font_path: Path | str | None) -> str:
+    """
+    Register a TrueType font with ReportLab (once per process).
+    Registered fonts are embedded as a subset of the used glyphs, once per document.
+
+    Args:
+        font_path (Path | str | None): Path to the TrueType font (None = default font)
+    Returns:
+        str: PDF font name
+    """
+    if not font_path:
+        return DEFAULT_PDF_FONT
+    key = str(font_path)
+    if key not in _pdf_fonts:
+        name = f"{Path(key).stem}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:8]}"
+        try:
+            pdfmetrics.registerFont(TTFont(name, key))
+        except Exception as e:
+            print(f"Warning: could not embed font '{key}', using {DEFAULT_PDF_FONT}: {e}")
+            name = DEFAULT_PDF_FONT
+        _pdf_fonts[key] = name
+    return _pdf_fonts[key]
+
+
+def qr_module_rects(matrix: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """
+    Cover the dark modules of a QR code with few rectangles.
+    Horizontal runs of each row are merged with identical runs of the rows below.
+
+    Args:
+        matrix (np.ndarray): Square boolean module matrix (True = dark)
+    Returns:
+        list[tuple[int, int, int, int]]: Rectangles (column, row, width, height) in modules
+    """
+    rects = []
+    open_runs: dict[tuple[int, int], int] = {}
+    for row, modules in enumerate(matrix):
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], modules.astype(np.int8), [0]))))
+        runs = {}
+        for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            run = (start, end - start)
+            index = open_runs.get(run)
+            if index is None:
+                rects.append((start, row, end - start, 1))
+                index = len(rects) - 1
+            else:
+                col, top, width, height = rects[index]
+                rects[index] = (col, top, width, height + 1)
+            runs[run] = index
+        open_runs = runs
+    return rects
+
+
+class VectorSheetWriter(A4SheetWriter):
+    """
+    Printable A4 sheets drawn as vector graphics instead of embedded card images.
+
+    Backgrounds and the QR border are filled rects, texts are PDF text in the
+    design's font (embedded and subset once) and QR codes are merged vector paths.
+    Background images and logos are embedded once per distinct asset, at the resolution
+    of the rendered cards, and referenced by every card that uses them.
+    Cards use the same design choices (seeded per track) and layout as the rendered images.
+    """
+    def __init__(
+            self, output_path: Path, design: dict, seed: int = 0, card_size: int = CARD_SIZE_PX,
+            layout: dict | None = None, sheets_per_volume: int | None = None
+            ):
+        """
+        Args:
+            output_path (Path): Output PDF file path
+            design (dict): Design configuration of the cards
+            seed (int): Base seed for the random design choices
+            card_size (int): Card size (pixels) the layout is computed for, as in the rendered images
+            layout (dict | None): Sheet layout (default: calculate_a4_layout())
+            sheets_per_volume (int | None): Sheets per PDF volume (None = a single file)
+        """
+        super().__init__(output_path, layout=layout, sheets_per_volume=sheets_per_volume)
+        self.design = design
+        self.seed = seed
+        self.card_size = card_size
+        self._asset_forms: dict[tuple[str, tuple[int, int]], str | None] = {}
+
+    def _new_canvas(self, path: Path):
+        # embedded assets belong to one document
+        self._asset_forms.clear()
+        return super()._new_canvas(path)
+
+    def _side_source(self, track: dict, side: str, img=None) -> dict:
+        rng = random.Random(track_seed(track, side, self.seed))
+        if side == "front":
+            return plan_card_front(track, self.design, card_size=self.card_size, rng=rng)
+        return plan_card_back(track, self.design, card_size=self.card_size, rng=rng)
+
+    def _draw_side(self, plan: dict, x: float, y: float, size: float) -> None:
+        c = self._canvas
+        scale = size / plan["card_size"]
+        c.saveState()
+        # card pixel coordinates: origin top-left, y down
+        c.translate(x, y + size)
+        c.scale(scale, -scale)
+        if "text_color" in plan:
+            self._draw_front(plan)
+        else:
+            self._draw_back(plan)
+        c.restoreState()
+
+    def _set_fill(self, color: str) -> None:
+        rgb = ImageColor.getrgb(color)
+        alpha = rgb[3] / 255 if len(rgb) == 4 else 1
+        self._canvas.setFillColorRGB(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255, alpha=alpha)
+
+    def _asset_form(self, path: Path, size: tuple[int, int]) -> str | None:
+        """
+        Embed an image asset once, at the resolution of the rendered cards, as a form XObject.
+        Returns:
+            str | None: Form name (unit square), or None if the image cannot be loaded
+        """
+        key = (str(path), size)
+        if key not in self._asset_forms:
+            try:
+                img = get_asset_cache().get_image(path, size)
+            except Exception as e:
+                print(f"Warning: could not load image '{path}': {e}")
+                self._asset_forms[key] = None
+                return None
+            name = f"asset{len(self._asset_forms)}"
+            c = self._canvas
+            c.beginForm(name, 0, 0, 1, 1)
+            c.drawImage(ImageReader(img), 0, 0, width=1, height=1, mask="auto")
+            c.endForm()
+            self._asset_forms[key] = name
+        return self._asset_forms[key]
+
+    def _draw_asset(self, path: Path | None, box: tuple[int, int, int, int]) -> None:
+        """Draw an image asset into a (left, top, right, bottom) box."""
+        if not path:
+            return
+        left, top, right, bottom = box
+        name = self._asset_form(path, (right - left, bottom - top))
+        if name is None:
+            return
+        c = self._canvas
+        c.saveState()
+        # forms are drawn upright: flip back around the box
+        c.translate(left, bottom)
+        c.scale(right - left, top - bottom)
+        c.doForm(name)
+        c.restoreState()
+
+    def _draw_text(self, text: str, font_path: Path | None, font_size: int, center_x: float, baseline: float) -> None:
+        c = self._canvas
+        c.saveState()
+        # text is drawn upright: flip back around the baseline
+        c.translate(center_x, baseline)
+        c.scale(1, -1)
+        c.setFont(register_pdf_font(font_path), font_size)
+        c.drawCentredString(0, 0, text)
+        c.restoreState()
+
+    def _draw_text_layout(self, layout: TextLayout, font_path: Path | None, center_x: float, center_y: float) -> None:
+        ascent, _ = get_font(font_path, layout.font_size).getmetrics()
+        top = center_y - layout.height / 2
+        for line in layout.lines:
+            self._draw_text(line, font_path, layout.font_size, center_x, top + ascent)
+            top += layout.line_height
+
+    def _draw_front(self, plan: dict) -> None:
+        c = self._canvas
+        card_size = plan["card_size"]
+        font_path = plan["font_path"]
+
+        self._set_fill(plan["background_color"])
+        c.rect(0, 0, card_size, card_size, stroke=0, fill=1)
+        self._draw_asset(plan["bg_path"], (0, 0, card_size, card_size))
+
+        self._set_fill(plan["text_color"])
+        for block in ("title", "artists"):
+            layout, center_x, center_y = plan[block]
+            self._draw_text_layout(layout, font_path, center_x, center_y)
+
+        # centered between ascender and descender, like the "mm" anchor of the rendered card
+        year, year_size, center_x, center_y = plan["year"]
+        ascent, descent = get_font(font_path, year_size).getmetrics()
+        self._draw_text(year, font_path, year_size, center_x, center_y + (ascent - descent) / 2)
+
+    def _draw_back(self, plan: dict) -> None:
+        c = self._canvas
+        card_size = plan["card_size"]
+
+        self._set_fill(plan["background_color"])
+        c.rect(0, 0, card_size, card_size, stroke=0, fill=1)
+        self._draw_asset(plan["bg_path"], (0, 0, card_size, card_size))
+
+        left, top, right, bottom = plan["frame_box"]
+        self._set_fill(plan["border_color"])
+        c.rect(left, top, right - left, bottom - top, stroke=0, fill=1)
+
+        # QR code: light background, then all dark modules as one path
+        qr_x, qr_y = plan["qr_position"]
+        qr_size = plan["qr_size"]
+        self._set_fill("white")
+        c.rect(qr_x, qr_y, qr_size, qr_size, stroke=0, fill=1)
+
+        matrix = qr_code_matrix(plan["spotify_uri"], border=0)
+        module = qr_size / len(matrix)
+        path = c.beginPath()
+        for col, row, width, height in qr_module_rects(matrix):
+            path.rect(qr_x + col * module, qr_y + row * module, width * module, height * module)
+        self._set_fill("black")
+        c.drawPath(path, stroke=0, fill=1)
+
+        self._draw_asset(plan["logo_path"], plan["logo_box"])
@@ -0,0 +1,48 @@
+# src/cli/atlas.py
+import time
+
+from ..core.data_loader import load_playlist_metadata
+from ..cards.atlas import ATLAS_MAX_PAGE_SIZE, DEFAULT_TILE_SIZE, build_card_atlas
+from ..cards.encoders import IMAGE_FORMATS, get_encoder
+from ..config import DATA_DIR
+from .create import positive_int_arg
+
+
+
+def build_atlas(args):
+    """
+    Pack the card images of an existing playlist folder into a texture atlas for the game.
+    """
+    playlist_dir = DATA_DIR / "playlists" / args.folder
+    tracks = load_playlist_metadata(playlist_dir)
+    if not tracks:
+        print(f"No metadata found in '{playlist_dir}'.")
+        return
+
+    try:
+        encoder = get_encoder(args.image_format, quality=args.quality)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    start = time.perf_counter()
+    index_path = build_card_atlas(
+        tracks, playlist_dir / "cards", tile_size=args.tile_size, max_page_size=args.page_size, encoder=encoder
+    )
+    print(f"Saved atlas index to {index_path} in {time.perf_counter() - start:.1f}s.")
+
+
+def add_atlas_parser(subparsers):
+    """
+    Add the 'atlas' subcommand parser.
+    """
+    parser = subparsers.add_parser(
+        'atlas',
+        help='Pack the card images of a playlist folder into a texture atlas for the game'
+    )
+    parser.add_argument("--folder", type=str, required=True, help="Playlist folder name")
+    parser.add_argument("--tile-size", type=positive_int_arg, default=DEFAULT_TILE_SIZE, help=f"Size of a card side in the atlas (default {DEFAULT_TILE_SIZE}px, uses cards/<size>px/ thumbnails if present)")
+    parser.add_argument("--page-size", type=positive_int_arg, default=ATLAS_MAX_PAGE_SIZE, help=f"Maximum atlas page width/height (default {ATLAS_MAX_PAGE_SIZE}px)")
+    parser.add_argument("--image-format", choices=IMAGE_FORMATS, default="jpeg", help="Atlas page format")
+    parser.add_argument("--quality", type=int, default=90, help="JPEG quality 1-100 or WebP compression effort 0-100")
+    parser.set_defaults(func=build_atlas)
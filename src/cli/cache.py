@@ -0,0 +1,58 @@
+# src/cli/cache.py
+from ..core.release_cache import ReleaseCache
+from ..core.catalog import LibraryCatalog
+from ..config import RELEASE_CACHE_TTL_DAYS
+
+
+
+def cache_stats(args):
+    """
+    Print statistics of the release lookup cache.
+    """
+    cache = ReleaseCache(ttl_days=args.ttl_days)
+    stats = cache.stats()
+    cache.close()
+
+    print(f"Release cache: {stats['path']}")
+    print(f"  Entries:          {stats['entries']}")
+    print(f"  Expired:          {stats['expired']} (TTL {stats['ttl_days']} days)")
+    print(f"  Need validation:  {stats['validate_release']}")
+    print(f"  Size:             {stats['size_bytes'] / 1024:.1f} KiB")
+
+    catalog = LibraryCatalog(ttl_days=args.ttl_days)
+    catalog_stats = catalog.stats()
+    catalog.close()
+    print(f"Library catalog: {catalog_stats['path']}")
+    print(f"  Tracks:           {catalog_stats['tracks']} ({catalog_stats['expired']} expired)")
+    print(f"  Playlists:        {catalog_stats['playlists']} ({catalog_stats['references']} playlist entries)")
+    print(f"  Size:             {catalog_stats['size_bytes'] / 1024:.1f} KiB")
+
+
+def cache_prune(args):
+    """
+    Remove expired (or all) entries from the release lookup cache.
+    """
+    cache = ReleaseCache(ttl_days=args.ttl_days)
+    removed = cache.prune(prune_all=args.all)
+    cache.close()
+    print(f"Removed {removed} entries from the release cache.")
+
+
+def add_cache_parser(subparsers):
+    """
+    Add the 'cache' subcommand parser.
+    """
+    parser = subparsers.add_parser(
+        'cache',
+        help='Inspect or prune the release lookup cache'
+    )
+    cache_subparsers = parser.add_subparsers(dest='cache_command', required=True)
+
+    stats_parser = cache_subparsers.add_parser('stats', help='Show cache statistics')
+    stats_parser.add_argument("--ttl-days", type=float, default=RELEASE_CACHE_TTL_DAYS, help="Entry lifetime in days")
+    stats_parser.set_defaults(func=cache_stats)
+
+    prune_parser = cache_subparsers.add_parser('prune', help='Remove expired cache entries')
+    prune_parser.add_argument("--ttl-days", type=float, default=RELEASE_CACHE_TTL_DAYS, help="Entry lifetime in days")
+    prune_parser.add_argument("--all", action="store_true", help="Remove all entries")
+    prune_parser.set_defaults(func=cache_prune)
@@ -1,9 +1,46 @@
 # src/cli/create.py
-from ..core.spotify_client import get_playlist_info, get_playlist_tracks
-from ..core.metadata import clean_playlist_metadata
-from ..cards.storage import save_metadata, get_playlist_data_dirs
-from ..cards.generator import generate_and_save_cards_for_playlist, generate_a4_pdf
-from ..config import get_design, load_designs
+import argparse
+
+from ..core.spotify_client import get_playlist_info, iter_playlist_tracks
+from ..core.metadata import iter_clean_playlist_metadata
+from ..core.pipeline import prefetch
+from ..core.catalog import get_library_catalog
+from ..cards.storage import save_metadata, save_playlist_info, get_playlist_data_dirs
+from ..cards.manifest import CardManifest
+from ..cards.encoders import IMAGE_FORMATS, get_encoder
+from ..cards.generator import generate_and_save_cards_for_playlist, render_size_for_dpi
+from ..cards.pdf_export import PDF_MODES, make_sheet_writer, merge_pdf_volumes
+from ..cards.atlas import build_card_atlas
+from ..cards.card_store import get_card_store
+from ..config import CARD_SIZE_PX, get_design, load_designs
+
+
+def jobs_arg(value: str) -> int | str:
+    """
+    Parse a '--jobs' value: a positive number or "auto".
+    """
+    if value == "auto":
+        return value
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number or 'auto', got '{value}'")
+    return jobs
+
+
+def positive_int_arg(value: str) -> int:
+    """
+    Parse a positive integer argument, e.g. '--pdf-volume-sheets'.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got '{value}'")
+    return number
 
 
 def get_input_or_default(prompt, arg_value, default="", skip_prompts=False):
@@ -21,6 +58,29 @@ def create_cards(args):
     skip_prompts = args.skip_prompts
     overwrite = True if skip_prompts else args.overwrite
 
+    # encoder options of other formats would be silently ignored
+    format_options = (
+        ("--png-compress-level", args.png_compress_level is not None, ("png",)),
+        ("--optimize", args.optimize, ("png", "jpeg")),
+        ("--quality", args.quality is not None, ("webp", "jpeg")),
+    )
+    unsupported = [flag for flag, given, formats in format_options if given and args.image_format not in formats]
+    if unsupported:
+        print(f"Error: {', '.join(unsupported)} cannot be used with --image-format {args.image_format}")
+        return
+
+    try:
+        encoder = get_encoder(
+            args.image_format, compress_level=args.png_compress_level, optimize=args.optimize, quality=args.quality
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    # render size: derived from the print resolution, or the default size
+    card_size = render_size_for_dpi(args.dpi) if args.dpi else CARD_SIZE_PX
+    thumbnail_sizes = tuple(sorted(set(args.thumbnail_sizes or ())))
+
     playlist_input = get_input_or_default(
         "Enter playlist URL or ID: ", 
         args.playlist, 
@@ -47,7 +107,8 @@ def create_cards(args):
         custom_name, 
         playlist_info['name'], 
         playlist_info['id'], 
-        overwrite=overwrite
+        overwrite=overwrite,
+        keep_existing=args.incremental
     )
     
     # choose design option
@@ -73,19 +134,65 @@ def create_cards(args):
         print(f"Design option '{design_option}' not found. Using 'simple' design.")
     design = get_design(design_option, validate=args.validate_design)
 
-    # fetch playlist tracks
-    raw_tracks = get_playlist_tracks(playlist_input)
-    tracks = clean_playlist_metadata(raw_tracks)
+    # streaming pipeline: fetch -> clean -> render, with bounded queues between stages
+    # tracks already in the library catalog (from any playlist) are not cleaned and looked up again
+    catalog = get_library_catalog()
+    reused_uris = set()
 
-    # save track metadata to JSON file
-    save_metadata(tracks, dir=playlist_dir)
+    def known_track(uri: str) -> dict | None:
+        track = catalog.get_track(uri)
+        if track is not None:
+            reused_uris.add(uri)
+        return track
+
+    raw_tracks = prefetch(iter_playlist_tracks(playlist_input))
+    clean_tracks = prefetch(iter_clean_playlist_metadata(
+        raw_tracks, workers=args.lookup_workers, use_cache=not args.no_cache,
+        known_tracks=None if args.no_cache else known_track
+    ))
+
+    # generate and save cards (front and back) for each track as it arrives
+    # the manifest skips cards whose content did not change since the last run
+    # images are encoded and written in the background while the next cards render
+    # printable sheets are built from the same in-memory renders, one sheet at a time
+    manifest = CardManifest(
+        playlist_dir, design, seed=args.seed, card_size=card_size, encoder=encoder, thumbnail_sizes=thumbnail_sizes
+    )
+    pdf_output_path = cards_dir / "printable_cards.pdf"
+    sheets = make_sheet_writer(
+        pdf_output_path, args.pdf_mode, cards_dir=cards_dir, design=design, seed=args.seed,
+        card_size=card_size, sheets_per_volume=args.pdf_volume_sheets
+    ) if args.generate_printable else None
+    tracks = generate_and_save_cards_for_playlist(
+        clean_tracks, cards_dir, design=design, jobs=args.jobs, seed=args.seed, manifest=manifest,
+        encoder=encoder, writer_threads=args.writer_threads, sheets=sheets,
+        card_size=card_size, thumbnail_sizes=thumbnail_sizes, store=None if args.no_card_store else get_card_store()
+    )
+    if sheets is not None:
+        sheets.close()
+        pdf_paths = sheets.volumes
+        if args.merge_pdf and len(pdf_paths) > 1:
+            merged = merge_pdf_volumes(pdf_paths, pdf_output_path)
+            pdf_paths = [merged] if merged else pdf_paths
+        if len(pdf_paths) == 1:
+            print(f"Generated printable PDF at {pdf_paths[0]}")
+        else:
+            print(f"Generated {len(pdf_paths)} printable PDF volumes in {cards_dir}")
+
+    # pack the cards into a texture atlas for fast game loading
+    if args.build_atlas:
+        build_card_atlas(tracks, cards_dir)
 
-    # generate and save cards (front and back) for each track
-    generate_and_save_cards_for_playlist(tracks, cards_dir, design=design)
-    if args.generate_printable:
-        pdf_output_path = cards_dir / "printable_cards.pdf"
-        generate_a4_pdf(playlist_dir, pdf_output_path)
-        print(f"Generated printable PDF at {pdf_output_path}")
+    # save track metadata to JSON file once all tracks are final
+    save_metadata(tracks, dir=playlist_dir)
+    save_playlist_info(
+        {
+            **playlist_info, "design": design_option, "seed": args.seed, "image_format": dict(encoder.settings),
+            "card_size": card_size, "thumbnail_sizes": list(thumbnail_sizes),
+        },
+        dir=playlist_dir
+    )
+    catalog.save_playlist(playlist_dir, tracks, playlist_info, reused_uris=reused_uris)
 
 
 def add_create_parser(subparsers):
@@ -101,6 +208,23 @@ def add_create_parser(subparsers):
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing data without prompts")
     parser.add_argument("--design", type=str, help="Card design option")
     parser.add_argument("--generate-printable", action="store_true", help="Generate printable PDF sheets of cards")
+    parser.add_argument("--pdf-mode", choices=PDF_MODES, default="raster", help="Printable PDF from card images (raster) or as vector shapes, text and QR codes (vector)")
+    parser.add_argument("--pdf-volume-sheets", type=positive_int_arg, help="Split the printable PDF into volumes of N sheets")
+    parser.add_argument("--merge-pdf", action="store_true", help="Merge PDF volumes into one file (requires pypdf)")
     parser.add_argument("--validate-design", action="store_true", help="Validate design configuration and warn about missing fields")
+    parser.add_argument("--lookup-workers", type=positive_int_arg, default=1, help="Number of concurrent release year lookups")
+    parser.add_argument("--incremental", action="store_true", help="Keep existing cards and only re-render changed ones")
+    parser.add_argument("--jobs", type=jobs_arg, default=1, help="Number of render processes (N or 'auto')")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for random design choices (colors, backgrounds)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the release lookup cache")
+    parser.add_argument("--no-card-store", action="store_true", help="Render all cards instead of linking identical ones from the shared card store")
+    parser.add_argument("--image-format", choices=IMAGE_FORMATS, default="png", help="Card image format (webp is lossless)")
+    parser.add_argument("--png-compress-level", type=int, help="PNG compression level 0-9 (default 6)")
+    parser.add_argument("--optimize", action="store_true", help="PNG/JPEG: extra optimization pass for smaller files")
+    parser.add_argument("--quality", type=int, help="JPEG quality 1-100 (default 95) or WebP compression effort 0-100")
+    parser.add_argument("--dpi", type=positive_int_arg, help=f"Render cards for this print resolution (default: {CARD_SIZE_PX}px, ~388 DPI)")
+    parser.add_argument("--thumbnail-sizes", type=positive_int_arg, nargs="+", help="Also save downscaled cards of these sizes, e.g. 256 (saved to cards/<size>px/)")
+    parser.add_argument("--build-atlas", action="store_true", help="Pack the cards into a texture atlas for fast game loading")
+    parser.add_argument("--writer-threads", type=positive_int_arg, default=2, help="Number of background image writer threads")
     parser.add_argument("--skip-prompts", action="store_true", help="Skip interactive prompts and use defaults")
     parser.set_defaults(func=create_cards)
\ No newline at end of file
@@ -2,6 +2,11 @@
 import argparse
 from .create import add_create_parser
 from .play import add_play_parser
+from .cache import add_cache_parser
+from .store import add_store_parser
+from .sync import add_sync_parser
+from .pdf import add_pdf_parser
+from .atlas import add_atlas_parser
 
 
 def main():
@@ -22,7 +27,12 @@ def main():
     
     # Add subcommand parsers
     add_create_parser(subparsers)
+    add_sync_parser(subparsers)
+    add_pdf_parser(subparsers)
+    add_atlas_parser(subparsers)
     add_play_parser(subparsers)
+    add_cache_parser(subparsers)
+    add_store_parser(subparsers)
     
     # Parse arguments and call appropriate function
     args = parser.parse_args()
@@ -0,0 +1,54 @@
+# src/cli/pdf.py
+import time
+
+from ..core.data_loader import load_playlist_metadata
+from ..cards.storage import load_playlist_info
+from ..cards.pdf_export import PDF_MODES, export_printable_pdf
+from ..config import CARD_SIZE_PX, DATA_DIR, get_design
+from .create import jobs_arg, positive_int_arg
+
+
+
+def export_pdf(args):
+    """
+    Export printable A4 sheets of an existing playlist folder.
+    """
+    playlist_dir = DATA_DIR / "playlists" / args.folder
+    tracks = load_playlist_metadata(playlist_dir)
+    if not tracks:
+        print(f"No metadata found in '{playlist_dir}'.")
+        return
+
+    # vector sheets are drawn from the design, with the same seed as the card images
+    info = load_playlist_info(playlist_dir) or {}
+    cards_dir = playlist_dir / "cards"
+    output_path = cards_dir / "printable_cards.pdf"
+
+    start = time.perf_counter()
+    paths = export_printable_pdf(
+        tracks, output_path, mode=args.mode, cards_dir=cards_dir,
+        design=get_design(info.get("design", "simple")), seed=info.get("seed", 0),
+        card_size=info.get("card_size", CARD_SIZE_PX),
+        sheets_per_volume=args.volume_sheets, jobs=args.jobs, merge=args.merge,
+    )
+    elapsed = time.perf_counter() - start
+
+    for path in paths:
+        print(f"Generated printable PDF at {path}")
+    print(f"Exported {len(tracks)} cards in {elapsed:.1f}s.")
+
+
+def add_pdf_parser(subparsers):
+    """
+    Add the 'pdf' subcommand parser.
+    """
+    parser = subparsers.add_parser(
+        'pdf',
+        help='Export printable A4 sheets of an existing playlist folder'
+    )
+    parser.add_argument("--folder", type=str, required=True, help="Playlist folder name")
+    parser.add_argument("--mode", choices=PDF_MODES, default="raster", help="Card images (raster) or vector shapes, text and QR codes (vector)")
+    parser.add_argument("--volume-sheets", type=positive_int_arg, help="Split the output into PDF volumes of N sheets")
+    parser.add_argument("--jobs", type=jobs_arg, default=1, help="Number of processes writing volumes (N or 'auto')")
+    parser.add_argument("--merge", action="store_true", help="Merge the volumes into one file (requires pypdf)")
+    parser.set_defaults(func=export_pdf)
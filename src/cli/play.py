@@ -1,5 +1,5 @@
 # src/cli/play.py
-from ..core.data_loader import get_available_playlists, load_playlist_metadata
+from ..core.data_loader import get_available_playlists, list_playlists, load_playlist_metadata, query_playlist_metadata
 from ..config import DATA_DIR
 
 
@@ -9,18 +9,18 @@ def play_game(args):
     Main function for playing the timeline game.
     """
     if args.list:
-        playlists = get_available_playlists(DATA_DIR / "playlists")
+        playlists = list_playlists(DATA_DIR / "playlists", rescan=args.rescan)
         if not playlists:
             print("No playlists found. Create one first with 'spoticards create'")
             return
         print("\nAvailable playlists:")
         for p in playlists:
-            print(f"  - {p}")
+            print(f"  - {p['folder']} ({p['num_tracks']} tracks)")
         return
     
     # Get playlist folder
     if not args.folder:
-        playlists = get_available_playlists(DATA_DIR / "playlists")
+        playlists = get_available_playlists(DATA_DIR / "playlists", rescan=args.rescan)
         if not playlists:
             print("No playlists found. Create one first with 'spoticards create'")
             return
@@ -41,9 +41,13 @@ def play_game(args):
         print(f"Playlist folder not found: {folder}")
         return
     
-    tracks = load_playlist_metadata(playlist_path)
+    if args.years or args.artist:
+        start_year, end_year = args.years or (None, None)
+        tracks = query_playlist_metadata(playlist_path, start_year=start_year, end_year=end_year, artist=args.artist)
+    else:
+        tracks = load_playlist_metadata(playlist_path)
     if not tracks:
-        print(f"No metadata found in {folder}")
+        print(f"No matching tracks found in {folder}" if args.years or args.artist else f"No metadata found in {folder}")
         return
     
     print(f"Loaded {len(tracks)} tracks from '{folder}'")
@@ -63,4 +67,7 @@ def add_play_parser(subparsers):
     )
     parser.add_argument("--folder", type=str, help="Playlist folder name to play with")
     parser.add_argument("--list", action="store_true", help="List available playlists")
+    parser.add_argument("--rescan", action="store_true", help="Compare the playlist folders with the library catalog before listing them")
+    parser.add_argument("--years", type=int, nargs=2, metavar=("START", "END"), help="Only play with tracks released in this range, e.g. 1970 1979")
+    parser.add_argument("--artist", type=str, help="Only play with tracks by this artist")
     parser.set_defaults(func=play_game)
\ No newline at end of file
@@ -0,0 +1,49 @@
+# src/cli/store.py
+from ..cards.card_store import get_card_store, referenced_keys
+from ..config import DATA_DIR
+
+
+def _playlist_keys() -> set[str]:
+    """Store keys recorded by the card manifests of all playlist folders."""
+    playlists_dir = DATA_DIR / "playlists"
+    if not playlists_dir.is_dir():
+        return set()
+    return referenced_keys(d for d in playlists_dir.iterdir() if d.is_dir())
+
+
+def store_stats(args):
+    """
+    Print statistics of the shared card store.
+    """
+    stats = get_card_store().stats(referenced_keys=_playlist_keys())
+    print(f"Card store: {stats['path']}")
+    print(f"  Images:           {stats['blobs']}")
+    print(f"  Unreferenced:     {stats['unreferenced']} ({stats['unreferenced_bytes'] / 1024 / 1024:.1f} MiB)")
+    print(f"  Size:             {stats['size_bytes'] / 1024 / 1024:.1f} MiB")
+
+
+def store_gc(args):
+    """
+    Delete card images from the store that no playlist folder uses any more.
+    """
+    removed, freed = get_card_store().gc(dry_run=args.dry_run, referenced_keys=_playlist_keys())
+    action = "Would remove" if args.dry_run else "Removed"
+    print(f"{action} {removed} unreferenced card images ({freed / 1024 / 1024:.1f} MiB) from the card store.")
+
+
+def add_store_parser(subparsers):
+    """
+    Add the 'store' subcommand parser.
+    """
+    parser = subparsers.add_parser(
+        'store',
+        help='Inspect or garbage-collect the shared card store'
+    )
+    store_subparsers = parser.add_subparsers(dest='store_command', required=True)
+
+    stats_parser = store_subparsers.add_parser('stats', help='Show card store statistics')
+    stats_parser.set_defaults(func=store_stats)
+
+    gc_parser = store_subparsers.add_parser('gc', help='Remove card images no playlist folder uses')
+    gc_parser.add_argument("--dry-run", action="store_true", help="Only report what would be removed")
+    gc_parser.set_defaults(func=store_gc)
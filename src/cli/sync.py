@@ -0,0 +1,123 @@
+# src/cli/sync.py
+from spotipy.exceptions import SpotifyException
+
+from ..core.spotify_client import get_playlist_info, get_playlist_track_uris, get_tracks_by_uri
+from ..core.metadata import clean_playlist_metadata
+from ..core.catalog import get_library_catalog
+from ..core.data_loader import get_available_playlists, load_playlist_metadata
+from ..cards.storage import save_metadata, save_playlist_info, load_playlist_info
+from ..cards.manifest import CardManifest
+from ..cards.encoders import encoder_from_settings
+from ..cards.generator import generate_and_save_cards_for_playlist
+from ..cards.atlas import CardAtlas, build_card_atlas
+from ..cards.card_store import get_card_store
+from ..config import CARD_SIZE_PX, DATA_DIR, get_design
+from .create import jobs_arg, positive_int_arg
+
+
+
+def sync_playlist(args):
+    """
+    Bring an existing playlist folder up to date with its Spotify playlist.
+    Only added tracks are looked up and rendered, cards of removed tracks are deleted.
+    """
+    playlists_dir = DATA_DIR / "playlists"
+    folders = [args.folder] if args.folder else get_available_playlists(playlists_dir)
+    if not folders:
+        print("No playlists found. Create one first with 'spoticards create'")
+        return
+
+    for folder in folders:
+        # one failing playlist does not stop the others
+        try:
+            sync_playlist_folder(playlists_dir / folder, args)
+        except (SpotifyException, OSError, ValueError) as e:
+            print(f"Error: could not sync '{folder}': {e}")
+
+
+def sync_playlist_folder(playlist_dir, args) -> None:
+    """
+    Sync a single playlist folder.
+    """
+    info = load_playlist_info(playlist_dir)
+    if not info:
+        print(f"Skipping '{playlist_dir.name}': no playlist.json found, re-create it with 'spoticards create'")
+        return
+
+    # one API call if nothing changed
+    playlist_info = get_playlist_info(info["id"])
+    if playlist_info["snapshot_id"] == info.get("snapshot_id") and not args.force:
+        print(f"'{playlist_dir.name}' is up to date.")
+        return
+
+    # diff the current track list against the saved metadata by URI
+    existing_tracks = load_playlist_metadata(playlist_dir) or []
+    existing_by_uri = {track["spotify_uri"]: track for track in existing_tracks}
+    uris = list(dict.fromkeys(get_playlist_track_uris(info["id"])))  # drop duplicates, keep order
+
+    added_uris = [uri for uri in uris if uri not in existing_by_uri]
+    num_removed = len(existing_by_uri.keys() - set(uris))
+    print(f"'{playlist_dir.name}': {len(added_uris)} added, {num_removed} removed tracks.")
+
+    # added tracks already in the library catalog are reused, release lookups only for new ones
+    catalog = get_library_catalog()
+    added_by_uri = {} if args.no_cache else catalog.get_tracks(added_uris)
+    new_uris = [uri for uri in added_uris if uri not in added_by_uri]
+    # only the newly looked up tracks count as fresh in the catalog
+    reused_uris = existing_by_uri.keys() | added_by_uri.keys()
+    if added_by_uri:
+        print(f"{len(added_by_uri)} added tracks found in the library catalog.")
+    added_tracks = clean_playlist_metadata(
+        get_tracks_by_uri(new_uris), workers=args.lookup_workers, use_cache=not args.no_cache
+    ) if new_uris else []
+    added_by_uri.update((track["spotify_uri"], track) for track in added_tracks)
+
+    tracks = [
+        existing_by_uri.get(uri) or added_by_uri[uri]
+        for uri in uris
+        if uri in existing_by_uri or uri in added_by_uri
+    ]
+
+    # render added cards, delete cards of removed tracks
+    seed = info.get("seed", 0)
+    design = get_design(info.get("design", "simple"))
+    encoder = encoder_from_settings(info.get("image_format"))
+    card_size = info.get("card_size", CARD_SIZE_PX)
+    thumbnail_sizes = tuple(info.get("thumbnail_sizes", ()))
+    manifest = CardManifest(
+        playlist_dir, design, seed=seed, card_size=card_size, encoder=encoder, thumbnail_sizes=thumbnail_sizes
+    )
+    cards_dir = playlist_dir / "cards"
+    cards_dir.mkdir(parents=True, exist_ok=True)
+    generate_and_save_cards_for_playlist(
+        tracks, cards_dir, design=design, jobs=args.jobs, seed=seed, manifest=manifest, encoder=encoder,
+        card_size=card_size, thumbnail_sizes=thumbnail_sizes, store=None if args.no_card_store else get_card_store()
+    )
+
+    # keep an existing atlas in step with the cards
+    atlas = CardAtlas.load(cards_dir)
+    if atlas is not None:
+        build_card_atlas(
+            tracks, cards_dir, tile_size=atlas.tile_size, encoder=encoder_from_settings(atlas.image_format)
+        )
+
+    save_metadata(tracks, dir=playlist_dir)
+    save_playlist_info({**info, **playlist_info}, dir=playlist_dir)
+    catalog.save_playlist(playlist_dir, tracks, playlist_info, reused_uris=reused_uris)
+
+
+def add_sync_parser(subparsers):
+    """
+    Add the 'sync' subcommand parser.
+    """
+    parser = subparsers.add_parser(
+        'sync',
+        help='Update existing playlist folders with added and removed tracks'
+    )
+    parser.add_argument("--folder", type=str, help="Playlist folder name to sync (default: all)")
+    parser.add_argument("--force", action="store_true", help="Sync even if the playlist snapshot is unchanged")
+    parser.add_argument("--lookup-workers", type=positive_int_arg, default=1, help="Number of concurrent release year lookups")
+    parser.add_argument("--jobs", type=jobs_arg, default=1, help="Number of render processes (N or 'auto')")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the release lookup cache")
+    parser.add_argument("--no-card-store", action="store_true", help="Render all cards instead of linking identical ones from the shared card store")
+    parser.set_defaults(func=sync_playlist)
@@ -8,7 +8,10 @@ _project_root = Path(__file__).parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from config.settings import CONFIG_DIR, ASSETS_DIR, DATA_DIR
+from config.settings import (
+    CONFIG_DIR, ASSETS_DIR, DATA_DIR, CACHE_DIR, RELEASE_CACHE_PATH, RELEASE_CACHE_TTL_DAYS,
+    CARD_SIZE_MM, CARD_SIZE_PX, METADATA_BACKEND, LIBRARY_CATALOG_PATH, CARD_STORE_DIR
+)
 
 
 CONFIG_PATH = CONFIG_DIR / "design_config.json"
@@ -0,0 +1,239 @@
+# src/core/catalog.py
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from ..config import LIBRARY_CATALOG_PATH, RELEASE_CACHE_TTL_DAYS
+
+
+class LibraryCatalog:
+    """
+    Library-wide SQLite catalog of cleaned tracks and the playlist folders that use them.
+
+    Tracks are stored once per Spotify URI; playlists reference them by URI and position.
+    Tracks already in the catalog do not need to be cleaned and looked up again
+    until they expire after `ttl_days` (like release cache entries), and the list of
+    playlists is read from it instead of scanning the data folder.
+    """
+    def __init__(self, path: Path = LIBRARY_CATALOG_PATH, ttl_days: float = RELEASE_CACHE_TTL_DAYS):
+        """
+        Open (and create if needed) the catalog database.
+        Args:
+            path (Path): Path of the SQLite database file
+            ttl_days (float): Age in days after which tracks are looked up again
+        """
+        self.path = Path(path)
+        self.ttl_days = ttl_days
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tracks (
+                spotify_uri TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS playlists (
+                path TEXT PRIMARY KEY,
+                parent TEXT NOT NULL,
+                folder TEXT NOT NULL,
+                playlist_id TEXT,
+                name TEXT,
+                num_tracks INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS playlist_tracks (
+                playlist TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                spotify_uri TEXT NOT NULL,
+                PRIMARY KEY (playlist, position)
+            );
+            CREATE TABLE IF NOT EXISTS scanned_dirs (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS playlists_parent ON playlists (parent);
+            CREATE INDEX IF NOT EXISTS playlist_tracks_uri ON playlist_tracks (spotify_uri);
+            """
+        )
+        self._conn.commit()
+
+    @property
+    def _ttl_seconds(self) -> float:
+        return self.ttl_days * 24 * 60 * 60
+
+    def get_track(self, uri: str) -> dict | None:
+        """
+        Look up a cleaned track.
+        Args:
+            uri (str): Spotify track URI
+        Returns:
+            dict | None: Track metadata (a new copy) or None if not in the catalog or expired
+        """
+        min_updated = time.time() - self._ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tracks WHERE spotify_uri = ? AND updated_at >= ?", (uri, min_updated)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_tracks(self, uris: list[str]) -> dict[str, dict]:
+        """
+        Look up several cleaned tracks.
+        Args:
+            uris (list[str]): Spotify track URIs
+        Returns:
+            dict[str, dict]: Track metadata of the URIs found in the catalog (and not expired)
+        """
+        found = {}
+        min_updated = time.time() - self._ttl_seconds
+        with self._lock:
+            # stay below SQLite's bound parameter limit
+            for i in range(0, len(uris), 500):
+                batch = uris[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT spotify_uri, data FROM tracks WHERE spotify_uri IN ({','.join('?' * len(batch))}) "
+                    "AND updated_at >= ?",
+                    [*batch, min_updated]
+                ).fetchall()
+                found.update((uri, json.loads(data)) for uri, data in rows)
+        return found
+
+    def save_playlist(
+            self, playlist_dir: Path, tracks: list[dict], info: dict | None = None, reused_uris: set[str] = frozenset()
+            ) -> None:
+        """
+        Store the tracks of a playlist folder and its track list.
+        Args:
+            playlist_dir (Path): Playlist folder
+            tracks (list[dict]): Cleaned track metadata dictionaries, in playlist order
+            info (dict | None): Playlist information (Spotify ID and name)
+            reused_uris (set[str]): Tracks that were not looked up in this run (from the catalog or an
+                earlier run); they are only added if missing and keep their age
+        """
+        playlist_dir = Path(playlist_dir).resolve()
+        info = info or {}
+        now = time.time()
+        with self._lock, self._conn:
+            rows = [
+                (track["spotify_uri"], json.dumps(track, ensure_ascii=False, separators=(",", ":")), now)
+                for track in tracks
+            ]
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tracks VALUES (?, ?, ?)", (row for row in rows if row[0] in reused_uris)
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?)", (row for row in rows if row[0] not in reused_uris)
+            )
+            self._conn.execute("DELETE FROM playlist_tracks WHERE playlist = ?", (str(playlist_dir),))
+            self._conn.executemany(
+                "INSERT INTO playlist_tracks VALUES (?, ?, ?)",
+                ((str(playlist_dir), i, track["spotify_uri"]) for i, track in enumerate(tracks))
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlists VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (str(playlist_dir), str(playlist_dir.parent), playlist_dir.name, info.get("id"),
+                 info.get("name"), len(tracks), now)
+            )
+
+    def remove_playlist(self, playlist_dir: Path) -> None:
+        """
+        Remove a playlist folder from the catalog (its tracks stay cataloged).
+        Args:
+            playlist_dir (Path): Playlist folder
+        """
+        path = str(Path(playlist_dir).resolve())
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM playlist_tracks WHERE playlist = ?", (path,))
+            self._conn.execute("DELETE FROM playlists WHERE path = ?", (path,))
+
+    def list_playlists(self, data_dir: Path) -> list[dict]:
+        """
+        Playlist folders in a data directory.
+        Args:
+            data_dir (Path): Directory containing the playlist folders
+        Returns:
+            list[dict]: {folder, path, playlist_id, name, num_tracks, updated_at}, sorted by folder name
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT folder, path, playlist_id, name, num_tracks, updated_at FROM playlists "
+                "WHERE parent = ? ORDER BY folder",
+                (str(Path(data_dir).resolve()),)
+            ).fetchall()
+        keys = ("folder", "path", "playlist_id", "name", "num_tracks", "updated_at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def scanned_mtime(self, data_dir: Path) -> int | None:
+        """
+        Modification time of a data directory when its playlist folders were last compared with the catalog.
+        Args:
+            data_dir (Path): Directory containing the playlist folders
+        Returns:
+            int | None: Modification time (ns), or None if the directory was never scanned
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns FROM scanned_dirs WHERE path = ?", (str(Path(data_dir).resolve()),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_scanned_mtime(self, data_dir: Path, mtime_ns: int) -> None:
+        """
+        Record that the playlist folders of a data directory were compared with the catalog.
+        Args:
+            data_dir (Path): Directory containing the playlist folders
+            mtime_ns (int): Modification time (ns) of the directory before the scan
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scanned_dirs VALUES (?, ?)", (str(Path(data_dir).resolve()), mtime_ns)
+            )
+
+    def stats(self) -> dict:
+        """
+        Get catalog statistics.
+        Returns:
+            dict: Number of tracks (and expired ones), playlists and playlist entries, database size
+        """
+        min_updated = time.time() - self._ttl_seconds
+        with self._lock:
+            tracks, expired = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(updated_at < ?), 0) FROM tracks", (min_updated,)
+            ).fetchone()
+            playlists, = self._conn.execute("SELECT COUNT(*) FROM playlists").fetchone()
+            references, = self._conn.execute("SELECT COUNT(*) FROM playlist_tracks").fetchone()
+        return {
+            "path": str(self.path),
+            "tracks": tracks,
+            "expired": expired,
+            "ttl_days": self.ttl_days,
+            "playlists": playlists,
+            "references": references,
+            "size_bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_catalog: LibraryCatalog | None = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_library_catalog() -> LibraryCatalog:
+    """
+    Return the process-wide library catalog at LIBRARY_CATALOG_PATH.
+    Returns:
+        LibraryCatalog: Shared catalog instance
+    """
+    global _default_catalog
+    with _default_catalog_lock:
+        if _default_catalog is None:
+            _default_catalog = LibraryCatalog()
+    return _default_catalog
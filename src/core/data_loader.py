@@ -1,45 +1,191 @@
 # src/core/data_loader.py
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from ..config import METADATA_BACKEND
+from .catalog import get_library_catalog
+from .metadata_store import METADATA_STORE_FILENAME, MetadataStore, artist_keys
+from .release_cache import normalize_key
 
-def get_available_playlists(data_dir: Path) -> list[str]:
+
+def list_playlists(data_dir: Path, rescan: bool = False) -> list[dict]:
     """
-    List all available playlist folders in the data directory.
+    List the playlist folders in the data directory, read from the library catalog.
+    The folder names are only compared with the catalog when the data directory changed
+    since the last comparison (or on rescan): folders it does not know yet
+    (e.g. from an older version) are added, folders that no longer exist are dropped.
     
     Args:
         data_dir (Path): Base data directory containing playlist folders
+        rescan (bool): Compare the folders with the catalog even if the directory did not change
         
     Returns:
-        list[str]: List of playlist folder names
+        list[dict]: Catalog entries ({folder, name, num_tracks, ...}), sorted by folder name
     """
     if not data_dir.exists():
         return []
+
+    catalog = get_library_catalog()
+    playlists = catalog.list_playlists(data_dir)
+    dir_mtime = data_dir.stat().st_mtime_ns
+    if not rescan and catalog.scanned_mtime(data_dir) == dir_mtime:
+        return playlists
+
+    folders = {playlist_dir.name: playlist_dir for playlist_dir in _scan_playlist_folders(data_dir)}
+    cataloged = {playlist["folder"] for playlist in playlists}
+
+    for playlist in playlists:
+        if playlist["folder"] not in folders:
+            catalog.remove_playlist(Path(playlist["path"]))
+    missing = folders.keys() - cataloged
+    for folder in missing:
+        playlist_dir = folders[folder]
+        tracks = load_playlist_metadata(playlist_dir) or []
+        catalog.save_playlist(
+            playlist_dir, tracks, _load_metadata_json(playlist_dir / "playlist.json"),
+            reused_uris={track["spotify_uri"] for track in tracks}
+        )
+    catalog.set_scanned_mtime(data_dir, dir_mtime)
+
+    if missing or len(playlists) != len(cataloged & folders.keys()):
+        playlists = catalog.list_playlists(data_dir)
+    return playlists
+
+
+def get_available_playlists(data_dir: Path, rescan: bool = False) -> list[str]:
+    """
+    List all available playlist folders in the data directory.
     
-    playlists = [
-        d.name for d in data_dir.iterdir() 
-        if d.is_dir() and (d / "metadata.json").exists()
-    ]
-    return sorted(playlists)
+    Args:
+        data_dir (Path): Base data directory containing playlist folders
+        rescan (bool): Compare the folders with the library catalog even if the directory did not change
+        
+    Returns:
+        list[str]: List of playlist folder names
+    """
+    return [playlist["folder"] for playlist in list_playlists(data_dir, rescan)]
+
+
+def _scan_playlist_folders(data_dir: Path) -> list[Path]:
+    return sorted(
+        d for d in data_dir.iterdir()
+        if d.is_dir() and ((d / "metadata.json").exists() or (d / METADATA_STORE_FILENAME).exists())
+    )
 
 
-def load_playlist_metadata(playlist_folder: Path) -> Optional[list[dict]]:
+def _load_metadata_json(metadata_path: Path) -> Optional[list[dict]]:
+    if not metadata_path.exists():
+        return None
+    with open(metadata_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def open_metadata_store(playlist_folder: Path) -> Optional[MetadataStore]:
     """
-    Load track metadata from a playlist folder.
+    Open the indexed metadata store of a playlist folder.
+    The store is (re)built from metadata.json if it is missing or older than the file.
     
     Args:
         playlist_folder (Path): Path to playlist folder
         
     Returns:
-        list[dict] | None: List of track metadata or None if not found
+        MetadataStore | None: The open store (close it after use) or None if the folder has no metadata
     """
     metadata_path = playlist_folder / "metadata.json"
+    store_path = playlist_folder / METADATA_STORE_FILENAME
+    if not store_path.exists() and not metadata_path.exists():
+        return None
+
+    store = MetadataStore(store_path)
+    if not store.is_current(metadata_path):
+        tracks = _load_metadata_json(metadata_path)
+        if tracks is None:
+            store.close()
+            return None
+        store.write(tracks, source=metadata_path)
+    return store
+
+
+def load_playlist_metadata(playlist_folder: Path, backend: str = METADATA_BACKEND) -> Optional[list[dict]]:
+    """
+    Load track metadata from a playlist folder.
     
-    if not metadata_path.exists():
+    Args:
+        playlist_folder (Path): Path to playlist folder
+        backend (str): "sqlite" to read the indexed store (built from metadata.json once), "json" for the file
+        
+    Returns:
+        list[dict] | None: List of track metadata or None if not found
+    """
+    if backend != "sqlite":
+        return _load_metadata_json(playlist_folder / "metadata.json")
+
+    store = open_metadata_store(playlist_folder)
+    if store is None:
         return None
+    with store:
+        return store.load_all()
+
+
+def iter_playlist_metadata(
+        playlist_folder: Path, batch_size: int = 1000, backend: str = METADATA_BACKEND
+        ) -> Iterator[dict]:
+    """
+    Stream the track metadata of a playlist folder, in playlist order.
+    With the sqlite backend, tracks are read in batches instead of all at once.
     
-    with open(metadata_path, "r", encoding="utf-8") as f:
-        tracks = json.load(f)
+    Args:
+        playlist_folder (Path): Path to playlist folder
+        batch_size (int): Tracks read per batch
+        backend (str): "sqlite" or "json"
+        
+    Yields:
+        dict: Track metadata dictionary
+    """
+    if backend != "sqlite":
+        yield from _load_metadata_json(playlist_folder / "metadata.json") or []
+        return
+
+    store = open_metadata_store(playlist_folder)
+    if store is None:
+        return
+    with store:
+        yield from store.iter_tracks(batch_size)
+
+
+def query_playlist_metadata(
+        playlist_folder: Path, start_year: int | None = None, end_year: int | None = None,
+        artist: str | None = None, backend: str = METADATA_BACKEND
+        ) -> Optional[list[dict]]:
+    """
+    Load the tracks of a playlist folder that match all given filters, e.g. the 1970s.
     
-    return tracks
\ No newline at end of file
+    Args:
+        playlist_folder (Path): Path to playlist folder
+        start_year (int | None): Earliest release year (inclusive)
+        end_year (int | None): Latest release year (inclusive)
+        artist (str | None): Artist name (case-insensitive, one of the track's artists)
+        backend (str): "sqlite" (indexed query) or "json" (filters all tracks)
+        
+    Returns:
+        list[dict] | None: Matching track metadata or None if not found
+    """
+    if backend == "sqlite":
+        store = open_metadata_store(playlist_folder)
+        if store is None:
+            return None
+        with store:
+            return store.query(start_year=start_year, end_year=end_year, artist=artist)
+
+    tracks = _load_metadata_json(playlist_folder / "metadata.json")
+    if tracks is None:
+        return None
+    # same predicates as MetadataStore.query: no year never matches a year filter, artists compared by normalize_key
+    artist_key = normalize_key(artist) if artist is not None else None
+    return [
+        track for track in tracks
+        if (start_year is None or (track.get("release_year") is not None and track["release_year"] >= start_year))
+        and (end_year is None or (track.get("release_year") is not None and track["release_year"] <= end_year))
+        and (artist_key is None or artist_key in artist_keys(track.get("artists", "")))
+    ]
@@ -1,6 +1,13 @@
 # src/core/metadata.py
 import re
-from .spotify_client import get_earliest_release_spotify
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+from .pipeline import ordered_map
+from .release_cache import get_release_cache
+from .spotify_client import (
+    authenticate_spotify, get_earliest_release_spotify, get_request_stats, reset_request_stats
+)
 
 
 
@@ -74,20 +81,90 @@ def clean_track_metadata(track: dict, log: bool = True) -> dict | None:
     return clean_track
 
 
-def clean_playlist_metadata(raw_tracks: list[dict], get_original_release: bool = True) -> list[dict]:
+def iter_clean_playlist_metadata(
+        raw_tracks: Iterable[dict], get_original_release: bool = True, workers: int = 1,
+        use_cache: bool = True, known_tracks: Callable[[str], dict | None] | None = None
+        ) -> Iterator[dict]:
+    """
+    Clean and standardize track metadata for playlist, one track at a time.
+    Each track is yielded as soon as its metadata is final, in playlist order.
+    Args:
+        raw_tracks (Iterable[dict]): Raw track metadata dictionaries (consumed lazily)
+        get_original_release (bool): Whether to verify and get earliest release year from Spotify
+        workers (int): Number of concurrent release lookups (1 = sequential)
+        use_cache (bool): Whether to use the persistent release cache
+        known_tracks (Callable[[str], dict | None] | None): Returns already cleaned metadata by URI
+            (e.g. LibraryCatalog.get_track); known tracks skip cleaning and the release lookup
+    Yields:
+        dict: Cleaned track metadata dictionary
+    """
+    num_raw = 0
+    num_clean = 0
+    num_known = 0
+
+    def iter_valid_tracks():
+        # (track, is_known) pairs
+        nonlocal num_raw, num_known
+        for track in raw_tracks:
+            num_raw += 1
+            uri = track.get("spotify_uri")
+            known_track = known_tracks(uri) if known_tracks and uri else None
+            if known_track is not None:
+                num_known += 1
+                yield known_track, True
+                continue
+            clean_track = clean_track_metadata(track)
+            if clean_track is not None:
+                yield clean_track, False
+
+    def print_summary():
+        known = f" ({num_known} known from the library catalog)" if num_known else ""
+        print(f"Cleaned metadata for {num_clean}/{num_raw} tracks{known}.")
+
+    if not get_original_release:
+        for clean_track, _ in iter_valid_tracks():
+            num_clean += 1
+            yield clean_track
+        print_summary()
+        return
+
+    reset_request_stats()
+    sp = authenticate_spotify(max_connections=workers)
+
+    def lookup(item: tuple[dict, bool]) -> dict:
+        track, is_known = item
+        return track if is_known else get_earliest_release_spotify(track, sp, use_cache)
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="release-lookup") as executor:
+            # bounded window of in-flight lookups, results stay in playlist order
+            for clean_track in ordered_map(lookup, iter_valid_tracks(), executor, max_pending=4 * workers):
+                num_clean += 1
+                yield clean_track
+    else:
+        for item in iter_valid_tracks():
+            num_clean += 1
+            yield lookup(item)
+
+    print(f"Release lookups: {get_request_stats().summary()}")
+    if use_cache:
+        cache_stats = get_release_cache().stats()
+        print(f"Release cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    print_summary()
+
+
+def clean_playlist_metadata(
+        raw_tracks: list[dict], get_original_release: bool = True, workers: int = 1,
+        use_cache: bool = True
+        ) -> list[dict]:
     """
     Clean and standardize track metadata for playlist.
     Args:
         raw_tracks (list[dict]): List of raw track metadata dictionaries
         get_original_release (bool): Whether to verify and get earliest release year from Spotify
+        workers (int): Number of concurrent release lookups (1 = sequential)
+        use_cache (bool): Whether to use the persistent release cache
     Returns:
-        list[dict]: List of cleaned track metadata dictionaries
+        list[dict]: List of cleaned track metadata dictionaries (in playlist order)
     """
-    clean_tracks = []
-    for track in raw_tracks:
-        clean_track = clean_track_metadata(track)
-        if get_original_release:
-            clean_track = get_earliest_release_spotify(clean_track)
-        clean_tracks.append(clean_track)
-    print(f"Cleaned metadata for {len(clean_tracks)}/{len(raw_tracks)} tracks.")
-    return clean_tracks
\ No newline at end of file
+    return list(iter_clean_playlist_metadata(raw_tracks, get_original_release, workers, use_cache))
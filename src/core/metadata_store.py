@@ -0,0 +1,191 @@
+# src/core/metadata_store.py
+import json
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+
+from .release_cache import normalize_key
+
+
+METADATA_STORE_FILENAME = "metadata.sqlite3"
+METADATA_STORE_VERSION = 2
+
+
+def artist_keys(artists: str) -> list[str]:
+    """
+    Normalized names a track matches in an artist filter.
+    Artists are stored joined with ", ", so names containing a comma ("Earth, Wind & Fire")
+    cannot be split off reliably: every run of consecutive parts is a key.
+    Args:
+        artists (str): Joined artist names of a track
+    Returns:
+        list[str]: Distinct normalized keys
+    """
+    parts = [part for part in artists.split(", ") if part]
+    names = (", ".join(parts[start:end]) for start in range(len(parts)) for end in range(start + 1, len(parts) + 1))
+    return list(dict.fromkeys(normalize_key(name) for name in names))
+
+
+class MetadataStore:
+    """
+    Indexed SQLite copy of a playlist's metadata.json.
+
+    Tracks are stored in playlist order as compact JSON, with indexed columns for
+    the Spotify URI, the release year and the (normalized) artist names, so tracks
+    can be streamed or queried without parsing the whole playlist.
+    The modification time and size of the metadata.json it was written with are
+    recorded, so a hand-edited JSON file takes precedence over a stale store.
+    """
+    def __init__(self, path: Path):
+        """
+        Open (and create if needed) the store.
+        Args:
+            path (Path): Path of the SQLite database file
+        """
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        # readers (e.g. a paused stream) do not block rewriting the store
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tracks (
+                position INTEGER PRIMARY KEY,
+                spotify_uri TEXT NOT NULL,
+                release_year INTEGER,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS track_artists (
+                artist TEXT NOT NULL,
+                position INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS tracks_uri ON tracks (spotify_uri);
+            CREATE INDEX IF NOT EXISTS tracks_year ON tracks (release_year);
+            CREATE INDEX IF NOT EXISTS track_artists_artist ON track_artists (artist);
+            """
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, tracks: list[dict], source: Path | None = None) -> None:
+        """
+        Replace the stored tracks (in one transaction).
+        Args:
+            tracks (list[dict]): Track metadata dictionaries, in playlist order
+            source (Path | None): The metadata.json written with the same tracks
+        """
+        stat = source.stat() if source is not None and source.exists() else None
+        with self._conn:
+            self._conn.execute("DELETE FROM tracks")
+            self._conn.execute("DELETE FROM track_artists")
+            self._conn.executemany(
+                "INSERT INTO tracks VALUES (?, ?, ?, ?)",
+                (
+                    (i, track["spotify_uri"], track.get("release_year"),
+                     json.dumps(track, ensure_ascii=False, separators=(",", ":")))
+                    for i, track in enumerate(tracks)
+                )
+            )
+            self._conn.executemany(
+                "INSERT INTO track_artists VALUES (?, ?)",
+                (
+                    (key, i)
+                    for i, track in enumerate(tracks)
+                    for key in artist_keys(track.get("artists", ""))
+                )
+            )
+            self._conn.executemany("INSERT OR REPLACE INTO info VALUES (?, ?)", [
+                ("version", str(METADATA_STORE_VERSION)),
+                ("source", json.dumps([stat.st_mtime_ns, stat.st_size] if stat else None)),
+            ])
+
+    def is_current(self, source: Path) -> bool:
+        """
+        Check whether the store holds the tracks of a metadata.json file.
+        Args:
+            source (Path): metadata.json of the playlist
+        Returns:
+            bool: True if the store was written together with the file (or the file does not exist)
+        """
+        info = dict(self._conn.execute("SELECT key, value FROM info").fetchall())
+        if info.get("version") != str(METADATA_STORE_VERSION):
+            return False
+        if not source.exists():
+            return True
+        stat = source.stat()
+        return json.loads(info.get("source") or "null") == [stat.st_mtime_ns, stat.st_size]
+
+    def count(self) -> int:
+        """Number of stored tracks."""
+        return self._conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+
+    def load_all(self) -> list[dict]:
+        """
+        All tracks in playlist order.
+        Returns:
+            list[dict]: Track metadata dictionaries
+        """
+        return self._select("SELECT data FROM tracks ORDER BY position")
+
+    def _select(self, sql: str, params: list | tuple = ()) -> list[dict]:
+        # the rows (fetched in order) are joined into one JSON document, parsed in C instead of once per row
+        rows = self._conn.execute(sql, params).fetchall()
+        return json.loads("[" + ",".join(data for (data,) in rows) + "]")
+
+    def iter_tracks(self, batch_size: int = 1000) -> Iterator[dict]:
+        """
+        Stream the tracks in playlist order without loading all of them.
+        Args:
+            batch_size (int): Rows fetched per batch
+        Yields:
+            dict: Track metadata dictionary
+        """
+        cursor = self._conn.execute("SELECT data FROM tracks ORDER BY position")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for (data,) in rows:
+                yield json.loads(data)
+
+    def get(self, uri: str) -> dict | None:
+        """
+        Look up a track by Spotify URI.
+        Returns:
+            dict | None: Track metadata or None if not stored
+        """
+        row = self._conn.execute("SELECT data FROM tracks WHERE spotify_uri = ?", (uri,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+            self, start_year: int | None = None, end_year: int | None = None, artist: str | None = None
+            ) -> list[dict]:
+        """
+        Tracks matching all given filters, in playlist order (uses the indexes).
+        Tracks without a release year never match a year filter.
+        Args:
+            start_year (int | None): Earliest release year (inclusive)
+            end_year (int | None): Latest release year (inclusive)
+            artist (str | None): Artist name (case-insensitive, one of the track's artists)
+        Returns:
+            list[dict]: Matching track metadata dictionaries
+        """
+        conditions, params = [], []
+        if start_year is not None:
+            conditions.append("release_year >= ?")
+            params.append(start_year)
+        if end_year is not None:
+            conditions.append("release_year <= ?")
+            params.append(end_year)
+        if artist is not None:
+            conditions.append("position IN (SELECT position FROM track_artists WHERE artist = ?)")
+            params.append(normalize_key(artist))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._select(f"SELECT data FROM tracks {where} ORDER BY position", params)
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,101 @@
+# src/core/pipeline.py
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# default number of items buffered between two pipeline stages
+DEFAULT_QUEUE_SIZE = 100
+
+_DONE = object()
+
+
+class _StageError:
+    """Wraps an exception raised inside a background stage."""
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = DEFAULT_QUEUE_SIZE) -> Iterator[T]:
+    """
+    Run an iterable in a background thread and yield its items through a bounded queue.
+    The producer runs ahead of the consumer by at most `maxsize` items, so
+    consecutive stages overlap instead of running one after another.
+    Exceptions raised by the producer are re-raised in the consumer.
+    Args:
+        iterable (Iterable): Producing stage (usually a generator)
+        maxsize (int): Maximum number of buffered items
+    Yields:
+        Items of the iterable, in order
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # wait for free space, but give up once the consumer is gone
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_StageError(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, name="pipeline-stage", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+def ordered_map(
+        func: Callable[[T], R], iterable: Iterable[T], executor: Executor, max_pending: int
+        ) -> Iterator[R]:
+    """
+    Lazily map a function over an iterable using an executor.
+    Results are yielded in input order as soon as they are available, with at
+    most `max_pending` submitted but not yet yielded items.
+    Args:
+        func (Callable): Function applied to every item
+        iterable (Iterable): Input items (consumed lazily)
+        executor (Executor): Thread or process pool running `func`
+        max_pending (int): Maximum number of in-flight items
+    Yields:
+        Results of `func`, in input order
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(func, item))
+
+        # yield finished results at the head without blocking
+        while pending and pending[0].done():
+            yield pending.popleft().result()
+
+        # bound the number of in-flight items
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
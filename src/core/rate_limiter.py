@@ -0,0 +1,150 @@
+# src/core/rate_limiter.py
+import threading
+import time
+from dataclasses import dataclass, asdict
+
+from spotipy.exceptions import SpotifyException
+
+
+
+@dataclass
+class RequestStats:
+    """Counters for the API requests of a single run."""
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    throttle_wait: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.retries} retries, "
+            f"{self.throttled} throttled, {self.throttle_wait:.1f}s throttle wait (all workers)"
+        )
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by all Spotify API calls.
+
+    On a 429 response all callers pause for the `Retry-After` period and the
+    request rate is halved; every successful request slowly raises it again
+    up to the configured maximum (AIMD).
+    """
+    def __init__(
+            self, rate: float = 10.0, burst: int = 10, min_rate: float = 0.5,
+            max_retries: int = 5, default_retry_after: float = 1.0
+            ):
+        """
+        Initialize the rate limiter.
+        Args:
+            rate (float): Maximum sustained requests per second
+            burst (int): Maximum number of requests that may be sent back to back
+            min_rate (float): Lower bound for the adaptive request rate
+            max_retries (int): Number of retries for a throttled request
+            default_retry_after (float): Wait time (s) if the response has no Retry-After header
+        """
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+
+        self._rate = rate
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = RequestStats()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reset_stats(self) -> None:
+        """Start a new set of per-run counters."""
+        with self._lock:
+            self.stats = RequestStats()
+
+    def acquire(self) -> None:
+        """
+        Block until a request may be sent.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.stats.requests += 1
+                    self.stats.throttle_wait += waited
+                    return
+
+                delay = max(self._blocked_until - now, (1 - self._tokens) / self._rate)
+
+            time.sleep(delay)
+            waited += delay
+
+    def _on_success(self) -> None:
+        with self._lock:
+            # additive increase
+            self._rate = min(self.max_rate, self._rate + 0.1)
+
+    def _on_throttled(self, retry_after: float) -> None:
+        with self._lock:
+            # multiplicative decrease, and pause every caller until Retry-After passed
+            self._rate = max(self.min_rate, self._rate / 2)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            self.stats.throttled += 1
+
+    def _retry_after(self, error: SpotifyException) -> float:
+        headers = error.headers or {}
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            return self.default_retry_after
+
+    @staticmethod
+    def _is_throttled(error: SpotifyException) -> bool:
+        # spotipy also reports urllib3's exhausted 5xx retries as a 429 without headers ("Max Retries")
+        if error.http_status != 429:
+            return False
+        headers = error.headers or {}
+        return "Retry-After" in headers or "retry-after" in headers or "Max Retries" not in str(error.msg)
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call a Spotify API function under the rate limit, retrying throttled requests.
+        Args:
+            func: Spotify client method to call
+            *args, **kwargs: Arguments passed to the method
+        Returns:
+            The result of the API call
+        Raises:
+            SpotifyException: If the request fails or is still throttled after all retries
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except SpotifyException as e:
+                if not self._is_throttled(e) or attempt >= self.max_retries:
+                    raise
+                self._on_throttled(self._retry_after(e))
+                attempt += 1
+                with self._lock:
+                    self.stats.retries += 1
+                continue
+
+            self._on_success()
+            return result
+
+    def snapshot(self) -> dict:
+        """Return a copy of the current counters as a dict."""
+        with self._lock:
+            return asdict(self.stats)
@@ -0,0 +1,169 @@
+# src/core/release_cache.py
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+from ..config import RELEASE_CACHE_PATH, RELEASE_CACHE_TTL_DAYS
+
+
+
+def normalize_key(text: str) -> str:
+    """
+    Normalize a title or artist name for use as cache key.
+    Args:
+        text (str): Cleaned title or artist name
+    Returns:
+        str: Case-folded, whitespace-collapsed key
+    """
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class ReleaseCache:
+    """
+    Persistent SQLite cache of earliest-release lookups.
+    Entries are keyed by normalized (cleaned title, primary artist) and
+    expire after `ttl_days`.
+    """
+    def __init__(self, path: Path = RELEASE_CACHE_PATH, ttl_days: float = RELEASE_CACHE_TTL_DAYS):
+        """
+        Open (and create if needed) the cache database.
+        Args:
+            path (Path): Path of the SQLite database file
+            ttl_days (float): Age in days after which entries are ignored and pruned
+        """
+        self.path = Path(path)
+        self.ttl_days = ttl_days
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS releases (
+                title TEXT NOT NULL,
+                artist TEXT NOT NULL,
+                earliest_year INTEGER,
+                validate_release INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (title, artist)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @property
+    def _ttl_seconds(self) -> float:
+        return self.ttl_days * 24 * 60 * 60
+
+    def get(self, title: str, artist: str) -> dict | None:
+        """
+        Look up a cached release.
+        Args:
+            title (str): Cleaned track title
+            artist (str): Primary artist
+        Returns:
+            dict | None: {earliest_year, validate_release} or None on a miss or expired entry
+        """
+        min_updated = time.time() - self._ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT earliest_year, validate_release FROM releases "
+                "WHERE title = ? AND artist = ? AND updated_at >= ?",
+                (normalize_key(title), normalize_key(artist), min_updated)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return {"earliest_year": row[0], "validate_release": bool(row[1])}
+
+    def put(self, title: str, artist: str, earliest_year: int | None, validate_release: bool) -> None:
+        """
+        Store the result of a release lookup.
+        Args:
+            title (str): Cleaned track title
+            artist (str): Primary artist
+            earliest_year (int | None): Earliest release year found, None if the search had no results
+            validate_release (bool): Whether the release year needs manual validation
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO releases VALUES (?, ?, ?, ?, ?)",
+                (normalize_key(title), normalize_key(artist), earliest_year, int(validate_release), time.time())
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+        Returns:
+            dict: Entry counts, database size and hits/misses of this process
+        """
+        min_updated = time.time() - self._ttl_seconds
+        with self._lock:
+            total, expired, to_validate = self._conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(updated_at < ?), 0), "
+                "COALESCE(SUM(validate_release), 0) FROM releases",
+                (min_updated,)
+            ).fetchone()
+
+        return {
+            "path": str(self.path),
+            "entries": total,
+            "expired": expired,
+            "validate_release": to_validate,
+            "size_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "ttl_days": self.ttl_days,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def prune(self, prune_all: bool = False) -> int:
+        """
+        Remove expired (or all) entries and compact the database.
+        Args:
+            prune_all (bool): Remove every entry regardless of age
+        Returns:
+            int: Number of removed entries
+        """
+        with self._lock:
+            if prune_all:
+                cursor = self._conn.execute("DELETE FROM releases")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM releases WHERE updated_at < ?",
+                    (time.time() - self._ttl_seconds,)
+                )
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: ReleaseCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_release_cache() -> ReleaseCache:
+    """
+    Return the process-wide release cache at RELEASE_CACHE_PATH.
+    Returns:
+        ReleaseCache: Shared cache instance
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ReleaseCache()
+    return _default_cache
@@ -1,10 +1,20 @@
 # src/core/spotify_client.py
 import os
 import re
+import threading
+import time
+from typing import Iterator
 
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from spotipy import Spotify
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
+
+from .rate_limiter import RateLimiter, RequestStats
+from .release_cache import get_release_cache
 
 
 # load environment variables from .env file
@@ -14,6 +24,20 @@ CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
 CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
 REDIRECT_URI = os.getenv("SPOTIFY_REDIRECT_URI")
 
+# size of the keep-alive connection pool (should match the lookup concurrency)
+MAX_CONNECTIONS = int(os.getenv("SPOTIFY_MAX_CONNECTIONS", "8"))
+
+# request rate shared by all concurrent API calls
+REQUESTS_PER_SECOND = float(os.getenv("SPOTIFY_REQUESTS_PER_SECOND", "10"))
+
+# refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 120
+
+# process-wide client shared by all API helpers
+_client: Spotify | None = None
+_client_lock = threading.Lock()
+_pool_size = 0
+_rate_limiter = RateLimiter(rate=REQUESTS_PER_SECOND, burst=max(1, int(REQUESTS_PER_SECOND)))
 
 
 def extract_playlist_id(input_str: str) -> str:
@@ -29,19 +53,137 @@ def extract_playlist_id(input_str: str) -> str:
         return match.group(1)
     return input_str
 
-def authenticate_spotify() -> Spotify:
+class _InMemoryTokenCache(CacheFileHandler):
+    """
+    Token cache that keeps the current token in memory and only reads the
+    on-disk cache file once, instead of on every API request.
+    """
+    def __init__(self, cache_path: str | None = None):
+        super().__init__(cache_path=cache_path)
+        self._token_info = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get_cached_token(self):
+        with self._lock:
+            if not self._loaded:
+                self._token_info = super().get_cached_token()
+                self._loaded = True
+            return self._token_info
+
+    def save_token_to_cache(self, token_info):
+        with self._lock:
+            self._token_info = token_info
+            self._loaded = True
+        super().save_token_to_cache(token_info)
+
+
+def _mount_connection_pool(session: requests.Session, pool_size: int) -> None:
+    """
+    Mount a keep-alive connection pool of the given size on a requests session.
+    Adapters it replaces are closed, so their pooled connections are released.
+    429 responses are not retried here but surfaced to the shared rate limiter.
+    Args:
+        session (requests.Session): Session used by the Spotify client
+        pool_size (int): Maximum number of pooled connections per host
+    """
+    retry = Retry(
+        total=3,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    replaced = {id(old): old for prefix in ("https://", "http://") if (old := session.adapters.get(prefix))}
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    for old in replaced.values():
+        old.close()
+
+
+def _start_token_refresher(auth_manager: SpotifyOAuth) -> None:
     """
-    Authenticate and return a Spotify client instance.
+    Start a daemon thread that refreshes the access token shortly before it
+    expires, so API calls never have to wait for a refresh.
+    Args:
+        auth_manager (SpotifyOAuth): Auth manager of the shared client
+    """
+    def refresh_loop():
+        while True:
+            token_info = auth_manager.cache_handler.get_cached_token()
+            if not token_info or "refresh_token" not in token_info:
+                # not authorized yet, the first API call will run the OAuth flow
+                time.sleep(30)
+                continue
+
+            delay = token_info["expires_at"] - time.time() - TOKEN_REFRESH_MARGIN
+            if delay > 0:
+                time.sleep(delay)
+                continue
+
+            try:
+                auth_manager.refresh_access_token(token_info["refresh_token"])
+            except Exception as e:
+                print(f"Warning: could not refresh Spotify access token: {e}")
+                time.sleep(30)
+
+    thread = threading.Thread(target=refresh_loop, name="spotify-token-refresh", daemon=True)
+    thread.start()
+
+
+def authenticate_spotify(max_connections: int | None = None) -> Spotify:
+    """
+    Return the process-wide authenticated Spotify client.
+    The client is created on first use; later calls reuse its token cache
+    and connection pool.
+    Args:
+        max_connections (int | None): Minimum connection pool size, e.g. the number
+            of concurrent requests (defaults to SPOTIFY_MAX_CONNECTIONS)
     Returns:
         Spotify: Authenticated Spotify client
     """
-    sp = Spotify(auth_manager=SpotifyOAuth(
-        client_id=CLIENT_ID,
-        client_secret=CLIENT_SECRET,
-        redirect_uri=REDIRECT_URI,
-        scope="playlist-read-private"
-    ))
-    return sp
+    global _client, _pool_size
+    pool_size = max(max_connections or 0, MAX_CONNECTIONS)
+
+    with _client_lock:
+        if _client is None:
+            auth_manager = SpotifyOAuth(
+                client_id=CLIENT_ID,
+                client_secret=CLIENT_SECRET,
+                redirect_uri=REDIRECT_URI,
+                scope="playlist-read-private",
+                cache_handler=_InMemoryTokenCache()
+            )
+            session = requests.Session()
+            _mount_connection_pool(session, pool_size)
+            _client = Spotify(auth_manager=auth_manager, requests_session=session)
+            _pool_size = pool_size
+            _start_token_refresher(auth_manager)
+        elif pool_size > _pool_size:
+            # grow the pool if more concurrency was requested later on
+            _mount_connection_pool(_client._session, pool_size)
+            _pool_size = pool_size
+
+    return _client
+
+def reset_request_stats() -> None:
+    """
+    Reset the per-run API request counters.
+    """
+    _rate_limiter.reset_stats()
+
+
+def get_request_stats() -> RequestStats:
+    """
+    Get the API request counters since the last reset.
+    Returns:
+        RequestStats: Number of requests, retries and time spent waiting on the rate limit
+    """
+    return RequestStats(**_rate_limiter.snapshot())
+
 
 def get_playlist_info(input_str: str) -> dict:
     """
@@ -49,24 +191,69 @@ def get_playlist_info(input_str: str) -> dict:
     Args:
         input_str (str): The URL or ID of the Spotify playlist
     Returns:
-        dict: Playlist information {name, owner, num_tracks, id}
+        dict: Playlist information {name, owner, num_tracks, id, snapshot_id}
     """
     # extract playlist ID
     playlist_id = extract_playlist_id(input_str)
 
-    # initialize Spotify client with OAuth
+    # shared Spotify client
     sp = authenticate_spotify()
 
     # fetch playlist information
-    playlist = sp.playlist(playlist_id)
+    playlist = _rate_limiter.call(
+        sp.playlist, playlist_id, fields="id,name,owner.display_name,tracks.total,snapshot_id"
+    )
     playlist_info = {
         "name": playlist["name"],
         "owner": playlist["owner"]["display_name"],
         "num_tracks": playlist["tracks"]["total"],
-        "id": playlist["id"]
+        "id": playlist["id"],
+        "snapshot_id": playlist["snapshot_id"]
     }
     return playlist_info
 
+def _track_info(track: dict) -> dict:
+    """
+    Extract the raw track information used by SpotiCards from a Spotify track object.
+    """
+    return {
+        "name": track["name"],
+        "artists": [artist["name"] for artist in track["artists"]],
+        "album": track["album"]["name"],
+        "release_date": track["album"]["release_date"],
+        "spotify_uri": track["uri"]
+    }
+
+
+def iter_playlist_tracks(input_str: str) -> Iterator[dict]:
+    """
+    Fetch tracks from a Spotify playlist page by page.
+    Tracks are yielded as soon as their page arrives, so later stages can
+    start before the whole playlist has been fetched.
+    Args:
+        input_str (str): The URL or ID of the Spotify playlist
+    Yields:
+        dict: Track information {name, artist(s), album, release_date, spotify_uri}
+    """
+    # extract playlist ID
+    playlist_id = extract_playlist_id(input_str)
+
+    # shared Spotify client
+    sp = authenticate_spotify()
+
+    offset = 0
+    limit = 100  # max Spotify allows per request
+
+    while True:
+        response = _rate_limiter.call(sp.playlist_items, playlist_id, offset=offset, limit=limit)
+        for item in response["items"]:
+            if item.get("track"):
+                yield _track_info(item["track"])
+        if response["next"] is None:
+            break
+        offset += limit
+
+
 def get_playlist_tracks(input_str: str) -> list[dict]:
     """
     Fetch tracks from a Spotify playlist.
@@ -75,39 +262,99 @@ def get_playlist_tracks(input_str: str) -> list[dict]:
     Returns:
         list[dict]: List of track information {name, artist(s), album, release_date, spotify_uri}
     """
-    # extract playlist ID
-    playlist_id = extract_playlist_id(input_str)
+    return list(iter_playlist_tracks(input_str))
 
-    # initialize Spotify client with OAuth
+def get_playlist_track_uris(input_str: str) -> list[str]:
+    """
+    Fetch only the track URIs of a Spotify playlist (small responses, for diffing).
+    Args:
+        input_str (str): The URL or ID of the Spotify playlist
+    Returns:
+        list[str]: Track URIs in playlist order
+    """
+    playlist_id = extract_playlist_id(input_str)
     sp = authenticate_spotify()
 
-    tracks = []
+    uris = []
     offset = 0
     limit = 100  # max Spotify allows per request
 
     while True:
-        response = sp.playlist_items(playlist_id, offset=offset, limit=limit)
+        response = _rate_limiter.call(
+            sp.playlist_items, playlist_id, offset=offset, limit=limit, fields="items(track(uri)),next"
+        )
         for item in response["items"]:
-            track = item["track"]
-            track_info = {
-                "name": track["name"],
-                "artists": [artist["name"] for artist in track["artists"]],
-                "album": track["album"]["name"],
-                "release_date": track["album"]["release_date"],
-                "spotify_uri": track["uri"]
-            }
-            tracks.append(track_info)
+            if item.get("track") and item["track"].get("uri"):
+                uris.append(item["track"]["uri"])
         if response["next"] is None:
             break
         offset += limit
-    
+
+    return uris
+
+
+def get_tracks_by_uri(uris: list[str]) -> list[dict]:
+    """
+    Fetch track information for the given track URIs.
+    Other items (local files, episodes) cannot be fetched by URI and are skipped.
+    Args:
+        uris (list[str]): Spotify track URIs
+    Returns:
+        list[dict]: List of track information {name, artist(s), album, release_date, spotify_uri}
+    """
+    track_uris = [uri for uri in uris if uri.startswith("spotify:track:")]
+    if len(track_uris) < len(uris):
+        print(f"Skipping {len(uris) - len(track_uris)} items that are not Spotify tracks (local files, episodes).")
+    uris = track_uris
+    sp = authenticate_spotify()
+
+    tracks = []
+    limit = 50  # max Spotify allows per request
+    for start in range(0, len(uris), limit):
+        response = _rate_limiter.call(sp.tracks, uris[start:start + limit])
+        tracks.extend(_track_info(track) for track in response["tracks"] if track)
+
     return tracks
 
-def get_earliest_release_spotify(track: dict) -> dict:
+
+def _search_earliest_year(sp: Spotify, name: str, artist: str) -> int | None:
+    """
+    Search Spotify for a track and return the earliest release year among the results.
+    Args:
+        sp (Spotify): Spotify client
+        name (str): Cleaned track title
+        artist (str): Primary artist
+    Returns:
+        int | None: Earliest release year, or None if no result has a release date
+    """
+    query = f'track:{name} artist:{artist}'
+    results = _rate_limiter.call(sp.search, q=query, type='track', limit=20)
+
+    # extract release years
+    years = set()
+    for item in results.get("tracks", {}).get("items", []):
+        date = item["album"].get("release_date")
+        if not date:
+            continue
+
+        match = re.match(r"(\d{4})", date)
+        if match:
+            years.add(int(match.group(1)))
+
+    return min(years) if years else None
+
+
+def get_earliest_release_spotify(
+        track: dict, sp: Spotify | None = None, use_cache: bool = True
+        ) -> dict:
     """
     Search for earliest release date on Spotify.
+    Results are stored in the persistent release cache, so the network is only
+    used for tracks that have not been looked up before (or whose entry expired).
     Args:
         track (dict): Track metadata dictionary
+        sp (Spotify | None): Spotify client to use (defaults to the shared client)
+        use_cache (bool): Whether to read and update the release cache
     Returns:
         dict: Track metadata with potentially updated release date
               and flag 'validate_release' set to True if conflicting dates found
@@ -121,37 +368,30 @@ def get_earliest_release_spotify(track: dict) -> dict:
     # set flag to False initially
     track['validate_release'] = False
 
-    # search Spotify for track
-    sp = authenticate_spotify()
+    cache = get_release_cache() if use_cache else None
+    cached = cache.get(name, artist) if cache else None
 
-    query = f'track:{name} artist:{artist}'
-    try:
-        results = sp.search(q=query, type='track', limit=20)
-    except Exception as e:
-        print(f"Spotify search failed for '{name}' by '{artist}': {e}")
-        track['validate_release'] = True
-        return track
-    
-    # extract release years
-    years = set()
-    for item in results.get("tracks", {}).get("items", []):
-        date = item["album"].get("release_date")
-        if not date:
-            continue
+    if cached is not None:
+        earliest_year = cached["earliest_year"]
+    else:
+        # search Spotify for track
+        sp = sp or authenticate_spotify()
+        try:
+            earliest_year = _search_earliest_year(sp, name, artist)
+        except Exception as e:
+            print(f"Spotify search failed for '{name}' by '{artist}': {e}")
+            track['validate_release'] = True
+            return track
 
-        match = re.match(r"(\d{4})", date)
-        if match:
-            years.add(int(match.group(1)))
-
-    if not years:
+    if earliest_year is None:
         track['validate_release'] = True
-        return track
-    
-    # determine earliest year
-    earliest_year = min(years)
-    if release_year and earliest_year != release_year:
+    elif release_year and earliest_year != release_year:
+        # earliest year differs from this release
         track['validate_release'] = True
         track['original_release_year'] = release_year
         track['release_year'] = earliest_year
+
+    if cache and cached is None:
+        cache.put(name, artist, earliest_year, track['validate_release'])
     
-    return track
\ No newline at end of file
+    return track
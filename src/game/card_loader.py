@@ -1,44 +1,49 @@
 # src/game/card_loader.py
 from pathlib import Path
 
+from ..cards.atlas import CardAtlas
+from ..cards.card_index import CardIndex
 
 
-def get_card_image_path(card: dict, side: str, cards_dir:Path) -> Path | None:
+
+def get_card_image_path(card: dict, side: str, cards_dir: Path, card_index: CardIndex | None = None) -> Path | None:
     """
     Resolve the file path for a card image based on card metadata and side.
     Args:
         card (dict): Card metadata dictionary
         side (str): "front" or "back"
         cards_dir (Path): Base directory where card images are stored
+        card_index (CardIndex | None): Index of cards_dir (None = load it)
     Returns:
         Path | None: Resolved file path or None if not found
     """
-    year = card["release_year"]
-    name = card["name_cleaned"]
-    filename = f"{year}_{name}".replace(" ", "_")
-    path = cards_dir / f"{filename}_{side}.png"
+    card_index = card_index or CardIndex.load(cards_dir, [card])
+    path = card_index.path(card["spotify_uri"], side)
     
-    if not path.exists():
-        print(f"Card image not found at {path}")
+    if path is None:
+        print(f"Card image not found: {card.get('name_cleaned')} ({side})")
         return None
     
     return path
 
-def card_image_exists(card, side, cards_dir) -> bool:
-    path = get_card_image_path(card, side, cards_dir)
-    return path is not None and path.exists()
+def card_image_exists(card, side, cards_dir, card_index: CardIndex | None = None) -> bool:
+    card_index = card_index or CardIndex.load(cards_dir, [card])
+    return card_index.path(card["spotify_uri"], side) is not None
     
-def validate_playlist_cards(tracks: list[dict], cards_dir: Path) -> list[dict]:
+def validate_playlist_cards(
+        tracks: list[dict], cards_dir: Path, atlas: CardAtlas | None = None, card_index: CardIndex | None = None
+        ) -> list[dict]:
     """
     Check which cards are missing images.
+    Cards are looked up in the atlas index if given, otherwise in the card index of the folder.
     
     Returns:
         List of tracks with missing card images
     """
-    missing = []
-    for track in tracks:
-        if not card_image_exists(track, "front", cards_dir) or \
-           not card_image_exists(track, "back", cards_dir):
-            missing.append(track)
+    if atlas is not None:
+        return [
+            track for track in tracks
+            if atlas.rect(track["spotify_uri"], "front") is None or atlas.rect(track["spotify_uri"], "back") is None
+        ]
     # TODO: add validation method (remove missing tracks, quit game?)
-    return missing
\ No newline at end of file
+    return (card_index or CardIndex.load(cards_dir, tracks)).missing(tracks)
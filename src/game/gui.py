@@ -1,13 +1,153 @@
 # src/game/gui.py
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
 import sys
+import threading
 
+from ..cards.atlas import CardAtlas
+from ..cards.card_index import CardIndex
 from .card_loader import get_card_image_path
 from .state import GameState
 
 
+# display size of a card side (pixels); images are decoded and scaled down to it off the UI thread
+CARD_DISPLAY_SIZE = 400
+# number of upcoming draws whose card sides are loaded ahead
+PREFETCH_CARDS = 8
+# QPixmapCache budget: a 400 px card side takes ~640 KB
+PIXMAP_CACHE_KB = 64 * 1024
+LOADER_THREADS = 2
+# decoded atlas pages kept in memory (a 4096 px page takes 64 MB)
+ATLAS_PAGE_CACHE = 4
+
+
+class CardImageLoader(QObject):
+    """
+    Loads card pixmaps of a playlist in the background.
+
+    Images are decoded and scaled on a QThreadPool, sliced from the texture atlas if one
+    was built (each page decoded once) or read from the single card image files.
+    The UI thread only converts finished images to pixmaps and keeps them in QPixmapCache.
+    """
+    loaded = Signal(str)  # cache key of a finished card side
+    _decoded = Signal(str, QImage)
+
+    def __init__(self, cards_dir: Path, display_size: int = CARD_DISPLAY_SIZE, threads: int = LOADER_THREADS):
+        """
+        Args:
+            cards_dir (Path): Directory of the card images
+            display_size (int): Maximum size of the loaded pixmaps (pixels)
+            threads (int): Number of decoder threads
+        """
+        super().__init__()
+        self.cards_dir = cards_dir
+        self.display_size = display_size
+        self.atlas = CardAtlas.load(cards_dir)
+        self._card_index: CardIndex | None = None  # loaded on the first card missing from the atlas
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(threads)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_KB))
+
+        self._pending: set[str] = set()
+        self._missing: set[str] = set()
+        self._pages: OrderedDict[int, QImage] = OrderedDict()  # LRU of decoded atlas pages
+        self._lock = threading.Lock()
+        self._decoded.connect(self._on_decoded)
+
+    def key(self, card: dict, side: str) -> str:
+        """Cache key of a card side."""
+        return f"spoticards:{card['spotify_uri']}:{side}:{self.display_size}"
+
+    def pixmap(self, card: dict, side: str) -> QPixmap | None:
+        """
+        Cached pixmap of a card side, without blocking.
+        Returns:
+            QPixmap | None: The pixmap, or None if it is not loaded (yet)
+        """
+        pixmap = QPixmapCache.find(self.key(card, side))
+        return pixmap if pixmap is not None and not pixmap.isNull() else None
+
+    def is_missing(self, card: dict, side: str) -> bool:
+        """True if the card side has no image."""
+        return self.key(card, side) in self._missing
+
+    def request(self, card: dict, side: str, priority: int = 0) -> None:
+        """
+        Load a card side in the background unless it is cached or already queued.
+        `loaded` is emitted with its key when the pixmap is in the cache.
+        """
+        key = self.key(card, side)
+        if key in self._pending or key in self._missing or self.pixmap(card, side) is not None:
+            return
+        self._pending.add(key)
+        self.pool.start(partial(self._load, key, card, side), priority)
+
+    def prefetch(self, cards: list[dict]) -> None:
+        """Queue both sides of upcoming cards, nearest first."""
+        for card in cards:
+            for side in ("front", "back"):
+                self.request(card, side)
+
+    def shutdown(self) -> None:
+        """Drop queued loads and wait for running ones."""
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def _atlas_page(self, page: int) -> QImage:
+        with self._lock:
+            image = self._pages.get(page)
+            if image is None:
+                image = self._pages[page] = QImage(str(self.atlas.page_path(page)))
+                while len(self._pages) > ATLAS_PAGE_CACHE:
+                    self._pages.popitem(last=False)
+            self._pages.move_to_end(page)
+            return image
+
+    def _load(self, key: str, card: dict, side: str) -> None:
+        """Decode and scale a card side (runs on a pool thread), always answered with `_decoded`."""
+        try:
+            image = self._read_image(card, side)
+        except Exception as e:
+            print(f"Warning: could not load card image {key}: {e}")
+            image = QImage()
+        self._decoded.emit(key, image)
+
+    def _read_image(self, card: dict, side: str) -> QImage:
+        rect = self.atlas.rect(card["spotify_uri"], side) if self.atlas else None
+        if rect is not None:
+            page, x, y, size = rect
+            image = self._atlas_page(page).copy(x, y, size, size)
+        else:
+            with self._lock:
+                if self._card_index is None or not self._card_index.has_card(card["spotify_uri"]):
+                    self._card_index = CardIndex.load(self.cards_dir, [card])
+            path = get_card_image_path(card, side, self.cards_dir, self._card_index)
+            image = QImage()
+            if path is not None:
+                reader = QImageReader(str(path))
+                size = reader.size()
+                if size.isValid() and max(size.width(), size.height()) > self.display_size:
+                    # decoders that support it (JPEG) decode directly at the reduced size
+                    reader.setScaledSize(size.scaled(QSize(self.display_size, self.display_size), Qt.KeepAspectRatio))
+                image = reader.read()
+
+        if not image.isNull() and max(image.width(), image.height()) > self.display_size:
+            image = image.scaled(self.display_size, self.display_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def _on_decoded(self, key: str, image: QImage) -> None:
+        # pixmaps may only be created on the UI thread
+        self._pending.discard(key)
+        if image.isNull():
+            self._missing.add(key)
+        else:
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+        self.loaded.emit(key)
+
 
 class GameWindow(QMainWindow):
     """Main game window."""
@@ -16,6 +156,9 @@ class GameWindow(QMainWindow):
         super().__init__()
         self.game_state = game_state
         self.cards_dir = cards_dir
+        self.card_loader = CardImageLoader(cards_dir)
+        self.card_loader.loaded.connect(self._on_card_loaded)
+        self.displayed_card: tuple[dict, str] | None = None
         
         self.setup_ui()
 
@@ -33,12 +176,52 @@ class GameWindow(QMainWindow):
         label.setAlignment(Qt.AlignCenter)
         layout.addWidget(label)
 
-    def display_card(self, card_image_path: Path):
+        self.card_label = QLabel()
+        self.card_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.card_label)
+
+    def draw_card(self) -> dict | None:
+        """
+        Draw the next card, show its front and load the cards after it in the background.
+        """
+        card = self.game_state.draw_next_card()
+        if card is not None:
+            self.display_card(card, "front")
+            self.card_loader.request(card, "back", priority=1)  # ready for the flip
+        self.card_loader.prefetch(self.game_state.upcoming_cards(PREFETCH_CARDS))
+        return card
+
+    def flip_card(self):
+        """
+        Show the other side of the displayed card.
+        """
+        if self.displayed_card is not None:
+            card, side = self.displayed_card
+            self.display_card(card, "back" if side == "front" else "front")
+
+    def display_card(self, card: dict, side: str = "front"):
         """
         Display the card image in the GUI.
+        Never blocks: on a cache miss a placeholder is shown until the image is loaded.
         """
-        pass
-       
+        self.displayed_card = (card, side)
+        pixmap = self.card_loader.pixmap(card, side)
+        if pixmap is not None:
+            self.card_label.setPixmap(pixmap)
+        elif self.card_loader.is_missing(card, side):
+            self.card_label.setText("Card image not found")
+        else:
+            self.card_label.setText("Loading card...")
+            self.card_loader.request(card, side, priority=2)
+
+    def _on_card_loaded(self, key: str):
+        if self.displayed_card is not None and key == self.card_loader.key(*self.displayed_card):
+            self.display_card(*self.displayed_card)
+
+    def closeEvent(self, event):
+        self.card_loader.shutdown()
+        super().closeEvent(event)
+
 
 def main(tracks: list[dict], cards_dir: Path):
     """
@@ -56,6 +239,7 @@ def main(tracks: list[dict], cards_dir: Path):
     # Create game window
     window = GameWindow(game_state, cards_dir)
     window.show()
+    window.draw_card()
 
     sys.exit(app.exec())
 
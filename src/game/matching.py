@@ -0,0 +1,296 @@
+# src/game/matching.py
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable
+
+
+# similarity a title or artist needs to count as correct
+MATCH_THRESHOLD = 0.8
+
+# "(feat. X)", "[ft. X]" or "feat. X" up to a " - ..." suffix
+_FEATURING_PATTERN = re.compile(
+    r"\s*[\(\[](?:feat\.?|ft\.|featuring)\s[^\)\]]*[\)\]]|\s+(?:feat\.?|ft\.|featuring)\s.*?(?=\s-\s|$)", re.IGNORECASE
+)
+_VERSION_PATTERN = re.compile(r"\s*(\([^)]*\)|\[[^\]]*\]|\s-\s.*)")
+_ARTIST_SEPARATOR_PATTERN = re.compile(r",|&|/|\b(?:and|x|with|feat\.?|ft\.|featuring)\s", re.IGNORECASE)
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for comparison: no accents, lowercase, punctuation to spaces.
+    Args:
+        text (str): Original text
+    Returns:
+        str: Normalized text, words separated by single spaces
+    """
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.casefold().replace("&", " and ").replace("'", "").replace("’", "")
+    return " ".join(_NON_WORD_PATTERN.sub(" ", text).split())
+
+
+def normalize_title(title: str, remove_version: bool = False) -> str:
+    """
+    Normalize a track title, without "feat." credits.
+    Args:
+        title (str): Track title
+        remove_version (bool): Also drop bracketed parts and " - ..." suffixes ("Live", "Radio Edit")
+    Returns:
+        str: Normalized title
+    """
+    title = _FEATURING_PATTERN.sub("", title)
+    if remove_version:
+        title = _VERSION_PATTERN.sub("", title)
+    return normalize_text(title)
+
+
+def normalize_artist(artist: str) -> str:
+    """Normalize an artist name, without a leading "The"."""
+    name = normalize_text(artist)
+    return name[4:] if name.startswith("the ") else name
+
+
+def split_artists(artists: str) -> tuple[str, ...]:
+    """
+    Split a guessed artist string ("Queen & David Bowie", "A feat. B") into normalized names.
+    """
+    names = (normalize_artist(part) for part in _ARTIST_SEPARATOR_PATTERN.split(artists) if part)
+    return tuple(dict.fromkeys(name for name in names if name))
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Character trigrams of normalized text (padded at the start, so prefixes share them)."""
+    padded = f"  {text}"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int | None:
+    """
+    Levenshtein distance, computed only within a band of max_distance around the diagonal.
+    Args:
+        a (str): First string
+        b (str): Second string
+        max_distance (int): Largest distance of interest
+    Returns:
+        int | None: The distance, or None if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    limit = max_distance + 1
+    previous = [j if j <= max_distance else limit for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [limit] * (len(b) + 1)
+        if i <= max_distance:
+            current[0] = i
+        low, high = max(1, i - max_distance), min(len(b), i + max_distance)
+        char = a[i - 1]
+        for j in range(low, high + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != b[j - 1]))
+        if min(current[low - 1:high + 1]) > max_distance:
+            return None
+        previous = current
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Similarity of two normalized strings from 0 to 1, based on their edit distance.
+    Strings more than a quarter of their length apart score 0.
+    """
+    if a == b:
+        return 1.0
+    length = max(len(a), len(b))
+    if not a or not b:
+        return 0.0
+    distance = bounded_edit_distance(a, b, max(1, length // 4))
+    return 0.0 if distance is None else 1 - distance / length
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Similarity of a guess to a card, per field (0-1)."""
+    title: float
+    artist: float
+
+    @property
+    def score(self) -> float:
+        """Partial credit for the whole guess (0-1)."""
+        return (self.title + self.artist) / 2
+
+    @property
+    def is_title_correct(self) -> bool:
+        return self.title >= MATCH_THRESHOLD
+
+    @property
+    def is_artist_correct(self) -> bool:
+        return self.artist >= MATCH_THRESHOLD
+
+    @property
+    def is_correct(self) -> bool:
+        return self.is_title_correct and self.is_artist_correct
+
+
+@dataclass(frozen=True)
+class _TrackKey:
+    """Normalized fields of one track."""
+    title: str
+    title_base: str
+    artists: tuple[str, ...]
+    artists_full: str
+
+
+class _CompletionIndex:
+    """Prefix and trigram index over distinct normalized strings, for autocomplete."""
+
+    def __init__(self, values: Iterable[str], normalize):
+        display: dict[str, str] = {}
+        for value in values:
+            key = normalize(value)
+            if key:
+                display.setdefault(key, value)
+        self.keys = sorted(display)
+        self.display = [display[key] for key in self.keys]
+        self.grams = [trigrams(key) for key in self.keys]
+        self.postings: dict[str, list[int]] = {}
+        for i, grams in enumerate(self.grams):
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+        self.normalize = normalize
+
+    def suggest(self, text: str, limit: int = 5) -> list[str]:
+        query = self.normalize(text)
+        if not query or limit <= 0:
+            return []
+
+        # entries starting with the query, alphabetically
+        results = []
+        i = bisect_left(self.keys, query)
+        while i < len(self.keys) and self.keys[i].startswith(query) and len(results) < limit:
+            results.append(i)
+            i += 1
+
+        # then entries sharing at least half of the query's trigrams (typos, inner words), most similar first
+        if len(results) < limit and len(query) >= 3:
+            query_grams = trigrams(query)
+            counts = Counter()
+            for gram in query_grams:
+                counts.update(self.postings.get(gram, ()))
+            for i in results:
+                counts.pop(i, None)
+            min_common = len(query_grams) / 2
+            scored = [
+                (common / (len(query_grams) + len(self.grams[i]) - common), i)
+                for i, common in counts.items() if common >= min_common
+            ]
+            results.extend(i for _, i in heapq.nlargest(limit - len(results), scored))
+
+        return [self.display[i] for i in results]
+
+
+class GuessMatcher:
+    """
+    Fuzzy matching of title/artist guesses against the tracks of a playlist.
+    Titles and artists are normalized once when the matcher is built.
+    """
+
+    def __init__(self, tracks: list[dict]):
+        """
+        Args:
+            tracks (list[dict]): Track metadata dictionaries
+        """
+        self._keys: dict[str, _TrackKey] = {}
+        for track in tracks:
+            self._keys[track["spotify_uri"]] = self._track_key(track)
+        self._titles = _CompletionIndex((track["name_cleaned"] for track in tracks), normalize_title)
+        self._artists = _CompletionIndex(
+            (name for track in tracks for name in track["artists"].split(", ")), normalize_artist
+        )
+
+    @staticmethod
+    def _track_key(track: dict) -> _TrackKey:
+        # artists are stored joined with ", "
+        artists = tuple(dict.fromkeys(
+            name for name in (normalize_artist(part) for part in track["artists"].split(", ")) if name
+        ))
+        return _TrackKey(
+            title=normalize_title(track["name_cleaned"]),
+            title_base=normalize_title(track["name_cleaned"], remove_version=True),
+            artists=artists,
+            artists_full=normalize_artist(track["artists"]),
+        )
+
+    def _key(self, card: dict) -> _TrackKey:
+        key = self._keys.get(card["spotify_uri"])
+        if key is None:
+            key = self._keys[card["spotify_uri"]] = self._track_key(card)
+        return key
+
+    def score(self, card: dict, title: str, artist: str) -> MatchResult:
+        """
+        Score a guess against a card.
+        Args:
+            card (dict): Track metadata dictionary
+            title (str): Guessed title
+            artist (str): Guessed artist(s)
+        Returns:
+            MatchResult: Title and artist similarity
+        """
+        key = self._key(card)
+
+        guess_title = normalize_title(title)
+        title_score = max(
+            similarity(guess_title, key.title),
+            similarity(guess_title, key.title_base),
+            similarity(normalize_title(title, remove_version=True), key.title_base),
+        )
+
+        # every card artist scores its best matching guessed name; unmatched guessed names count against it
+        guessed = split_artists(artist)
+        matched = set()
+        total = 0.0
+        for name in key.artists:
+            best, best_part = 0.0, None
+            for part in guessed:
+                value = similarity(part, name)
+                if value > best:
+                    best, best_part = value, part
+            if best >= MATCH_THRESHOLD:
+                total += best
+                matched.add(best_part)
+        denominator = len(key.artists) + len(set(guessed) - matched)
+        artist_score = total / denominator if denominator else 0.0
+        # names containing separators ("Earth, Wind & Fire") only match as a whole
+        artist_score = max(artist_score, similarity(normalize_artist(artist), key.artists_full))
+
+        return MatchResult(title=title_score, artist=artist_score)
+
+    def suggest_titles(self, text: str, limit: int = 5) -> list[str]:
+        """
+        Autocomplete a title guess.
+        Args:
+            text (str): Typed text
+            limit (int): Maximum number of suggestions
+        Returns:
+            list[str]: Track titles, prefix matches first
+        """
+        return self._titles.suggest(text, limit)
+
+    def suggest_artists(self, text: str, limit: int = 5) -> list[str]:
+        """
+        Autocomplete an artist guess.
+        Args:
+            text (str): Typed text
+            limit (int): Maximum number of suggestions
+        Returns:
+            list[str]: Artist names, prefix matches first
+        """
+        return self._artists.suggest(text, limit)
@@ -1,7 +1,10 @@
 # src/game/state.py
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 import random
 
+from .matching import GuessMatcher, MatchResult
+
 @dataclass
 class CardGuess:
     title: str = ""
@@ -21,17 +24,21 @@ class GameState:
     def __init__(self, tracks: list[dict], target_cards: int = 10):
         """
         Initialize the game state.
+        Tracks without a release year cannot be placed on the timeline and are left out.
         Args:
             tracks (list[dict]): List of track metadata dictionaries
             target_cards (int): Number of correctly placed cards needed to win
         """
         # Game configuration
         self.target_cards = target_cards
+        tracks = [track for track in tracks if track.get("release_year") is not None]
         
         # Card pools
         self.remaining_cards = tracks.copy()  # Cards not yet drawn
         random.shuffle(self.remaining_cards)
+        self.matcher = GuessMatcher(tracks)  # titles and artists normalized once
         self.timeline = []  # Cards placed in order (chronologically)
+        self.timeline_years: list[int] = []  # Release years of the timeline cards (sorted)
         
         # Current card state
         self.current_card: dict | None = None
@@ -55,10 +62,22 @@ class GameState:
         self.current_card = self.remaining_cards.pop()
         self.current_guess = CardGuess()  # Reset guess
         return self.current_card
+
+    def upcoming_cards(self, count: int) -> list[dict]:
+        """
+        Cards the next draws will return, in draw order (the pool is shuffled up front).
+        Args:
+            count (int): Maximum number of cards
+        Returns:
+            list[dict]: Next track metadata dictionaries
+        """
+        return self.remaining_cards[:-count - 1:-1]
     
     def place_current_card(self, position: int) -> bool:
         """
-        Place the current card in the timeline at the specified position.  
+        Place the current card in the timeline at the specified position.
+        A wrongly placed card is inserted at its chronological position instead,
+        so the timeline stays sorted.
         Args:
             position (int): Index in the timeline to place the current card
         Returns:
@@ -67,63 +86,66 @@ class GameState:
         if self.current_card is None:
             raise ValueError("No current card to place.")
         
-        # Insert the current card into the timeline at the specified position
-        self.timeline.insert(position, self.current_card)
-        
         # Check if placed correctly (chronological order)
-        is_correct = self._is_placement_correct(position)
+        is_correct = self._is_placement_correct(self.current_card, position)
         if is_correct:
             self.cards_placed_correctly += 1
             if self.cards_placed_correctly >= self.target_cards:
                 self.is_won = True
+        else:
+            position = bisect_right(self.timeline_years, self.current_card["release_year"])
+        
+        # Insert the current card into the timeline
+        self.timeline.insert(position, self.current_card)
+        self.timeline_years.insert(position, self.current_card["release_year"])
         
         # Clear current card
         self.current_card = None
         
         return is_correct
+
+    def valid_positions(self, card: dict) -> range:
+        """
+        Timeline positions where a card would be placed correctly.
+        Cards of the same year can go before, between or after each other.
+        Args:
+            card (dict): Track metadata dictionary
+        Returns:
+            range: Valid insertion indices (never empty)
+        """
+        year = card["release_year"]
+        return range(bisect_left(self.timeline_years, year), bisect_right(self.timeline_years, year) + 1)
     
-    def _is_placement_correct(self, position: int) -> bool:
+    def _is_placement_correct(self, card: dict, position: int) -> bool:
         """
-        Check if the card placed at the given position is in correct chronological order.
+        Check if inserting a card at the given position keeps the timeline in chronological order.
         Args:
-            position (int): Index in the timeline where the card was placed
+            card (dict): Track metadata dictionary
+            position (int): Index in the timeline where the card would be inserted
         Returns:
             bool: True if the placement is correct, False otherwise
         """
-        current_year = self.timeline[position]["release_year"]
-
-        if position > 0:
-            left_year = self.timeline[position-1]
-            if current_year < left_year:
-                return False
-            
-        if position < len(self.timeline) - 1:
-            right_year = self.timeline[position+1]["release_year"]
-            if current_year > right_year:
-                return False
-            
-        return True
+        return position in self.valid_positions(card)
     
+    def score_guess(self) -> MatchResult:
+        """
+        Fuzzy-match the current guess against the current card's metadata.
+        Accents, punctuation, "feat." credits and the order of artists are ignored,
+        small typos are tolerated.
+        Returns:
+            MatchResult: Title and artist similarity (partial credit)
+        """
+        if self.current_card is None:
+            raise ValueError("No current card to check guess against.")
+        return self.matcher.score(self.current_card, self.current_guess.title, self.current_guess.artist)
+
     def check_guess(self) -> bool:
         """
         Check if the current guess matches the current card's metadata.
         Returns:
             bool: True if the guess is correct, False otherwise
         """
-        # TODO: Implement fuzzy matching for partial correctness
-        if self.current_card is None:
-            raise ValueError("No current card to check guess against.")
-        
-        is_title_correct = (
-            self.current_guess.title.lower().strip() == 
-            self.current_card["name_cleaned"].lower().strip()
-        )
-        is_artist_correct = (
-            self.current_guess.artist.lower().strip() == 
-            self.current_card["artists"].lower().strip()
-        )
-        
-        return is_title_correct and is_artist_correct
+        return self.score_guess().is_correct
     
     def add_bonus_points(self, points: int) -> None:
         """
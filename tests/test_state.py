@@ -0,0 +1,53 @@
+# tests/test_state.py
+from src.game.state import GameState
+
+
+def make_track(year: int | None, uri: str) -> dict:
+    return {
+        "spotify_uri": f"spotify:track:{uri}", "release_year": year,
+        "name_cleaned": f"Song {uri}", "artists": "Artist",
+    }
+
+
+def make_state(*years: int) -> GameState:
+    """Game state whose timeline holds cards of the given (sorted) years."""
+    state = GameState([], target_cards=100)
+    for i, year in enumerate(years):
+        state.current_card = make_track(year, f"t{i}")
+        state.place_current_card(len(state.timeline))
+    return state
+
+
+def test_valid_positions_between_neighbours():
+    state = make_state(1970, 1980, 1990)
+    assert list(state.valid_positions(make_track(1985, "x"))) == [2]
+    assert list(state.valid_positions(make_track(1960, "x"))) == [0]
+    assert list(state.valid_positions(make_track(2000, "x"))) == [3]
+
+
+def test_valid_positions_same_year_ties():
+    state = make_state(1970, 1980, 1980, 1990)
+    assert list(state.valid_positions(make_track(1980, "x"))) == [1, 2, 3]
+
+
+def test_placement_checks_right_neighbour():
+    # the card fits after 1970 but not before 1975
+    state = make_state(1970, 1975)
+    state.current_card = make_track(1980, "x")
+    assert not state.place_current_card(1)
+    state.current_card = make_track(1972, "y")
+    assert state.place_current_card(1)
+
+
+def test_wrong_placement_is_inserted_in_order():
+    state = make_state(1970, 1980, 1990)
+    state.current_card = make_track(1985, "x")
+    assert not state.place_current_card(0)
+    assert state.timeline_years == [1970, 1980, 1985, 1990]
+    assert [card["release_year"] for card in state.timeline] == state.timeline_years
+    assert state.cards_placed_correctly == 3
+
+
+def test_tracks_without_year_are_left_out():
+    state = GameState([make_track(1970, "a"), make_track(None, "b")])
+    assert [card["spotify_uri"] for card in state.remaining_cards] == ["spotify:track:a"]